@@ -0,0 +1,71 @@
+"""Measure tail latency of concurrent tool calls with and without the executor.
+
+Simulates blocking SDK calls with a fixed upstream latency and fires several
+requests at once, the way an MCP client with parallel tool calls would.
+
+Usage:
+    python benchmarks/bench_concurrency.py --requests 32 --latency 0.05
+"""
+
+import argparse
+import asyncio
+import statistics
+import time
+
+from futureagi_mcp_server.executor import ToolExecutor
+
+
+def percentile(values, pct):
+    ordered = sorted(values)
+    index = min(len(ordered) - 1, int(round(pct / 100 * (len(ordered) - 1))))
+    return ordered[index]
+
+
+async def run_inline(requests: int, latency: float):
+    started = time.perf_counter()
+
+    async def call():
+        time.sleep(latency)
+        return time.perf_counter() - started
+
+    return await asyncio.gather(*(call() for _ in range(requests)))
+
+
+async def run_offloaded(requests: int, latency: float, workers: int):
+    executor = ToolExecutor(max_workers=workers, default_limit=workers)
+    started = time.perf_counter()
+
+    async def call():
+        await executor.run("protect", time.sleep, latency)
+        return time.perf_counter() - started
+
+    latencies = await asyncio.gather(*(call() for _ in range(requests)))
+    executor.shutdown()
+    return latencies
+
+
+def report(name, latencies):
+    print(
+        f"{name:<10} p50={percentile(latencies, 50) * 1000:8.1f}ms "
+        f"p95={percentile(latencies, 95) * 1000:8.1f}ms "
+        f"p99={percentile(latencies, 99) * 1000:8.1f}ms "
+        f"mean={statistics.mean(latencies) * 1000:8.1f}ms"
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--requests", type=int, default=32)
+    parser.add_argument("--latency", type=float, default=0.05)
+    parser.add_argument("--workers", type=int, default=16)
+    args = parser.parse_args()
+
+    report("inline", asyncio.run(run_inline(args.requests, args.latency)))
+    report(
+        "offloaded",
+        asyncio.run(run_offloaded(args.requests, args.latency, args.workers)),
+    )
+
+
+if __name__ == "__main__":
+    main()
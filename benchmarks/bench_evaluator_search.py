@@ -0,0 +1,107 @@
+"""Measure evaluator searches against the inverted index.
+
+"scan" filters the full catalog in Python for every query, the way a client
+scanning all_evaluators would. "index" answers the same queries through
+EvaluatorIndex. "refresh" times re-indexing after a catalog refresh that
+changed a few evaluators.
+
+Usage:
+    python benchmarks/bench_evaluator_search.py --evaluators 1000
+"""
+
+import argparse
+import random
+import string
+import time
+
+from futureagi_mcp_server.catalog import EvaluatorIndex, evaluator_id, required_keys
+
+TAGS = ["TEXT", "IMAGE", "AUDIO", "SAFETY", "RAG", "CUSTOM", "FUTURE_EVALS"]
+KEYS = ["input", "output", "context", "expected", "image", "audio", "prompt"]
+QUERIES = [
+    {"tags": ["RAG"], "available": ["input", "output", "context"]},
+    {"tags": ["TEXT", "SAFETY"]},
+    {"required": ["image"]},
+    {"query": "tox"},
+    {"tags": ["TEXT"], "query": "context adherence"},
+]
+
+
+def words(count: int) -> str:
+    return " ".join(
+        "".join(random.choices(string.ascii_lowercase, k=random.randint(3, 9)))
+        for _ in range(count)
+    )
+
+
+def build_catalog(evaluators: int) -> list:
+    return [
+        {
+            "eval_id": str(index),
+            "name": words(2).title(),
+            "description": words(40),
+            "eval_tags": random.sample(TAGS, 2),
+            "config": {"required_keys": random.sample(KEYS, random.randint(1, 3))},
+        }
+        for index in range(evaluators)
+    ]
+
+
+def scan(catalog, tags=None, required=None, available=None, query=None) -> list:
+    terms = (query or "").lower().split()
+    matches = []
+    for evaluator in catalog:
+        keys = set(required_keys(evaluator))
+        text = f"{evaluator['name']} {evaluator['description']}".lower().split()
+        if tags and not set(tags) <= set(evaluator["eval_tags"]):
+            continue
+        if required and not set(required) <= keys:
+            continue
+        if available is not None and not keys <= set(available):
+            continue
+        if not all(any(word.startswith(term) for word in text) for term in terms):
+            continue
+        matches.append(evaluator_id(evaluator))
+    return matches
+
+
+def measure(search, repeat: int) -> float:
+    start = time.perf_counter()
+    for _ in range(repeat):
+        for query in QUERIES:
+            search(**query)
+    return (time.perf_counter() - start) / (repeat * len(QUERIES))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--evaluators", type=int, default=1000)
+    parser.add_argument("--repeat", type=int, default=200)
+    args = parser.parse_args()
+
+    random.seed(0)
+    catalog = build_catalog(args.evaluators)
+    index = EvaluatorIndex()
+    start = time.perf_counter()
+    index.update(catalog)
+    build = time.perf_counter() - start
+    for query in QUERIES:
+        assert index.search(**query) == scan(catalog, **query)
+
+    refreshed = [dict(evaluator) for evaluator in catalog]
+    for evaluator in random.sample(refreshed, 10):
+        evaluator["description"] = words(40)
+    start = time.perf_counter()
+    index.update(refreshed)
+    refresh = time.perf_counter() - start
+
+    print(f"build     {build * 1e3:10.2f} ms")
+    print(f"refresh   {refresh * 1e3:10.2f} ms (10 changed)")
+    print(
+        f"scan      {measure(lambda **q: scan(catalog, **q), args.repeat) * 1e6:10.1f} us/query"
+    )
+    print(f"index     {measure(index.search, args.repeat) * 1e6:10.1f} us/query")
+
+
+if __name__ == "__main__":
+    main()
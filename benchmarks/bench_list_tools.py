@@ -0,0 +1,58 @@
+"""Compare the per-call cost of tools/list before and after precomputing schemas.
+
+"rebuild" constructs every tool schema and serializes the response on each
+call, which is what the server used to do. "prebuilt" serves the result built
+once by ToolRegistry.
+
+Usage:
+    python benchmarks/bench_list_tools.py --calls 2000
+"""
+
+import argparse
+import asyncio
+import time
+
+import mcp.types as types
+
+from futureagi_mcp_server.registry import ToolRegistry, build_tools
+
+DUMP_KWARGS = {"by_alias": True, "mode": "json", "exclude_none": True}
+
+
+async def rebuild(_: types.ListToolsRequest) -> types.ServerResult:
+    return types.ServerResult(types.ListToolsResult(tools=build_tools()))
+
+
+async def measure(handler, calls: int) -> float:
+    request = types.ListToolsRequest(method="tools/list")
+    start = time.perf_counter()
+    for _ in range(calls):
+        result = await handler(request)
+        result.model_dump(**DUMP_KWARGS)
+    return (time.perf_counter() - start) / calls
+
+
+async def run(calls: int):
+    registry = ToolRegistry()
+    request = types.ListToolsRequest(method="tools/list")
+    expected = (await rebuild(request)).model_dump(**DUMP_KWARGS)
+    assert (await registry.handle_list_tools(request)).model_dump(
+        **DUMP_KWARGS
+    ) == expected
+
+    before = await measure(rebuild, calls)
+    after = await measure(registry.handle_list_tools, calls)
+    print(f"rebuild   {before * 1e6:10.1f} us/call")
+    print(f"prebuilt  {after * 1e6:10.1f} us/call")
+    print(f"speedup   {before / after:10.1f}x")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--calls", type=int, default=2000)
+    args = parser.parse_args()
+    asyncio.run(run(args.calls))
+
+
+if __name__ == "__main__":
+    main()
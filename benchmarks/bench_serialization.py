@@ -0,0 +1,106 @@
+"""Compare the size and cost of serializing tool results.
+
+"pretty" is the indented JSON the server used to send. "compact" drops the
+whitespace, with the standard library or orjson, and "projected" also keeps
+only the keys a client asked for through the "fields" argument.
+
+The catalog mimics all_evaluators and the batch an evaluate call over the
+given number of inputs.
+
+Usage:
+    python benchmarks/bench_serialization.py --evaluators 120 --inputs 500
+"""
+
+import argparse
+import random
+import string
+import time
+
+from futureagi_mcp_server.serialization import get_dumps, project_fields
+
+
+def words(count: int) -> str:
+    return " ".join(
+        "".join(random.choices(string.ascii_lowercase, k=random.randint(3, 9)))
+        for _ in range(count)
+    )
+
+
+def build_catalog(evaluators: int) -> list:
+    return [
+        {
+            "eval_id": str(index),
+            "name": words(2).title(),
+            "description": words(60),
+            "eval_tags": random.sample(["TEXT", "IMAGE", "AUDIO", "SAFETY", "RAG"], 2),
+            "config": {
+                "required_keys": ["input", "output"],
+                "optional_keys": ["context"],
+                "output": "Pass/Fail",
+                "config": {"model": {"type": "option", "default": "turing_flash"}},
+            },
+        }
+        for index in range(evaluators)
+    ]
+
+
+def build_batch(inputs: int) -> dict:
+    return {
+        "eval_results": [
+            {
+                "data": ["Passed"],
+                "failure": False,
+                "reason": words(40),
+                "runtime": random.randint(100, 3000),
+                "metadata": {"usage": {"tokens": random.randint(10, 900)}},
+                "metrics": [{"id": "Toxicity", "value": random.random()}],
+            }
+            for _ in range(inputs)
+        ]
+    }
+
+
+def measure(dumps, value, pretty: bool, repeat: int) -> tuple:
+    start = time.perf_counter()
+    for _ in range(repeat):
+        text = dumps(value, pretty)
+    return len(text.encode()), (time.perf_counter() - start) / repeat
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--evaluators", type=int, default=120)
+    parser.add_argument("--inputs", type=int, default=500)
+    parser.add_argument("--repeat", type=int, default=50)
+    args = parser.parse_args()
+
+    random.seed(0)
+    results = {
+        "all_evaluators": (
+            build_catalog(args.evaluators),
+            ["eval_id", "name", "eval_tags"],
+        ),
+        "evaluate": (build_batch(args.inputs), ["eval_results.data"]),
+    }
+    modes = [("pretty", "json", True), ("compact", "json", False)]
+    try:
+        get_dumps("orjson")
+        modes.append(("compact", "orjson", False))
+    except ImportError:
+        print("orjson is not installed, skipping it")
+
+    for tool, (result, fields) in results.items():
+        print(tool)
+        baseline = None
+        for label, backend, pretty in modes + [("projected", modes[-1][1], False)]:
+            value = project_fields(result, fields) if label == "projected" else result
+            size, elapsed = measure(get_dumps(backend), value, pretty, args.repeat)
+            baseline = baseline or size
+            print(
+                f"  {label:<10} {backend:<7} {size:>10,} bytes "
+                f"({size / baseline:6.1%})  {elapsed * 1e3:8.2f} ms"
+            )
+
+
+if __name__ == "__main__":
+    main()
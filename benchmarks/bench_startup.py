@@ -0,0 +1,79 @@
+"""Measure the time a fresh stdio server takes to answer initialize.
+
+MCP clients spawn one stdio process per session, so this is paid on every
+session start. "lazy" starts the server as shipped, tool modules and the
+SDK are only imported on the first tool call. "eager" imports every tool
+module up front, which is what the server used to do.
+
+Usage:
+    python benchmarks/bench_startup.py --runs 10
+"""
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import time
+
+INITIALIZE_REQUEST = {
+    "jsonrpc": "2.0",
+    "id": 1,
+    "method": "initialize",
+    "params": {
+        "protocolVersion": "2024-11-05",
+        "capabilities": {},
+        "clientInfo": {"name": "bench", "version": "0"},
+    },
+}
+
+EAGER_IMPORTS = (
+    "import futureagi_mcp_server.tools.datasets, futureagi_mcp_server.tools.evals, "
+    "futureagi_mcp_server.tools.protect, futureagi_mcp_server.tools.syntheticdatagen; "
+)
+
+
+def time_to_initialize(eager: bool) -> float:
+    env = {
+        **os.environ,
+        "FI_API_KEY": os.getenv("FI_API_KEY", "bench_api_key"),
+        "FI_SECRET_KEY": os.getenv("FI_SECRET_KEY", "bench_secret_key"),
+    }
+    code = (EAGER_IMPORTS if eager else "") + (
+        "from futureagi_mcp_server import main; main()"
+    )
+    start = time.perf_counter()
+    process = subprocess.Popen(
+        [sys.executable, "-c", code],
+        env=env,
+        stdin=subprocess.PIPE,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.DEVNULL,
+        text=True,
+    )
+    try:
+        process.stdin.write(json.dumps(INITIALIZE_REQUEST) + "\n")
+        process.stdin.flush()
+        process.stdout.readline()
+        return time.perf_counter() - start
+    finally:
+        process.kill()
+        process.wait()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--runs", type=int, default=10)
+    args = parser.parse_args()
+
+    for label, eager in (("eager", True), ("lazy", False)):
+        samples = [time_to_initialize(eager) for _ in range(args.runs)]
+        print(
+            f"{label:<6} median {statistics.median(samples) * 1000:8.1f} ms   "
+            f"min {min(samples) * 1000:8.1f} ms   max {max(samples) * 1000:8.1f} ms"
+        )
+
+
+if __name__ == "__main__":
+    main()
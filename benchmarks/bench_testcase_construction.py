@@ -0,0 +1,78 @@
+"""Measure test case construction throughput for evaluate() batches.
+
+"per-row" builds a new pydantic class for every input row, which is what
+evaluate used to do. "cached" reuses one class per field signature.
+Homogeneous batches share a single signature, heterogeneous batches rotate
+through several.
+
+Usage:
+    python benchmarks/bench_testcase_construction.py --rows 1000
+"""
+
+import argparse
+import time
+from typing import Optional
+
+from fi.testcases import MLLMTestCase
+from pydantic import ConfigDict
+
+from futureagi_mcp_server.tools.evals import _test_case_class, build_test_cases
+
+FIELD_SETS = [
+    ("input", "output"),
+    ("input", "output", "context"),
+    ("query", "response"),
+    ("response", "context"),
+    ("text", "criteria"),
+    ("input", "expected_text"),
+]
+
+
+def make_rows(count: int, heterogeneous: bool):
+    rows = []
+    for index in range(count):
+        fields = FIELD_SETS[index % len(FIELD_SETS)] if heterogeneous else FIELD_SETS[1]
+        rows.append({field: f"{field} value {index}" for field in fields})
+    return rows
+
+
+def build_per_row(inputs):
+    test_cases = []
+    for input_item in inputs:
+        input_fields = {k: Optional[type(v)] for k, v in input_item.items()}
+        DynamicTestCase = type(
+            "DynamicTestCase",
+            (MLLMTestCase,),
+            {
+                "__annotations__": input_fields,
+                "model_config": ConfigDict(extra="allow"),
+            },
+        )
+        test_cases.append(DynamicTestCase(**input_item))
+    return test_cases
+
+
+def rows_per_second(func, rows) -> float:
+    start = time.perf_counter()
+    func(rows)
+    return len(rows) / (time.perf_counter() - start)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--rows", type=int, default=1000)
+    args = parser.parse_args()
+
+    for label, heterogeneous in (("homogeneous", False), ("heterogeneous", True)):
+        rows = make_rows(args.rows, heterogeneous)
+        _test_case_class.cache_clear()
+        per_row = rows_per_second(build_per_row, rows)
+        cached = rows_per_second(build_test_cases, rows)
+        print(
+            f"{label:<14} per-row {per_row:10.0f} rows/s   "
+            f"cached {cached:10.0f} rows/s   speedup {cached / per_row:6.1f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -1,15 +1,19 @@
 import asyncio
+import os
 
 import click
-import mcp
-from mcp.server import NotificationOptions
-from mcp.server.models import InitializationOptions
 
-from .constants import SERVER_NAME, SERVER_VERSION
+from .constants import AUTH_TOKEN, SERVER_HOST, SERVER_PORT, WARMUP, WORKERS
+from .executor import configure_executor
 from .logger import get_logger, setup_logging
-from .server import get_server
+from .server import get_server, shutdown_server
+from .tracing import setup_tracing
+from .transport import check_bind, run_sse, run_sse_workers, run_stdio
+from .utils import setup_environment
+from .warmup import log_ready, start_warmup
 
 setup_logging()
+setup_tracing()
 logger = get_logger()
 
 
@@ -32,42 +36,132 @@ logger = get_logger()
     default="https://api.futureagi.com",
     help="FutureAGI API base URL",
 )
+@click.option(
+    "--transport",
+    envvar="FI_MCP_TRANSPORT",
+    type=click.Choice(["stdio", "sse"]),
+    default="stdio",
+    show_default=True,
+    help="Serve a single client over stdio or many clients over HTTP with SSE",
+)
+@click.option(
+    "--host",
+    envvar="FI_MCP_HOST",
+    default=SERVER_HOST,
+    show_default=True,
+    help="Interface the SSE transport listens on",
+)
+@click.option(
+    "--port",
+    envvar="FI_MCP_PORT",
+    type=int,
+    default=SERVER_PORT,
+    show_default=True,
+    help="Port the SSE transport listens on",
+)
+@click.option(
+    "--auth-token",
+    envvar="FI_MCP_AUTH_TOKEN",
+    default=AUTH_TOKEN,
+    help="Bearer token SSE clients must send, required to listen beyond loopback",
+)
+@click.option(
+    "--max-workers",
+    envvar="FI_MCP_MAX_WORKERS",
+    type=click.IntRange(min=1),
+    default=None,
+    help="Size of the worker pool running blocking SDK calls",
+)
+@click.option(
+    "--workers",
+    envvar="FI_MCP_WORKERS",
+    type=click.IntRange(min=1),
+    default=WORKERS,
+    show_default=True,
+    help="Number of server processes sharing the SSE listening socket",
+)
+@click.option(
+    "--warmup/--no-warmup",
+    envvar="FI_MCP_WARMUP",
+    default=WARMUP,
+    show_default=True,
+    help="Prefetch catalogs and open connections in the background at startup",
+)
 def main(
     api_key: str,
     secret_key: str,
     base_url: str,
+    transport: str,
+    host: str,
+    port: int,
+    auth_token: str,
+    max_workers: int,
+    workers: int,
+    warmup: bool,
 ):
-    """Start the FutureAGI MCP server using stdio."""
+    """Start the FutureAGI MCP server over stdio or SSE."""
+    if transport == "sse":
+        try:
+            check_bind(host, auth_token)
+        except ValueError as e:
+            raise click.UsageError(str(e))
+    if transport == "sse" and workers > 1:
+        # Worker processes read their credentials and settings from the environment
+        setup_environment(api_key, secret_key, base_url)
+        if max_workers:
+            os.environ["FI_MCP_MAX_WORKERS"] = str(max_workers)
+        os.environ["FI_MCP_WARMUP"] = "true" if warmup else "false"
+        run_sse_workers(host, port, workers, auth_token=auth_token)
+        return
+    if workers > 1:
+        logger.warning("--workers is only supported with the SSE transport")
+
+    if max_workers:
+        configure_executor(max_workers=max_workers)
+
+    if transport == "sse":
+        logger.debug("Starting server via SSE...")
+        server = get_server(
+            api_key=api_key,
+            secret_key=secret_key,
+            base_url=base_url,
+        )
+
+        def on_startup():
+            log_ready()
+            if warmup:
+                start_warmup()
+
+        # Every client session shares this server, its caches and pools
+        run_sse(
+            server,
+            host,
+            port,
+            on_shutdown=shutdown_server,
+            on_startup=on_startup,
+            auth_token=auth_token,
+        )
+        return
 
     async def _run():
         logger.debug("Starting server via stdio...")
+        server = get_server(
+            api_key=api_key,
+            secret_key=secret_key,
+            base_url=base_url,
+        )
 
-        # Use stdio_server context manager
-        async with mcp.server.stdio.stdio_server() as (read_stream, write_stream):
-            # Get the server instance from serve()
-            server = get_server(
-                api_key=api_key,
-                secret_key=secret_key,
-                base_url=base_url,
-            )
-
-            # Define initialization options
-            init_options = InitializationOptions(
-                server_name=SERVER_NAME,
-                server_version=SERVER_VERSION,
-                capabilities=server.get_capabilities(
-                    notification_options=NotificationOptions(),
-                    experimental_capabilities={},
-                ),
-            )
+        # Warm-up runs alongside the session, initialize is answered right away
+        if warmup:
+            start_warmup()
+        log_ready()
 
-            # Run the server
-            await server.run(
-                read_stream,
-                write_stream,
-                init_options,
-            )
+        # Run the server
+        try:
+            await run_stdio(server)
+        finally:
+            shutdown_server()
 
-    logger.info("Running server...", flush=True)
+    logger.info("Running server...")
     # Run the async function
     asyncio.run(_run())
@@ -0,0 +1,100 @@
+"""Chunked, concurrent execution of large batches."""
+
+import asyncio
+from dataclasses import dataclass
+from typing import Any, Awaitable, Callable, List, Optional
+
+from .logger import get_logger
+
+logger = get_logger()
+
+
+@dataclass
+class Chunk:
+    """A slice of a batch and the outcome of processing it.
+
+    Attributes:
+        index: Position of the chunk in the batch
+        start: Offset of the first item of the chunk in the batch
+        items: Items of the chunk
+        result: Value returned by the worker, if it succeeded
+        error: Last error raised by the worker, if every attempt failed
+        attempts: Number of times the worker was called for this chunk
+    """
+
+    index: int
+    start: int
+    items: List[Any]
+    result: Any = None
+    error: Optional[Exception] = None
+    attempts: int = 0
+
+    @property
+    def end(self) -> int:
+        return self.start + len(self.items)
+
+
+def split_chunks(items: List[Any], chunk_size: int) -> List[Chunk]:
+    """Split items into consecutive chunks of at most chunk_size items."""
+    chunk_size = max(1, chunk_size)
+    chunks = []
+    for index, start in enumerate(range(0, len(items), chunk_size)):
+        end = start + chunk_size
+        chunks.append(Chunk(index=index, start=start, items=items[start:end]))
+    return chunks
+
+
+async def run_chunked(
+    items: List[Any],
+    worker: Callable[[List[Any]], Awaitable[Any]],
+    chunk_size: int,
+    max_in_flight: int,
+    retries: int = 1,
+    retry_delay: float = 0.5,
+    on_chunk_done: Optional[Callable[[Chunk], Awaitable[None]]] = None,
+) -> List[Chunk]:
+    """Process items in chunks with a bounded number of chunks in flight.
+
+    A chunk whose worker raises is retried on its own, up to ``retries``
+    times with exponential backoff, without re-running chunks that succeeded.
+
+    Args:
+        items: Items to process
+        worker: Coroutine function called with the items of one chunk
+        chunk_size: Maximum number of items per chunk
+        max_in_flight: Maximum number of chunks processed concurrently
+        retries: Extra attempts for a failing chunk
+        retry_delay: Seconds to wait before the first retry
+        on_chunk_done: Coroutine function called as each chunk finishes
+
+    Returns:
+        List[Chunk]: Every chunk in batch order, holding its result or error
+    """
+    chunks = split_chunks(items, chunk_size)
+    semaphore = asyncio.Semaphore(max(1, max_in_flight))
+
+    async def run_chunk(chunk: Chunk):
+        async with semaphore:
+            for attempt in range(retries + 1):
+                chunk.attempts += 1
+                try:
+                    chunk.result = await worker(chunk.items)
+                    chunk.error = None
+                    break
+                except Exception as e:
+                    chunk.error = e
+                    logger.warning(
+                        "Chunk %d (%d-%d) failed on attempt %d: %s",
+                        chunk.index,
+                        chunk.start,
+                        chunk.end,
+                        chunk.attempts,
+                        e,
+                    )
+                    if attempt < retries:
+                        await asyncio.sleep(retry_delay * 2**attempt)
+        if on_chunk_done is not None:
+            await on_chunk_done(chunk)
+
+    await asyncio.gather(*(run_chunk(chunk) for chunk in chunks))
+    return chunks
@@ -0,0 +1,528 @@
+"""Caches for read-mostly API responses."""
+
+import hashlib
+import json
+import os
+import sqlite3
+import tempfile
+import threading
+import time
+import uuid
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Hashable, Iterable, List, Optional, Tuple
+
+from .constants import (
+    CATALOG_CACHE_MAXSIZE,
+    CATALOG_CACHE_TTL,
+    CATALOG_SHARED_CACHE_DIR,
+    DATASET_COLUMN_CACHE_TTL,
+    EVALUATE_CACHE_MAXSIZE,
+    EVALUATE_CACHE_PATH,
+    EVALUATE_CACHE_TTL,
+    PROTECT_CACHE_DIR,
+    PROTECT_CACHE_DIR_MAXSIZE,
+    PROTECT_CACHE_MAXSIZE,
+    PROTECT_CACHE_TTL,
+)
+from .executor import run_blocking
+from .logger import get_logger
+from .metrics import metrics
+from .tracing import tracer
+
+logger = get_logger()
+
+_MISSING = object()
+
+# Concurrency class of the file reads and writes of shared cache tiers
+SHARED_CACHE_IO = "shared_cache"
+
+
+class SharedFileCache:
+    """Cache of JSON values stored as files, shared by every process using it.
+
+    Entries are written atomically, so concurrent readers in other worker
+    processes never see a partial file. Keys must be JSON serializable. Every
+    invalidation writes a new generation token, which tells the processes
+    using the cache that their local copies are stale.
+
+    Args:
+        directory: Directory holding the entries, created if missing
+        timer: Wall clock used to expire entries across processes
+        max_entries: Entries kept on disk, the oldest written are removed
+            first when exceeded, None keeps every unexpired entry
+    """
+
+    def __init__(
+        self,
+        directory: str,
+        timer: Callable[[], float] = time.time,
+        max_entries: Optional[int] = None,
+    ):
+        self.directory = directory
+        self.timer = timer
+        self.max_entries = max_entries
+        self._writes = 0
+        os.makedirs(directory, exist_ok=True)
+
+    GENERATION_FILE = "generation"
+
+    def _path(self, key: Hashable) -> str:
+        digest = hashlib.sha1(json.dumps(key, default=str).encode()).hexdigest()
+        return os.path.join(self.directory, f"{digest}.json")
+
+    def get(self, key: Hashable) -> tuple:
+        """Return (value, seconds left) for key, or (_MISSING, 0) if absent."""
+        try:
+            with open(self._path(key)) as f:
+                entry = json.load(f)
+        except (OSError, ValueError):
+            return _MISSING, 0
+        remaining = entry["expires_at"] - self.timer()
+        if remaining <= 0:
+            return _MISSING, 0
+        return entry["value"], remaining
+
+    def set(self, key: Hashable, value: Any, ttl: float):
+        """Store value for ttl seconds, replacing any previous entry."""
+        try:
+            fd, tmp_path = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+            with os.fdopen(fd, "w") as f:
+                json.dump({"expires_at": self.timer() + ttl, "value": value}, f)
+            os.replace(tmp_path, self._path(key))
+        except (OSError, TypeError, ValueError) as e:
+            logger.warning("Failed to write shared cache entry: %s", e)
+            return
+        if self.max_entries is not None:
+            # Pruning lists the directory, so only do it every so many writes
+            self._writes += 1
+            if self._writes >= max(1, self.max_entries // 10):
+                self._writes = 0
+                self.prune()
+
+    def prune(self):
+        """Remove expired entries, then the oldest ones beyond max_entries."""
+        entries = []
+        now = self.timer()
+        for name in os.listdir(self.directory):
+            if not name.endswith(".json"):
+                continue
+            path = os.path.join(self.directory, name)
+            try:
+                with open(path) as f:
+                    expires_at = json.load(f)["expires_at"]
+                modified = os.path.getmtime(path)
+            except (OSError, ValueError, KeyError):
+                continue
+            entries.append((expires_at <= now, modified, path))
+        excess = len(entries) - (self.max_entries or len(entries))
+        for expired, _, path in sorted(entries, key=lambda e: (not e[0], e[1])):
+            if not expired and excess <= 0:
+                break
+            try:
+                os.remove(path)
+            except FileNotFoundError:
+                pass
+            excess -= 1
+
+    def generation(self) -> Optional[str]:
+        """Return the token of the last invalidation, None if there was none."""
+        try:
+            with open(os.path.join(self.directory, self.GENERATION_FILE)) as f:
+                return f.read()
+        except OSError:
+            return None
+
+    def invalidate(self, key: Optional[Hashable] = None) -> Optional[str]:
+        """Drop a single entry, or every entry when no key is given.
+
+        Returns:
+            The new generation token, None if it could not be written
+        """
+        if key is not None:
+            paths = [self._path(key)]
+        else:
+            paths = [
+                os.path.join(self.directory, name)
+                for name in os.listdir(self.directory)
+                if name.endswith(".json")
+            ]
+        for path in paths:
+            try:
+                os.remove(path)
+            except FileNotFoundError:
+                pass
+        # Written once the entries are gone, so a process seeing the new token
+        # cannot read a stale entry back from disk
+        generation = uuid.uuid4().hex
+        try:
+            fd, tmp_path = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+            with os.fdopen(fd, "w") as f:
+                f.write(generation)
+            os.replace(tmp_path, os.path.join(self.directory, self.GENERATION_FILE))
+        except OSError as e:
+            logger.warning("Failed to write shared cache generation: %s", e)
+            return None
+        return generation
+
+
+class TTLCache:
+    """Thread-safe LRU cache whose entries expire after a fixed TTL.
+
+    Args:
+        maxsize: Maximum number of entries, the least recently used is evicted first
+        ttl: Seconds an entry stays valid, 0 disables the cache
+        timer: Clock used to expire entries
+        shared: Cache shared with other processes, consulted on a local miss.
+            Local entries are dropped once another process invalidated it,
+            which costs reading its small generation file on every lookup
+    """
+
+    def __init__(
+        self,
+        maxsize: int = 128,
+        ttl: float = 300.0,
+        timer: Callable[[], float] = time.monotonic,
+        shared: Optional[SharedFileCache] = None,
+    ):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.timer = timer
+        self.shared = shared
+        self.hits = 0
+        self.shared_hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._data: "OrderedDict[Hashable, tuple[float, Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+        # Generation of the shared tier the local entries were read under
+        self._generation: Optional[str] = None
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        """Return the cached value for key, or default if missing or expired.
+
+        Blocking when a shared tier is set, use ``aget`` on the event loop.
+        """
+        with tracer.span("cache.get", key=str(key)) as span:
+            value, outcome = self._lookup_local(key)
+            if value is _MISSING:
+                value, outcome = self._lookup_shared(key)
+            if span is not None:
+                span.set_attribute("outcome", outcome)
+        return default if value is _MISSING else value
+
+    async def aget(self, key: Hashable, default: Any = None) -> Any:
+        """Like ``get``, reading the shared tier on the worker pool."""
+        with tracer.span("cache.get", key=str(key)) as span:
+            value, outcome = self._lookup_local(key)
+            if value is _MISSING:
+                if self.shared is not None and self.ttl > 0:
+                    value, outcome = await run_blocking(
+                        SHARED_CACHE_IO, self._lookup_shared, key
+                    )
+                else:
+                    value, outcome = self._lookup_shared(key)
+            if span is not None:
+                span.set_attribute("outcome", outcome)
+        return default if value is _MISSING else value
+
+    def _lookup_local(self, key: Hashable) -> tuple:
+        generation = self.shared.generation() if self.shared is not None else None
+        with self._lock:
+            if generation != self._generation:
+                # Another process invalidated the shared tier
+                self._data.clear()
+                self._generation = generation
+            entry = self._data.get(key, _MISSING)
+            if entry is not _MISSING:
+                expires_at, value = entry
+                if expires_at > self.timer():
+                    self._data.move_to_end(key)
+                    self.hits += 1
+                    return value, "hit"
+                del self._data[key]
+        return _MISSING, "miss"
+
+    def _lookup_shared(self, key: Hashable) -> tuple:
+        """Look a local miss up in the shared tier, counting it if absent."""
+        if self.shared is not None and self.ttl > 0:
+            value, remaining = self.shared.get(key)
+            if value is not _MISSING:
+                # Another worker fetched it, keep it locally for what is left
+                self._store(key, value, min(remaining, self.ttl))
+                with self._lock:
+                    self.shared_hits += 1
+                return value, "shared_hit"
+
+        with self._lock:
+            self.misses += 1
+        return _MISSING, "miss"
+
+    def _store(self, key: Hashable, value: Any, ttl: float):
+        with self._lock:
+            self._data[key] = (self.timer() + ttl, value)
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+                self.evictions += 1
+
+    def set(self, key: Hashable, value: Any):
+        """Store a value, evicting the least recently used entries if full.
+
+        Blocking when a shared tier is set, use ``aset`` on the event loop.
+        """
+        if self.ttl <= 0 or self.maxsize <= 0:
+            return
+        self._store(key, value, self.ttl)
+        if self.shared is not None:
+            self.shared.set(key, value, self.ttl)
+
+    async def aset(self, key: Hashable, value: Any):
+        """Like ``set``, writing the shared tier on the worker pool."""
+        if self.ttl <= 0 or self.maxsize <= 0:
+            return
+        self._store(key, value, self.ttl)
+        if self.shared is not None:
+            await run_blocking(SHARED_CACHE_IO, self.shared.set, key, value, self.ttl)
+
+    def invalidate(self, key: Optional[Hashable] = None):
+        """Drop a single entry, or every entry when no key is given."""
+        self._invalidate_local(key)
+        if self.shared is not None:
+            self._generation = self.shared.invalidate(key)
+
+    async def ainvalidate(self, key: Optional[Hashable] = None):
+        """Like ``invalidate``, removing shared entries on the worker pool."""
+        self._invalidate_local(key)
+        if self.shared is not None:
+            self._generation = await run_blocking(
+                SHARED_CACHE_IO, self.shared.invalidate, key
+            )
+
+    def _invalidate_local(self, key: Optional[Hashable]):
+        with self._lock:
+            if key is None:
+                self._data.clear()
+            else:
+                self._data.pop(key, None)
+
+    def stats(self) -> dict:
+        """Return hit/miss counters and occupancy of the cache."""
+        with self._lock:
+            hits = self.hits + self.shared_hits
+            lookups = hits + self.misses
+            return {
+                "hits": self.hits,
+                "shared_hits": self.shared_hits,
+                "misses": self.misses,
+                "hit_rate": hits / lookups if lookups else 0.0,
+                "evictions": self.evictions,
+                "size": len(self._data),
+                "maxsize": self.maxsize,
+                "ttl": self.ttl,
+            }
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+
+class SQLiteCache:
+    """Cache of JSON values in a SQLite file, kept across restarts.
+
+    The file is opened on first use and may be shared by several processes.
+    Entries expire after a fixed TTL, and once more than maxsize entries are
+    stored the least recently used ones are evicted. Lookups and writes take
+    many keys at once, so a batch costs a single transaction.
+
+    Args:
+        path: SQLite file, created with its directory if missing
+        maxsize: Maximum number of entries, 0 disables the cache
+        ttl: Seconds an entry stays valid, 0 disables the cache
+        timer: Wall clock used to expire entries across processes
+    """
+
+    # Keys looked up per statement, below the SQLite limit on bound variables
+    BATCH_SIZE = 500
+
+    def __init__(
+        self,
+        path: str,
+        maxsize: int = 100000,
+        ttl: float = 604800.0,
+        timer: Callable[[], float] = time.time,
+    ):
+        self.path = path
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.timer = timer
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._connection: Optional[sqlite3.Connection] = None
+        self._lock = threading.Lock()
+
+    @property
+    def enabled(self) -> bool:
+        return self.ttl > 0 and self.maxsize > 0
+
+    def _connect(self) -> sqlite3.Connection:
+        if self._connection is None:
+            directory = os.path.dirname(self.path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            connection = sqlite3.connect(
+                self.path, timeout=30, check_same_thread=False, isolation_level=None
+            )
+            connection.execute("PRAGMA journal_mode=WAL")
+            connection.execute(
+                "CREATE TABLE IF NOT EXISTS entries ("
+                "key TEXT PRIMARY KEY, value TEXT NOT NULL, "
+                "expires_at REAL NOT NULL, used_at REAL NOT NULL)"
+            )
+            connection.execute(
+                "CREATE INDEX IF NOT EXISTS entries_used_at ON entries (used_at)"
+            )
+            self._connection = connection
+        return self._connection
+
+    def get_many(self, keys: Iterable[str]) -> Dict[str, Any]:
+        """Return the unexpired values of the keys found, by key."""
+        keys = list(dict.fromkeys(keys))
+        if not keys or not self.enabled:
+            return {}
+        found = {}
+        with tracer.span("cache.get_many", keys=len(keys)), self._lock:
+            connection = self._connect()
+            now = self.timer()
+            with connection:
+                for start in range(0, len(keys), self.BATCH_SIZE):
+                    end = start + self.BATCH_SIZE
+                    batch = keys[start:end]
+                    marks = ",".join("?" * len(batch))
+                    rows = connection.execute(
+                        f"SELECT key, value FROM entries "
+                        f"WHERE key IN ({marks}) AND expires_at > ?",
+                        (*batch, now),
+                    ).fetchall()
+                    found.update((key, json.loads(value)) for key, value in rows)
+                connection.executemany(
+                    "UPDATE entries SET used_at = ? WHERE key = ?",
+                    [(now, key) for key in found],
+                )
+            self.hits += len(found)
+            self.misses += len(keys) - len(found)
+        return found
+
+    def set_many(self, items: Iterable[Tuple[str, Any]]):
+        """Store values by key, then evict entries beyond maxsize."""
+        if not self.enabled:
+            return
+        rows = []
+        now = self.timer()
+        for key, value in items:
+            try:
+                rows.append((key, json.dumps(value), now + self.ttl, now))
+            except (TypeError, ValueError) as e:
+                logger.warning("Failed to encode cache entry: %s", e)
+        if not rows:
+            return
+        with self._lock:
+            connection = self._connect()
+            with connection:
+                connection.executemany(
+                    "INSERT OR REPLACE INTO entries "
+                    "(key, value, expires_at, used_at) VALUES (?, ?, ?, ?)",
+                    rows,
+                )
+                self._evict(connection, now)
+
+    def _evict(self, connection: sqlite3.Connection, now: float):
+        removed = connection.execute(
+            "DELETE FROM entries WHERE expires_at <= ?", (now,)
+        ).rowcount
+        (size,) = connection.execute("SELECT COUNT(*) FROM entries").fetchone()
+        excess = size - self.maxsize
+        if excess > 0:
+            removed += connection.execute(
+                "DELETE FROM entries WHERE key IN "
+                "(SELECT key FROM entries ORDER BY used_at LIMIT ?)",
+                (excess,),
+            ).rowcount
+        self.evictions += removed
+
+    def invalidate(self, keys: Optional[List[str]] = None):
+        """Drop some entries, or every entry when no keys are given."""
+        with self._lock:
+            if self._connection is None and not os.path.exists(self.path):
+                return
+            connection = self._connect()
+            with connection:
+                if keys is None:
+                    connection.execute("DELETE FROM entries")
+                else:
+                    connection.executemany(
+                        "DELETE FROM entries WHERE key = ?", [(key,) for key in keys]
+                    )
+
+    def stats(self) -> dict:
+        """Return hit/miss counters and occupancy of the cache."""
+        with self._lock:
+            size = 0
+            if self._connection is not None:
+                (size,) = self._connection.execute(
+                    "SELECT COUNT(*) FROM entries"
+                ).fetchone()
+            lookups = self.hits + self.misses
+            return {
+                "hits": self.hits,
+                "shared_hits": 0,
+                "misses": self.misses,
+                "hit_rate": self.hits / lookups if lookups else 0.0,
+                "evictions": self.evictions,
+                "size": size,
+                "maxsize": self.maxsize,
+                "ttl": self.ttl,
+            }
+
+    def close(self):
+        with self._lock:
+            if self._connection is not None:
+                self._connection.close()
+                self._connection = None
+
+
+# Evaluator catalog, eval lists and eval template structures, shared between
+# worker processes when a shared cache directory is configured
+catalog_cache = TTLCache(
+    maxsize=CATALOG_CACHE_MAXSIZE,
+    ttl=CATALOG_CACHE_TTL,
+    shared=(
+        SharedFileCache(CATALOG_SHARED_CACHE_DIR) if CATALOG_SHARED_CACHE_DIR else None
+    ),
+)
+
+# Column names and ids of datasets, keyed by dataset id. Entries are dropped
+# whenever columns are added to the dataset through this server.
+column_cache = TTLCache(maxsize=CATALOG_CACHE_MAXSIZE, ttl=DATASET_COLUMN_CACHE_TTL)
+
+# Protect decisions, keyed by a hash of the input and the rules. With a
+# directory configured they are also kept on disk and survive restarts.
+protect_cache = TTLCache(
+    maxsize=PROTECT_CACHE_MAXSIZE,
+    ttl=PROTECT_CACHE_TTL,
+    shared=(
+        SharedFileCache(PROTECT_CACHE_DIR, max_entries=PROTECT_CACHE_DIR_MAXSIZE)
+        if PROTECT_CACHE_DIR
+        else None
+    ),
+)
+
+# Results of evaluated rows, keyed by a hash of the templates and the row. The
+# file is only created once the cache is enabled and used.
+evaluate_cache = SQLiteCache(
+    EVALUATE_CACHE_PATH, maxsize=EVALUATE_CACHE_MAXSIZE, ttl=EVALUATE_CACHE_TTL
+)
+
+metrics.register_cache("catalog", catalog_cache)
+metrics.register_cache("dataset_columns", column_cache)
+metrics.register_cache("protect", protect_cache)
+metrics.register_cache("evaluate", evaluate_cache)
@@ -0,0 +1,261 @@
+"""The evaluator catalog, and indexed views of it to filter, page and search it."""
+
+import re
+from bisect import bisect_left
+from collections import Counter
+from typing import Any, Dict, FrozenSet, List, Optional, Set, Tuple
+
+from .cache import catalog_cache
+from .clients import get_client_registry
+from .executor import run_blocking
+from .logger import get_logger
+from .serialization import project_fields
+
+logger = get_logger()
+
+
+async def fetch_evaluators() -> List[Dict[str, Any]]:
+    """Return the evaluator catalog in display order, fetched once per TTL."""
+    cached = await catalog_cache.aget(("all_evaluators",))
+    if cached is not None:
+        return cached
+
+    logger.info("Fetching evaluators")
+    eval_client = get_client_registry().eval_client()
+    # Some SDK versions memoize template info per client, drop it so a
+    # refresh is fresh
+    cache_clear = getattr(
+        getattr(eval_client, "_get_eval_info", None), "cache_clear", None
+    )
+    if cache_clear is not None:
+        cache_clear()
+    evaluators = await run_blocking("all_evaluators", eval_client.list_evaluations)
+    evaluators.sort(
+        key=lambda x: x["eval_tags"] and "CUSTOM" in x["eval_tags"], reverse=True
+    )
+    logger.debug("Fetched %d evaluators", len(evaluators))
+    await catalog_cache.aset(("all_evaluators",), evaluators)
+    return evaluators
+
+
+_TOKEN = re.compile(r"[a-z0-9]+")
+
+
+def tokenize(text: str) -> List[str]:
+    """Split text into lower-cased alphanumeric tokens."""
+    return _TOKEN.findall(text.lower())
+
+
+def evaluator_id(evaluator: Dict[str, Any]) -> str:
+    return str(evaluator.get("eval_id") or evaluator.get("id") or evaluator.get("name"))
+
+
+def check_limit(limit: Optional[int]):
+    """Raise ValueError unless limit is None or a positive integer."""
+    if limit is not None and limit < 1:
+        raise ValueError("limit must be a positive integer")
+
+
+def required_keys(evaluator: Dict[str, Any]) -> List[str]:
+    config = evaluator.get("config")
+    if isinstance(config, dict):
+        return config.get("required_keys") or []
+    return []
+
+
+def _indexed_source(evaluator: Dict[str, Any]) -> Tuple[Any, ...]:
+    """Return the fields of an evaluator the index is built from."""
+    return (
+        evaluator.get("name") or "",
+        evaluator.get("description") or "",
+        tuple(evaluator.get("eval_tags") or ()),
+        tuple(required_keys(evaluator)),
+    )
+
+
+def _index_terms(source: Tuple[Any, ...]) -> Tuple[FrozenSet[str], ...]:
+    """Return the tags, required keys and text tokens an evaluator is found by."""
+    name, description, tags, keys = source
+    return (
+        frozenset(str(tag).upper() for tag in tags),
+        frozenset(str(key).lower() for key in keys),
+        frozenset(tokenize(" ".join([str(name), str(description), *map(str, tags)]))),
+    )
+
+
+class EvaluatorIndex:
+    """Inverted index of the evaluator catalog.
+
+    Maps tags, required keys and the tokens of the name, description and
+    tags to evaluator ids. all_evaluators and search_evaluators are both
+    served from it, so a query matches the same evaluators in either tool. When the catalog is refreshed, only the evaluators that were added,
+    removed or whose indexed terms changed are re-indexed.
+    """
+
+    def __init__(self):
+        self.evaluators: Dict[str, Dict[str, Any]] = {}
+        self.order: Dict[str, int] = {}
+        self.by_tag: Dict[str, Set[str]] = {}
+        self.by_key: Dict[str, Set[str]] = {}
+        self.by_token: Dict[str, Set[str]] = {}
+        self._sources: Dict[str, Tuple[Any, ...]] = {}
+        self._terms: Dict[str, Tuple[FrozenSet[str], ...]] = {}
+        self._vocabulary: List[str] = []
+
+    def _postings(self):
+        return (self.by_tag, self.by_key, self.by_token)
+
+    def _add(self, ident: str, terms: Tuple[FrozenSet[str], ...]):
+        self._terms[ident] = terms
+        for postings, values in zip(self._postings(), terms):
+            for value in values:
+                postings.setdefault(value, set()).add(ident)
+
+    def _remove(self, ident: str):
+        for postings, values in zip(self._postings(), self._terms.pop(ident)):
+            for value in values:
+                ids = postings[value]
+                ids.discard(ident)
+                if not ids:
+                    del postings[value]
+
+    def update(self, evaluators: List[Dict[str, Any]]) -> Dict[str, int]:
+        """Bring the index in line with a freshly fetched catalog.
+
+        Args:
+            evaluators: Evaluators in display order
+
+        Returns:
+            dict: Number of evaluators added, changed and removed
+        """
+        current = {evaluator_id(evaluator): evaluator for evaluator in evaluators}
+        removed = [ident for ident in self._terms if ident not in current]
+        for ident in removed:
+            self._remove(ident)
+            del self._sources[ident]
+        added = changed = 0
+        for ident, evaluator in current.items():
+            source = _indexed_source(evaluator)
+            previous = self._sources.get(ident)
+            if previous == source:
+                continue
+            if previous is None:
+                added += 1
+            else:
+                self._remove(ident)
+                changed += 1
+            self._sources[ident] = source
+            self._add(ident, _index_terms(source))
+        if added or changed or removed:
+            self._vocabulary = sorted(self.by_token)
+        self.evaluators = current
+        self.order = {ident: position for position, ident in enumerate(current)}
+        return {"added": added, "changed": changed, "removed": len(removed)}
+
+    def _with_prefix(self, prefix: str) -> Set[str]:
+        """Return the ids of evaluators having a token starting with prefix."""
+        ids: Set[str] = set()
+        vocabulary = self._vocabulary
+        start = bisect_left(vocabulary, prefix)
+        for token in vocabulary[start:]:
+            if not token.startswith(prefix):
+                break
+            ids |= self.by_token[token]
+        return ids
+
+    def search(
+        self,
+        tags: Optional[List[str]] = None,
+        required: Optional[List[str]] = None,
+        available: Optional[List[str]] = None,
+        query: Optional[str] = None,
+    ) -> List[str]:
+        """Return the ids of the evaluators matching every criterion.
+
+        Args:
+            tags: Tags the evaluators must all carry
+            required: Keys the evaluators must all require
+            available: Keys the caller can provide, evaluators requiring any
+                other key are left out
+            query: Words that must each start a word of the name, description
+                or tags
+
+        Returns:
+            list: Matching evaluator ids, in display order
+        """
+        candidates: Optional[Set[str]] = None
+        filters = [self.by_tag.get(tag.upper(), set()) for tag in tags or []]
+        filters += [self.by_key.get(key.lower(), set()) for key in required or []]
+        filters += [self._with_prefix(token) for token in tokenize(query or "")]
+        for ids in sorted(filters, key=len):
+            candidates = set(ids) if candidates is None else candidates & ids
+            if not candidates:
+                return []
+        if available is not None:
+            # An evaluator fits when every key it requires is available
+            provided = Counter()
+            for key in {key.lower() for key in available}:
+                provided.update(self.by_key.get(key, ()))
+            pool = self.evaluators if candidates is None else candidates
+            candidates = {
+                ident for ident in pool if provided[ident] == len(self._terms[ident][1])
+            }
+        if candidates is None:
+            return list(self.evaluators)
+        return sorted(candidates, key=self.order.__getitem__)
+
+    def page(
+        self,
+        tags: Optional[List[str]] = None,
+        search: Optional[str] = None,
+        limit: Optional[int] = None,
+        cursor: Optional[str] = None,
+        fields: Optional[List[str]] = None,
+    ) -> Dict[str, Any]:
+        """Return one page of the evaluators matching the filters.
+
+        Args:
+            tags: Tags the evaluators must all carry
+            search: Words that must each start a word of the name, description
+                or tags
+            limit: Maximum number of evaluators in the page, all when None
+            cursor: next_cursor of the previous page, None for the first page
+            fields: Keys of each evaluator to keep, all when None
+
+        Returns:
+            dict: The evaluators of the page, the number of matching evaluators
+                and the cursor of the next page, None on the last page
+
+        Raises:
+            ValueError: If the limit or the cursor is invalid
+        """
+        check_limit(limit)
+        try:
+            offset = int(cursor) if cursor else 0
+        except ValueError:
+            raise ValueError(f"Invalid cursor: {cursor}")
+        if offset < 0:
+            raise ValueError(f"Invalid cursor: {cursor}")
+
+        ids = self.search(tags=tags, query=search)
+        end = len(ids) if limit is None else offset + limit
+        page = [self.evaluators[ident] for ident in ids[offset:end]]
+        return {
+            "evaluators": project_fields(page, fields),
+            "total": len(ids),
+            "next_cursor": str(end) if end < len(ids) else None,
+        }
+
+
+# Index kept up to date with the catalog handed out by the cache
+_index = EvaluatorIndex()
+_indexed_catalog: Optional[List[Dict[str, Any]]] = None
+
+
+def get_evaluator_index(evaluators: List[Dict[str, Any]]) -> EvaluatorIndex:
+    """Return the evaluator index, updated when the catalog changed."""
+    global _indexed_catalog
+    if _indexed_catalog is not evaluators:
+        _index.update(evaluators)
+        _indexed_catalog = evaluators
+    return _index
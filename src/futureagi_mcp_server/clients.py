@@ -0,0 +1,182 @@
+"""Process-wide registry of FutureAGI SDK clients sharing one connection pool."""
+
+import os
+import threading
+import time
+from typing import TYPE_CHECKING, Optional
+
+from .constants import HTTP_POOL_IDLE_TIMEOUT, HTTP_POOL_SIZE, PROTECT_WORKERS
+from .executor import ContextThreadPoolExecutor
+from .logger import get_logger
+
+if TYPE_CHECKING:
+    from fi.api.auth import APIKeyAuth
+    from fi.datasets import DatasetClient
+    from fi.datasets.types import DatasetConfig
+    from fi.evals import EvalClient, ProtectClient
+    from requests_futures.sessions import FuturesSession
+
+logger = get_logger()
+
+
+class ClientRegistry:
+    """Lazily built SDK clients backed by a single keep-alive session.
+
+    Every client handed out by the registry reuses the same pooled session, so
+    consecutive tool calls skip the TCP and TLS handshake with FI_BASE_URL.
+    Connections left idle for longer than ``idle_timeout`` seconds are dropped
+    and transparently re-opened on the next request.
+    """
+
+    def __init__(
+        self,
+        api_key: Optional[str] = None,
+        secret_key: Optional[str] = None,
+        base_url: Optional[str] = None,
+        pool_size: int = HTTP_POOL_SIZE,
+        idle_timeout: float = HTTP_POOL_IDLE_TIMEOUT,
+    ):
+        self.api_key = api_key or os.getenv("FI_API_KEY")
+        self.secret_key = secret_key or os.getenv("FI_SECRET_KEY")
+        self.base_url = base_url or os.getenv("FI_BASE_URL")
+        self.pool_size = pool_size
+        self.idle_timeout = idle_timeout
+        self._lock = threading.RLock()
+        self._session: Optional["FuturesSession"] = None
+        self._last_used = time.monotonic()
+        self._api_client: Optional["APIKeyAuth"] = None
+        self._eval_client: Optional["EvalClient"] = None
+        self._protect_client: Optional["ProtectClient"] = None
+
+    def _touch(self, *args, **kwargs):
+        self._last_used = time.monotonic()
+
+    def session(self) -> "FuturesSession":
+        """Get the shared session, dropping connections that went idle."""
+        with self._lock:
+            if self._session is None:
+                # The SDK and its HTTP stack are imported on first use only
+                from requests_futures.sessions import FuturesSession
+
+                self._session = FuturesSession(
+                    max_workers=self.pool_size,
+                    adapter_kwargs={
+                        "pool_connections": self.pool_size,
+                        "pool_maxsize": self.pool_size,
+                    },
+                )
+                # Requests run in the context of their caller, so their spans
+                # are children of the current span
+                self._session.executor.shutdown(wait=False)
+                self._session.executor = ContextThreadPoolExecutor(
+                    max_workers=self.pool_size
+                )
+                self._session.hooks["response"].append(self._touch)
+            elif time.monotonic() - self._last_used > self.idle_timeout:
+                logger.debug("Dropping idle pooled connections")
+                # In-flight requests keep their connection, idle ones are closed
+                for adapter in self._session.adapters.values():
+                    adapter.close()
+            self._touch()
+            return self._session
+
+    def _client_kwargs(self) -> dict:
+        return {
+            "fi_api_key": self.api_key,
+            "fi_secret_key": self.secret_key,
+            "fi_base_url": self.base_url,
+            "session": self.session(),
+        }
+
+    def api_client(self) -> "APIKeyAuth":
+        """Get the shared client used for raw API requests."""
+        with self._lock:
+            kwargs = self._client_kwargs()
+            if self._api_client is None:
+                from fi.api.auth import APIKeyAuth
+
+                self._api_client = APIKeyAuth(**kwargs)
+            return self._api_client
+
+    def eval_client(self) -> "EvalClient":
+        """Get the shared evaluation client."""
+        with self._lock:
+            kwargs = self._client_kwargs()
+            if self._eval_client is None:
+                from fi.evals import EvalClient
+
+                self._eval_client = EvalClient(**kwargs)
+            return self._eval_client
+
+    def protect_client(self) -> "ProtectClient":
+        """Get the shared protect client, backed by the shared evaluation client."""
+        with self._lock:
+            eval_client = self.eval_client()
+            if self._protect_client is None:
+                from fi.evals import ProtectClient
+
+                self._protect_client = ProtectClient(evaluator=eval_client)
+                # Rules are checked on the client's own threads, keep the
+                # context of the calling tool visible to them, and size the
+                # pool for the inputs of a batch screened concurrently
+                self._protect_client.executor.shutdown(wait=False)
+                self._protect_client.executor = ContextThreadPoolExecutor(
+                    max_workers=PROTECT_WORKERS
+                )
+            return self._protect_client
+
+    def dataset_client(
+        self, dataset_config: Optional["DatasetConfig"] = None
+    ) -> "DatasetClient":
+        """Create a dataset client that reuses the shared connection pool.
+
+        Dataset clients are bound to a single dataset, so a new one is built on
+        every call. Building it fetches the dataset config and is blocking.
+        """
+        from fi.datasets import DatasetClient
+
+        return DatasetClient(dataset_config=dataset_config, **self._client_kwargs())
+
+    def close(self):
+        """Close pooled connections and release the worker threads of all clients."""
+        with self._lock:
+            session, self._session = self._session, None
+            protect_client, self._protect_client = self._protect_client, None
+            self._api_client = None
+            self._eval_client = None
+        if protect_client is not None:
+            protect_client.executor.shutdown(wait=False)
+        if session is not None:
+            session.close()
+
+
+_registry: Optional[ClientRegistry] = None
+_registry_lock = threading.Lock()
+
+
+def get_client_registry() -> ClientRegistry:
+    """Get the process-wide client registry, creating it from the environment."""
+    global _registry
+    with _registry_lock:
+        if _registry is None:
+            _registry = ClientRegistry()
+        return _registry
+
+
+def set_client_registry(registry: ClientRegistry) -> ClientRegistry:
+    """Install a client registry, closing the one it replaces."""
+    global _registry
+    with _registry_lock:
+        previous, _registry = _registry, registry
+    if previous is not None and previous is not registry:
+        previous.close()
+    return registry
+
+
+def close_client_registry():
+    """Close the process-wide client registry, if one was created."""
+    global _registry
+    with _registry_lock:
+        registry, _registry = _registry, None
+    if registry is not None:
+        registry.close()
@@ -9,13 +9,104 @@ BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
 LOGS_DIR = os.path.join(BASE_DIR, "logs")
 LOG_LEVEL = os.getenv("LOG_LEVEL", "ERROR")
 LOG_FILE = os.path.join(LOGS_DIR, "futureagi-mcp.log")
+# "text" or "json", one JSON object per line
+LOG_FORMAT = os.getenv("FI_MCP_LOG_FORMAT", "text")
+# Hand records to a background thread so disk writes never block the event loop
+LOG_QUEUE = os.getenv("FI_MCP_LOG_QUEUE", "true").lower() in ("1", "true", "yes")
+# Characters of a logged argument value kept before it is truncated
+LOG_ARGUMENT_MAX_LENGTH = int(os.getenv("FI_MCP_LOG_ARGUMENT_MAX_LENGTH", "200"))
+
+# Tracing configuration, needs the otel extra. An empty exporter disables
+# tracing, otherwise "otlp", "console", "file", "memory" or the "module:Class"
+# path of an OpenTelemetry span exporter
+TRACE_EXPORTER = os.getenv("FI_MCP_TRACE_EXPORTER", "")
+TRACE_FILE = os.getenv("FI_MCP_TRACE_FILE", os.path.join(LOGS_DIR, "traces.jsonl"))
 
 
 # Server configuration
-SERVER_HOST = "0.0.0.0"
+# Only local clients can connect unless another interface is chosen
+SERVER_HOST = "127.0.0.1"
 SERVER_PORT = 8001
 SERVER_NAME = "futureagi"
 SERVER_VERSION = "0.1.0"
+# Endpoints of the SSE transport
+SSE_PATH = "/sse"
+MESSAGES_PATH = "/messages/"
+# Bearer token clients of the SSE transport must send, required to listen on
+# any interface other than loopback
+AUTH_TOKEN = os.getenv("FI_MCP_AUTH_TOKEN", "")
+# Seconds open sessions get to finish when the HTTP server shuts down
+SHUTDOWN_TIMEOUT = float(os.getenv("FI_MCP_SHUTDOWN_TIMEOUT", "30"))
+# Number of server processes sharing the listening socket of the SSE transport
+WORKERS = int(os.getenv("FI_MCP_WORKERS", "1"))
+# Directory worker processes use to route messages and report their load
+STATE_DIR = os.getenv("FI_MCP_STATE_DIR", "")
+# Prefetch catalogs and open pooled connections in the background at startup
+WARMUP = os.getenv("FI_MCP_WARMUP", "false").lower() in ("1", "true", "yes")
+# Seconds between two load reports of a worker process
+LOAD_REPORT_INTERVAL = float(os.getenv("FI_MCP_LOAD_REPORT_INTERVAL", "2"))
+
+# Execution configuration
+# Size of the worker pool used to run blocking SDK calls off the event loop
+MAX_WORKERS = int(os.getenv("FI_MCP_MAX_WORKERS", "16"))
+# Maximum number of in-flight calls per tool, unless overridden below
+DEFAULT_TOOL_CONCURRENCY = int(os.getenv("FI_MCP_DEFAULT_TOOL_CONCURRENCY", "8"))
+# Limits are keyed by tool name or by the concurrency class of a tool
+TOOL_CONCURRENCY_LIMITS = {
+    "catalog": 8,
+    "evaluation": 4,
+    "dataset_transfer": 2,
+    "generation": 2,
+}
+# Comma separated overrides, e.g. "evaluation=8,protect=16"
+TOOL_CONCURRENCY_OVERRIDES = os.getenv("FI_MCP_TOOL_CONCURRENCY", "")
+# Default timeout in seconds for a single tool call, 0 disables it
+TOOL_TIMEOUT = float(os.getenv("FI_MCP_TOOL_TIMEOUT", "0"))
+
+# HTTP connection pool configuration
+HTTP_POOL_SIZE = int(os.getenv("FI_MCP_HTTP_POOL_SIZE", "16"))
+# Seconds of inactivity after which pooled keep-alive connections are dropped
+HTTP_POOL_IDLE_TIMEOUT = float(os.getenv("FI_MCP_HTTP_POOL_IDLE_TIMEOUT", "60"))
+
+# Catalog cache configuration, a TTL of 0 disables caching
+CATALOG_CACHE_TTL = float(os.getenv("FI_MCP_CATALOG_CACHE_TTL", "300"))
+CATALOG_CACHE_MAXSIZE = int(os.getenv("FI_MCP_CATALOG_CACHE_MAXSIZE", "256"))
+# Directory of the catalog cache shared by worker processes, empty disables it
+CATALOG_SHARED_CACHE_DIR = os.getenv("FI_MCP_CATALOG_SHARED_CACHE_DIR", "")
+# Seconds the column names and ids of a dataset are cached, 0 disables caching
+DATASET_COLUMN_CACHE_TTL = float(os.getenv("FI_MCP_DATASET_COLUMN_CACHE_TTL", "60"))
+
+# Tool result serialization, "compact" JSON or "pretty" JSON indented by two spaces
+OUTPUT_FORMAT = os.getenv("FI_MCP_OUTPUT_FORMAT", "compact")
+# JSON library used for results: "auto" uses orjson when installed, else "json"
+JSON_BACKEND = os.getenv("FI_MCP_JSON_BACKEND", "auto")
+
+# Maximum number of evaluators returned by one search_evaluators call
+SEARCH_EVALUATORS_LIMIT = int(os.getenv("FI_MCP_SEARCH_EVALUATORS_LIMIT", "20"))
+
+# Batch evaluation configuration
+EVALUATE_CHUNK_SIZE = int(os.getenv("FI_MCP_EVALUATE_CHUNK_SIZE", "50"))
+EVALUATE_MAX_IN_FLIGHT = int(os.getenv("FI_MCP_EVALUATE_MAX_IN_FLIGHT", "4"))
+EVALUATE_CHUNK_RETRIES = int(os.getenv("FI_MCP_EVALUATE_CHUNK_RETRIES", "1"))
+# Reuse the results of rows already evaluated with the same templates
+EVALUATE_CACHE = os.getenv("FI_MCP_EVALUATE_CACHE", "false").lower() in (
+    "1",
+    "true",
+    "yes",
+)
+# Per-user directory of the caches kept across restarts
+USER_CACHE_DIR = os.path.join(
+    os.getenv("XDG_CACHE_HOME") or os.path.join(os.path.expanduser("~"), ".cache"),
+    "futureagi-mcp",
+)
+# SQLite file holding the cached evaluation results
+EVALUATE_CACHE_PATH = os.getenv(
+    "FI_MCP_EVALUATE_CACHE_PATH", os.path.join(USER_CACHE_DIR, "evaluate.db")
+)
+# Seconds an evaluation result is reused, 0 disables caching
+EVALUATE_CACHE_TTL = float(os.getenv("FI_MCP_EVALUATE_CACHE_TTL", "604800"))
+# Maximum number of rows cached, the least recently used are evicted first
+EVALUATE_CACHE_MAXSIZE = int(os.getenv("FI_MCP_EVALUATE_CACHE_MAXSIZE", "100000"))
 
 # Model Hub configuration
 MODEL_HUB_DEVELOP_ID = "2063cf96-40fc-4840-b5cd-ce48f06c24ea"
@@ -23,3 +114,21 @@ MODEL_HUB_DEVELOP_ID = "2063cf96-40fc-4840-b5cd-ce48f06c24ea"
 # Default values
 DEFAULT_PROTECT_ACTION = "Response cannot be generated as the input fails the checks"
 DEFAULT_PROTECT_TIMEOUT = 30000
+
+# Protect configuration
+# Threads checking protect rules, shared by every protect and protect_batch call
+PROTECT_WORKERS = int(os.getenv("FI_MCP_PROTECT_WORKERS", "16"))
+# Maximum number of inputs of one protect_batch call screened concurrently
+PROTECT_BATCH_MAX_IN_FLIGHT = int(os.getenv("FI_MCP_PROTECT_BATCH_MAX_IN_FLIGHT", "8"))
+# Fail obvious personal data and prompt injections locally, before calling the API
+PROTECT_PREFILTER = os.getenv("FI_MCP_PROTECT_PREFILTER", "false").lower() in (
+    "1",
+    "true",
+    "yes",
+)
+# Seconds protect decisions are cached, 0 disables caching
+PROTECT_CACHE_TTL = float(os.getenv("FI_MCP_PROTECT_CACHE_TTL", "600"))
+PROTECT_CACHE_MAXSIZE = int(os.getenv("FI_MCP_PROTECT_CACHE_MAXSIZE", "4096"))
+# Directory keeping protect decisions across restarts, empty keeps them in memory
+PROTECT_CACHE_DIR = os.getenv("FI_MCP_PROTECT_CACHE_DIR", "")
+PROTECT_CACHE_DIR_MAXSIZE = int(os.getenv("FI_MCP_PROTECT_CACHE_DIR_MAXSIZE", "65536"))
@@ -0,0 +1,218 @@
+"""Execution layer for running blocking SDK calls off the event loop."""
+
+import asyncio
+import contextlib
+import contextvars
+import functools
+import threading
+import weakref
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, AsyncIterator, Callable, Dict, Optional
+
+from .constants import (
+    DEFAULT_TOOL_CONCURRENCY,
+    MAX_WORKERS,
+    TOOL_CONCURRENCY_LIMITS,
+    TOOL_CONCURRENCY_OVERRIDES,
+)
+from .logger import get_logger
+from .tracing import tracer
+
+logger = get_logger()
+
+
+class ContextThreadPoolExecutor(ThreadPoolExecutor):
+    """Thread pool running every task in a copy of the submitter's context.
+
+    Keeps the current span, and other context variables, visible to work the
+    SDK fans out to its own threads.
+    """
+
+    def submit(self, fn, /, *args, **kwargs):
+        context = contextvars.copy_context()
+        return super().submit(context.run, fn, *args, **kwargs)
+
+
+def parse_concurrency_limits(value: Optional[str]) -> Dict[str, int]:
+    """Parse a "tool=limit,tool=limit" string into a dictionary.
+
+    Args:
+        value: Comma separated list of tool limits
+
+    Returns:
+        dict: Mapping of tool name to its concurrency limit
+    """
+    limits = {}
+    if not value:
+        return limits
+    for item in value.split(","):
+        if not item.strip():
+            continue
+        name, _, limit = item.partition("=")
+        try:
+            limits[name.strip()] = max(1, int(limit))
+        except ValueError:
+            logger.warning("Ignoring invalid tool concurrency limit: %s", item)
+    return limits
+
+
+# Tool name -> concurrency class, tools in one class share a single limit
+_concurrency_classes: Dict[str, str] = {}
+
+
+def register_concurrency_class(tool_name: str, concurrency_class: str):
+    """Make a tool share the concurrency limit of a class of tools."""
+    _concurrency_classes[tool_name] = concurrency_class
+
+
+class ToolExecutor:
+    """Bounded worker pool with per-tool concurrency limits.
+
+    Blocking calls are submitted to a shared thread pool so the MCP event loop
+    keeps serving other requests. Every tool, or class of tools, also gets its
+    own semaphore so a single slow tool cannot occupy all of the workers.
+    """
+
+    def __init__(
+        self,
+        max_workers: int = MAX_WORKERS,
+        tool_limits: Optional[Dict[str, int]] = None,
+        default_limit: int = DEFAULT_TOOL_CONCURRENCY,
+    ):
+        self.max_workers = max_workers
+        self.default_limit = default_limit
+        self.tool_limits = dict(tool_limits or {})
+        self._pool: Optional[ThreadPoolExecutor] = None
+        self._lock = threading.Lock()
+        # Calls waiting for, or holding, a slot in the pool
+        self.in_flight = 0
+        # Semaphores are bound to the loop they are first used on
+        self._semaphores = weakref.WeakKeyDictionary()
+
+    def limit_key(self, tool_name: str) -> str:
+        """Return the key a tool is limited by.
+
+        An explicit limit for the tool wins over the limit of its class.
+        """
+        if tool_name in self.tool_limits:
+            return tool_name
+        return _concurrency_classes.get(tool_name, tool_name)
+
+    def limit_for(self, tool_name: str) -> int:
+        """Return the concurrency limit that applies to a tool."""
+        return self.tool_limits.get(self.limit_key(tool_name), self.default_limit)
+
+    def _get_pool(self) -> ThreadPoolExecutor:
+        with self._lock:
+            if self._pool is None:
+                self._pool = ThreadPoolExecutor(
+                    max_workers=self.max_workers,
+                    thread_name_prefix="futureagi-mcp",
+                )
+            return self._pool
+
+    def _get_semaphore(
+        self, loop: asyncio.AbstractEventLoop, tool_name: str
+    ) -> asyncio.Semaphore:
+        semaphores = self._semaphores.setdefault(loop, {})
+        key = self.limit_key(tool_name)
+        semaphore = semaphores.get(key)
+        if semaphore is None:
+            semaphore = asyncio.Semaphore(self.limit_for(tool_name))
+            semaphores[key] = semaphore
+        return semaphore
+
+    @contextlib.asynccontextmanager
+    async def slot(self, tool_name: str) -> AsyncIterator[None]:
+        """Hold a slot of the concurrency limit of a tool, counted as in flight.
+
+        For tools running their blocking work on a pool of their own, so they
+        still share the limits and load reports of the other tools.
+
+        Args:
+            tool_name: Name of the tool the work belongs to, used for its limit
+        """
+        loop = asyncio.get_running_loop()
+        self.in_flight += 1
+        try:
+            async with self._get_semaphore(loop, tool_name):
+                yield
+        finally:
+            self.in_flight -= 1
+
+    async def run(self, tool_name: str, func: Callable[..., Any], *args, **kwargs):
+        """Run a blocking callable on the worker pool.
+
+        Args:
+            tool_name: Name of the tool the call belongs to, used for its limit
+            func: Blocking callable to run
+            *args: Positional arguments for the callable
+            **kwargs: Keyword arguments for the callable
+
+        Returns:
+            The value returned by the callable
+        """
+        loop = asyncio.get_running_loop()
+        with tracer.span(
+            f"run_blocking {getattr(func, '__qualname__', func)}", tool=tool_name
+        ):
+            # Copied once the span is current, SDK requests become its children
+            context = contextvars.copy_context()
+            call = functools.partial(context.run, func, *args, **kwargs)
+            async with self.slot(tool_name):
+                return await loop.run_in_executor(self._get_pool(), call)
+
+    def shutdown(self, wait: bool = True):
+        """Shut down the worker pool, cancelling queued calls."""
+        with self._lock:
+            pool, self._pool = self._pool, None
+        if pool is not None:
+            pool.shutdown(wait=wait, cancel_futures=True)
+
+
+_executor: Optional[ToolExecutor] = None
+
+
+def get_executor() -> ToolExecutor:
+    """Get the process-wide tool executor, creating it on first use."""
+    global _executor
+    if _executor is None:
+        _executor = ToolExecutor(
+            max_workers=MAX_WORKERS,
+            tool_limits={
+                **TOOL_CONCURRENCY_LIMITS,
+                **parse_concurrency_limits(TOOL_CONCURRENCY_OVERRIDES),
+            },
+        )
+    return _executor
+
+
+def configure_executor(
+    max_workers: Optional[int] = None,
+    tool_limits: Optional[Dict[str, int]] = None,
+    default_limit: Optional[int] = None,
+) -> ToolExecutor:
+    """Replace the process-wide tool executor with a new configuration.
+
+    Args:
+        max_workers: Size of the worker pool
+        tool_limits: Per-tool concurrency limits, merged over the defaults
+        default_limit: Limit for tools without an explicit entry
+
+    Returns:
+        ToolExecutor: The newly configured executor
+    """
+    global _executor
+    current = get_executor()
+    _executor = ToolExecutor(
+        max_workers=max_workers or current.max_workers,
+        tool_limits={**current.tool_limits, **(tool_limits or {})},
+        default_limit=default_limit or current.default_limit,
+    )
+    current.shutdown(wait=False)
+    return _executor
+
+
+async def run_blocking(tool_name: str, func: Callable[..., Any], *args, **kwargs):
+    """Run a blocking SDK call for a tool without blocking the event loop."""
+    return await get_executor().run(tool_name, func, *args, **kwargs)
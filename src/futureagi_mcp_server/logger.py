@@ -1,10 +1,41 @@
+import atexit
+import copy
+import json
 import logging
+import logging.config
+import logging.handlers
 import os
+import queue
+from typing import Any, Optional
 
-from .constants import LOG_FILE, LOG_LEVEL, LOGS_DIR
+from .constants import (
+    LOG_ARGUMENT_MAX_LENGTH,
+    LOG_FILE,
+    LOG_FORMAT,
+    LOG_LEVEL,
+    LOG_QUEUE,
+)
+
+LOGGER_NAME = "futureagi-mcp"
+
+
+class JsonFormatter(logging.Formatter):
+    """Format records as one JSON object per line."""
+
+    def format(self, record: logging.LogRecord) -> str:
+        entry = {
+            "timestamp": self.formatTime(record),
+            "level": record.levelname,
+            "logger": record.name,
+            "message": record.getMessage(),
+            "module": record.module,
+            "function": record.funcName,
+            "line": record.lineno,
+        }
+        if record.exc_info:
+            entry["exception"] = self.formatException(record.exc_info)
+        return json.dumps(entry, default=str)
 
-# Create logs directory if it doesn't exist
-os.makedirs(LOGS_DIR, exist_ok=True)
 
 MCP_LOGGING = {
     "version": 1,
@@ -18,6 +49,9 @@ MCP_LOGGING = {
             "format": "{levelname} {message}",
             "style": "{",
         },
+        "json": {
+            "()": JsonFormatter,
+        },
     },
     "handlers": {
         "submodule_file": {
@@ -26,12 +60,12 @@ MCP_LOGGING = {
             "filename": LOG_FILE,
             "maxBytes": 1024 * 1024 * 5,  # 5MB
             "backupCount": 7,
-            "formatter": "verbose",
+            "formatter": "json" if LOG_FORMAT == "json" else "verbose",
         },
         "console": {
             "level": LOG_LEVEL,
             "class": "logging.StreamHandler",
-            "formatter": "simple",
+            "formatter": "json" if LOG_FORMAT == "json" else "simple",
         },
     },
     "loggers": {
@@ -40,25 +74,142 @@ MCP_LOGGING = {
             "level": LOG_LEVEL,
             "propagate": True,
         },
+        LOGGER_NAME: {
+            "handlers": ["submodule_file", "console"],
+            "level": LOG_LEVEL,
+            "propagate": True,
+        },
     },
 }
 
 
-def setup_logging(config=None):
+class _DeferredQueueHandler(logging.handlers.QueueHandler):
+    """Queue handler leaving the formatting to the listener thread.
+
+    Only the message is rendered before the record is queued, as its
+    arguments may change afterwards. Formatters, exception tracebacks and
+    disk writes all run on the listener thread.
+    """
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        record = copy.copy(record)
+        record.msg = record.getMessage()
+        record.args = None
+        return record
+
+
+_listener: Optional[logging.handlers.QueueListener] = None
+
+
+def stop_logging():
+    """Stop the background writer after it wrote the records still queued."""
+    global _listener
+    if _listener is not None:
+        _listener.stop()
+        _listener = None
+
+
+def _use_queue(logger_names):
+    """Move the handlers of the loggers behind a single queue and listener."""
+    global _listener
+    stop_logging()
+    handlers = []
+    for name in logger_names:
+        for handler in logging.getLogger(name).handlers:
+            if handler not in handlers:
+                handlers.append(handler)
+    if not handlers:
+        return
+    records = queue.SimpleQueue()
+    queue_handler = _DeferredQueueHandler(records)
+    for name in logger_names:
+        target = logging.getLogger(name)
+        target.handlers = [queue_handler]
+    _listener = logging.handlers.QueueListener(
+        records, *handlers, respect_handler_level=True
+    )
+    _listener.start()
+
+
+atexit.register(stop_logging)
+
+
+def _create_log_dirs(config):
+    """Create the directories of the log files, which are not kept in git."""
+    for handler in config.get("handlers", {}).values():
+        filename = handler.get("filename")
+        if filename:
+            os.makedirs(os.path.dirname(filename) or ".", exist_ok=True)
+
+
+def setup_logging(config=None, use_queue: bool = LOG_QUEUE):
     """Configure logging for the application.
 
     Args:
         config: Optional logging configuration dictionary. If not provided,
                uses the default MCP_LOGGING configuration.
+        use_queue: Write records from a background thread, so that disk and
+               console writes never block the event loop
     """
-    if config:
-        logging.config.dictConfig(config)
-    else:
-        logging.config.dictConfig(MCP_LOGGING)
+    config = config or MCP_LOGGING
+    stop_logging()
+    _create_log_dirs(config)
+    logging.config.dictConfig(config)
+    if use_queue:
+        _use_queue(list(config.get("loggers", {})))
+
+
+class ArgumentSummary:
+    """Size-bounded rendering of tool arguments, built only when logged.
+
+    Pass it as a logging argument: long strings are cut to ``max_length``
+    characters and long lists to their first items, so base64 payloads or
+    large batches never end up in full in the logs.
+    """
+
+    __slots__ = ("value", "max_length", "max_items")
+
+    def __init__(
+        self,
+        value: Any,
+        max_length: int = LOG_ARGUMENT_MAX_LENGTH,
+        max_items: int = 10,
+    ):
+        self.value = value
+        self.max_length = max_length
+        self.max_items = max_items
+
+    def _summarize(self, value: Any) -> Any:
+        if isinstance(value, str):
+            if len(value) > self.max_length:
+                return f"{value[:self.max_length]}...({len(value)} chars)"
+            return value
+        if isinstance(value, dict):
+            items = list(value.items())
+            summary = {
+                key: self._summarize(item) for key, item in items[: self.max_items]
+            }
+            if len(items) > self.max_items:
+                summary["..."] = f"{len(items)} keys"
+            return summary
+        if isinstance(value, (list, tuple)):
+            summary = [self._summarize(item) for item in value[: self.max_items]]
+            if len(value) > self.max_items:
+                summary.append(f"...({len(value)} items)")
+            return summary
+        return value
+
+    def __str__(self) -> str:
+        return str(self._summarize(self.value))
+
+
+def summarize(value: Any) -> ArgumentSummary:
+    """Wrap a value so it is logged as a size-bounded summary."""
+    return ArgumentSummary(value)
 
 
 # Global logger setup for the submodule
-submodule_logger = logging.getLogger("futureagi-mcp")
+submodule_logger = logging.getLogger(LOGGER_NAME)
 
 
 def get_logger():
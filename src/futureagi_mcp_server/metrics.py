@@ -0,0 +1,312 @@
+"""Per-tool call metrics and cache statistics, exposed as the server_stats
+tool and on /metrics.
+
+Metrics are recorded from the event loop thread only, so recording is a few
+counter increments and a bisect into fixed histogram buckets, without locks.
+Percentiles are estimated from the buckets when the metrics are read.
+"""
+
+import time
+from bisect import bisect_left
+from typing import Any, Dict, Iterable, List, Optional
+
+from .executor import get_executor
+
+# Upper bounds of the latency buckets, in seconds
+LATENCY_BUCKETS = (
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+    2.5,
+    5.0,
+    10.0,
+    30.0,
+    60.0,
+    120.0,
+    300.0,
+)
+
+# Upper bounds of the payload size buckets, in bytes
+SIZE_BUCKETS = (
+    256,
+    1024,
+    4096,
+    16384,
+    65536,
+    262144,
+    1048576,
+    4194304,
+    16777216,
+)
+
+METRIC_PREFIX = "futureagi_mcp"
+
+
+class Histogram:
+    """Cumulative histogram over fixed buckets, as exposed by Prometheus.
+
+    Args:
+        bounds: Sorted upper bounds of the buckets, a last bucket holds the rest
+    """
+
+    __slots__ = ("bounds", "counts", "count", "sum", "max")
+
+    def __init__(self, bounds: Iterable[float]):
+        self.bounds = tuple(bounds)
+        self.counts = [0] * (len(self.bounds) + 1)
+        self.count = 0
+        self.sum = 0.0
+        self.max = 0.0
+
+    def observe(self, value: float):
+        self.counts[bisect_left(self.bounds, value)] += 1
+        self.count += 1
+        self.sum += value
+        if value > self.max:
+            self.max = value
+
+    def quantile(self, q: float) -> float:
+        """Estimate the q-quantile by interpolating inside its bucket."""
+        if not self.count:
+            return 0.0
+        rank = q * self.count
+        cumulative = 0
+        for index, count in enumerate(self.counts):
+            if count and cumulative + count >= rank:
+                lower = self.bounds[index - 1] if index else 0.0
+                upper = self.bounds[index] if index < len(self.bounds) else self.max
+                upper = min(upper, self.max)
+                return lower + (upper - lower) * (rank - cumulative) / count
+            cumulative += count
+        return self.max
+
+    def cumulative_counts(self) -> List[tuple]:
+        """Return (upper bound, observations at or below it) per bucket."""
+        buckets = []
+        cumulative = 0
+        for bound, count in zip(self.bounds + (float("inf"),), self.counts):
+            cumulative += count
+            buckets.append((bound, cumulative))
+        return buckets
+
+
+class ToolMetrics:
+    """Counters, gauges and histograms of a single tool."""
+
+    __slots__ = (
+        "calls",
+        "errors",
+        "in_flight",
+        "latency",
+        "request_bytes",
+        "response_bytes",
+    )
+
+    def __init__(self):
+        self.calls = 0
+        self.errors = 0
+        self.in_flight = 0
+        self.latency = Histogram(LATENCY_BUCKETS)
+        self.request_bytes = Histogram(SIZE_BUCKETS)
+        self.response_bytes = Histogram(SIZE_BUCKETS)
+
+    def begin(self, request_bytes: int) -> float:
+        """Record the start of a call, returning its start time."""
+        self.calls += 1
+        self.in_flight += 1
+        self.request_bytes.observe(request_bytes)
+        return time.perf_counter()
+
+    def end(self, started_at: float, error: bool, response_bytes: int = 0):
+        """Record the end of a call started at started_at."""
+        self.in_flight -= 1
+        self.latency.observe(time.perf_counter() - started_at)
+        if error:
+            self.errors += 1
+        else:
+            self.response_bytes.observe(response_bytes)
+
+    def snapshot(self) -> Dict[str, Any]:
+        latency = self.latency
+        return {
+            "calls": self.calls,
+            "errors": self.errors,
+            "in_flight": self.in_flight,
+            "latency_ms": {
+                "p50": round(latency.quantile(0.5) * 1000, 3),
+                "p95": round(latency.quantile(0.95) * 1000, 3),
+                "p99": round(latency.quantile(0.99) * 1000, 3),
+                "max": round(latency.max * 1000, 3),
+                "mean": round(latency.sum / latency.count * 1000, 3)
+                if latency.count
+                else 0.0,
+            },
+            "request_bytes": {
+                "total": int(self.request_bytes.sum),
+                "max": int(self.request_bytes.max),
+            },
+            "response_bytes": {
+                "total": int(self.response_bytes.sum),
+                "max": int(self.response_bytes.max),
+            },
+        }
+
+
+# Items of a list measured before the size of the others is extrapolated
+PAYLOAD_SAMPLE_ITEMS = 32
+
+
+def payload_size(value: Any) -> int:
+    """Estimate the size in bytes of a value encoded as compact JSON.
+
+    Nothing is encoded: strings count their length, so a base64 image costs
+    a single len(), and only the first items of long lists are measured, the
+    size of the others is extrapolated from them. The estimate is exact for
+    ASCII values without escapes and lists of at most PAYLOAD_SAMPLE_ITEMS.
+    """
+    if isinstance(value, str):
+        return len(value) + 2
+    if isinstance(value, dict):
+        size = 2 + max(2 * len(value) - 1, 0)
+        for key, item in value.items():
+            size += len(str(key)) + 2 + payload_size(item)
+        return size
+    if isinstance(value, (list, tuple)):
+        count = len(value)
+        size = 2 + max(count - 1, 0)
+        if count <= PAYLOAD_SAMPLE_ITEMS:
+            return size + sum(payload_size(item) for item in value)
+        sample = sum(payload_size(item) for item in value[:PAYLOAD_SAMPLE_ITEMS])
+        return size + sample * count // PAYLOAD_SAMPLE_ITEMS
+    if value is None or value is True:
+        return 4
+    if value is False:
+        return 5
+    if isinstance(value, (int, float)):
+        return len(repr(value))
+    return len(str(value)) + 2
+
+
+def is_error_result(result: Any) -> bool:
+    """Tell whether a tool returned its error instead of raising it."""
+    return isinstance(result, dict) and (
+        "error" in result or result.get("status") == "error"
+    )
+
+
+class MetricsRegistry:
+    """Metrics of every tool called since the server started."""
+
+    def __init__(self):
+        self.tools: Dict[str, ToolMetrics] = {}
+        self.caches: Dict[str, Any] = {}
+        self.started_at = time.time()
+
+    def tool(self, name: str) -> ToolMetrics:
+        """Return the metrics of a tool, creating them on its first call."""
+        tool_metrics = self.tools.get(name)
+        if tool_metrics is None:
+            tool_metrics = self.tools[name] = ToolMetrics()
+        return tool_metrics
+
+    def register_cache(self, name: str, cache: Any):
+        """Report the statistics of a cache, any object with a ``stats()`` method."""
+        self.caches[name] = cache
+
+    def reset(self):
+        self.tools.clear()
+        self.started_at = time.time()
+
+    def snapshot(self) -> Dict[str, Any]:
+        """Return the metrics of every tool with latency percentiles."""
+        return {
+            "uptime_seconds": round(time.time() - self.started_at, 3),
+            "tools": {
+                name: tool_metrics.snapshot()
+                for name, tool_metrics in sorted(self.tools.items())
+            },
+            "caches": {
+                name: cache.stats() for name, cache in sorted(self.caches.items())
+            },
+        }
+
+    def render_prometheus(self, labels: Optional[Dict[str, str]] = None) -> str:
+        """Render the metrics in the Prometheus text exposition format.
+
+        Args:
+            labels: Labels added to every sample, e.g. the worker id
+
+        Returns:
+            str: Metrics ready to be served to a Prometheus scraper
+        """
+        extra = "".join(f',{key}="{value}"' for key, value in (labels or {}).items())
+        lines = []
+
+        def header(name: str, kind: str, help_text: str) -> str:
+            lines.append(f"# HELP {METRIC_PREFIX}_{name} {help_text}")
+            lines.append(f"# TYPE {METRIC_PREFIX}_{name} {kind}")
+            return f"{METRIC_PREFIX}_{name}"
+
+        tools = sorted(self.tools.items())
+        for name, attribute, kind, help_text in (
+            ("tool_calls_total", "calls", "counter", "Tool calls received."),
+            ("tool_errors_total", "errors", "counter", "Tool calls that failed."),
+            ("tool_in_flight", "in_flight", "gauge", "Tool calls running."),
+        ):
+            metric = header(name, kind, help_text)
+            for tool, tool_metrics in tools:
+                value = getattr(tool_metrics, attribute)
+                lines.append(f'{metric}{{tool="{tool}"{extra}}} {value}')
+
+        for name, attribute, help_text in (
+            ("tool_duration_seconds", "latency", "Duration of tool calls."),
+            ("tool_request_size_bytes", "request_bytes", "Size of tool arguments."),
+            ("tool_response_size_bytes", "response_bytes", "Size of tool results."),
+        ):
+            metric = header(name, "histogram", help_text)
+            for tool, tool_metrics in tools:
+                histogram = getattr(tool_metrics, attribute)
+                for bound, count in histogram.cumulative_counts():
+                    le = "+Inf" if bound == float("inf") else f"{bound:g}"
+                    lines.append(
+                        f'{metric}_bucket{{tool="{tool}"{extra},le="{le}"}} {count}'
+                    )
+                lines.append(f'{metric}_sum{{tool="{tool}"{extra}}} {histogram.sum}')
+                lines.append(
+                    f'{metric}_count{{tool="{tool}"{extra}}} {histogram.count}'
+                )
+
+        caches = [(name, cache.stats()) for name, cache in sorted(self.caches.items())]
+        for name, key, kind, help_text in (
+            ("cache_hits_total", "hits", "counter", "Lookups served from memory."),
+            (
+                "cache_shared_hits_total",
+                "shared_hits",
+                "counter",
+                "Lookups served from the shared or on-disk tier.",
+            ),
+            ("cache_misses_total", "misses", "counter", "Lookups not cached."),
+            ("cache_hit_ratio", "hit_rate", "gauge", "Share of lookups served."),
+            ("cache_entries", "size", "gauge", "Entries held in memory."),
+        ):
+            metric = header(name, kind, help_text)
+            for cache, stats in caches:
+                lines.append(f'{metric}{{cache="{cache}"{extra}}} {stats[key]}')
+
+        metric = header("uptime_seconds", "gauge", "Seconds since the server started.")
+        selector = f"{{{extra.lstrip(',')}}}" if extra else ""
+        lines.append(f"{metric}{selector} {time.time() - self.started_at:.3f}")
+        return "\n".join(lines) + "\n"
+
+
+metrics = MetricsRegistry()
+
+
+async def server_stats() -> Dict[str, Any]:
+    """Return the call metrics of every tool served by this process."""
+    return {**metrics.snapshot(), "in_flight_calls": get_executor().in_flight}
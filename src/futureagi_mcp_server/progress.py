@@ -0,0 +1,145 @@
+"""Progress notifications and partial results for long running tools."""
+
+import contextvars
+import weakref
+from contextlib import contextmanager
+from typing import Any, Optional
+
+import mcp.types as types
+
+from .logger import get_logger
+
+logger = get_logger()
+
+# Logger name attached to partial result messages so clients can pick them out
+PARTIAL_RESULTS_LOGGER = "futureagi-mcp.partial-results"
+
+_LOG_LEVELS = [
+    "debug",
+    "info",
+    "notice",
+    "warning",
+    "error",
+    "critical",
+    "alert",
+    "emergency",
+]
+
+# Minimum log level requested by each session through logging/setLevel
+_session_log_levels = weakref.WeakKeyDictionary()
+
+
+def set_session_log_level(session: Any, level: types.LoggingLevel):
+    """Record the minimum log level a client asked to receive."""
+    _session_log_levels[session] = level
+
+
+def _level_enabled(session: Any, level: types.LoggingLevel) -> bool:
+    minimum = _session_log_levels.get(session, "debug")
+    return _LOG_LEVELS.index(level) >= _LOG_LEVELS.index(minimum)
+
+
+class ProgressReporter:
+    """Send progress and partial results for the tool call being handled.
+
+    Notifications are only sent when the client asked for them by passing a
+    progress token with its request. Otherwise every method is a no-op, so
+    tools can report progress unconditionally.
+    """
+
+    def __init__(
+        self,
+        session: Any = None,
+        progress_token: Optional[types.ProgressToken] = None,
+        tool_name: Optional[str] = None,
+    ):
+        self.session = session
+        self.progress_token = progress_token
+        self.tool_name = tool_name
+
+    @classmethod
+    def from_request_context(cls, request_context: Any, tool_name: str):
+        """Build a reporter from the MCP request context of a tool call."""
+        meta = request_context.meta
+        progress_token = meta.progressToken if meta is not None else None
+        return cls(request_context.session, progress_token, tool_name)
+
+    @property
+    def enabled(self) -> bool:
+        return self.session is not None and self.progress_token is not None
+
+    async def update(
+        self,
+        progress: float,
+        total: Optional[float] = None,
+        message: Optional[str] = None,
+    ):
+        """Send a progress notification.
+
+        Args:
+            progress: Progress so far, must increase with every update
+            total: Total amount of work, if known
+            message: Human readable description of the current step
+        """
+        if not self.enabled:
+            return
+        # Older protocol revisions have no message field, it is sent as an extra
+        extra = {"message": message} if message is not None else {}
+        params = types.ProgressNotificationParams(
+            progressToken=self.progress_token, progress=progress, total=total, **extra
+        )
+        try:
+            await self.session.send_notification(
+                types.ServerNotification(
+                    types.ProgressNotification(
+                        method="notifications/progress", params=params
+                    )
+                )
+            )
+        except Exception as e:
+            # Progress is best effort, it must never fail the tool call
+            logger.debug("Failed to send progress notification: %s", e)
+
+    async def partial_result(self, data: Any):
+        """Send a partial result as a log message notification.
+
+        The message carries the progress token so the client can tie it to
+        the request it belongs to.
+
+        Args:
+            data: JSON serializable partial result
+        """
+        if not self.enabled or not _level_enabled(self.session, "info"):
+            return
+        try:
+            await self.session.send_log_message(
+                level="info",
+                data={
+                    "progressToken": self.progress_token,
+                    "tool": self.tool_name,
+                    "partial_result": data,
+                },
+                logger=PARTIAL_RESULTS_LOGGER,
+            )
+        except Exception as e:
+            logger.debug("Failed to send partial result: %s", e)
+
+
+_current_reporter = contextvars.ContextVar(
+    "futureagi_mcp_progress_reporter", default=ProgressReporter()
+)
+
+
+def get_progress_reporter() -> ProgressReporter:
+    """Get the progress reporter of the tool call being handled."""
+    return _current_reporter.get()
+
+
+@contextmanager
+def progress_scope(reporter: ProgressReporter):
+    """Make reporter the progress reporter for the enclosed tool call."""
+    token = _current_reporter.set(reporter)
+    try:
+        yield reporter
+    finally:
+        _current_reporter.reset(token)
@@ -0,0 +1,768 @@
+"""Registry of the tools exposed by the FutureAGI MCP server.
+
+Every tool is described by a ``ToolSpec`` that holds its schema, its handler
+and the policies applied when it is called. ``tools/list`` and ``tools/call``
+are both served from the same registry.
+"""
+
+import asyncio
+import importlib
+from dataclasses import dataclass
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Type, Union
+
+import mcp.types as types
+from pydantic import BaseModel, ValidationError
+
+from . import cache  # noqa: F401  registers the cache statistics with metrics
+from .constants import TOOL_TIMEOUT
+from .executor import register_concurrency_class, run_blocking
+from .metrics import is_error_result, metrics, payload_size
+from .serialization import FIELDS_PROPERTY, project_fields, serialize_result
+from .tools.descriptions import (
+    ADD_EVALUATION_TO_DATASET_DESCRIPTION,
+    ALL_EVALUATORS_DESCRIPTION,
+    CREATE_EVAL_DESCRIPTION,
+    DATASET_EVALUATION_INSIGHTS_DESCRIPTION,
+    DOWNLOAD_DATASET_DESCRIPTION,
+    EVALUATE_DESCRIPTION,
+    GENERATE_SYNTHETIC_DATA_DESCRIPTION,
+    GET_EVAL_STRUCTURE_DESCRIPTION,
+    GET_EVALS_LIST_FOR_CREATE_EVAL_DESCRIPTION,
+    PROTECT_BATCH_DESCRIPTION,
+    PROTECT_DESCRIPTION,
+    SEARCH_EVALUATORS_DESCRIPTION,
+    SERVER_STATS_DESCRIPTION,
+    UPLOAD_DATASET_DESCRIPTION,
+)
+from .tracing import record_error, tracer
+from .validation import input_model, invalid_arguments
+
+# Arguments the MCP session uses to serialize every response
+_SESSION_DUMP_KWARGS = {"by_alias": True, "mode": "json", "exclude_none": True}
+
+# Schema of the rules checked by the protect tools
+PROTECT_RULES_PROPERTY = {
+    "type": "array",
+    "description": "List of protection rules",
+    "items": {
+        "type": "object",
+        "properties": {
+            "metric": {
+                "type": "string",
+                "enum": [
+                    "Toxicity",
+                    "Tone",
+                    "Sexism",
+                    "Prompt Injection",
+                    "Data Privacy",
+                ],
+            },
+            "contains": {
+                "type": "array",
+                "items": {
+                    "type": "string",
+                    "enum": [
+                        "neutral",
+                        "joy",
+                        "love",
+                        "fear",
+                        "surprise",
+                        "sadness",
+                        "anger",
+                        "annoyance",
+                        "confusion",
+                    ],
+                },
+            },
+            "type": {
+                "type": "string",
+                "enum": ["any", "all"],
+            },
+        },
+        "required": ["metric"],
+    },
+}
+
+EVALUATE_OUTPUT_PREAMBLE = """
+Convert the output to MARKDOWN.md code block format (this is mandatory).
+Do not use plain text, lists, or any other format.
+Try to represent the output in a table format within the markdown code block.
+"""
+
+
+@dataclass(frozen=True)
+class ToolSpec:
+    """Declarative description of a tool and its call policies.
+
+    Attributes:
+        tool: Schema advertised through tools/list
+        handler: Coroutine function implementing the tool, or its
+            "module:function" path, imported on the first call
+        serializer: Converts the handler result to text
+        concurrency: Class of tools sharing one concurrency limit, defaults to the tool name
+        timeout: Seconds before a call is abandoned, None uses TOOL_TIMEOUT
+        preamble: Instructions sent to the client ahead of the result
+        projectable: Whether callers may pass "fields" to keep only some keys
+            of the result
+        input_model: Model the arguments are validated with before the
+            handler runs, None builds it from the input schema of the tool
+    """
+
+    tool: types.Tool
+    handler: Union[Callable[..., Awaitable[Any]], str]
+    serializer: Callable[[Any], str] = serialize_result
+    concurrency: Optional[str] = None
+    timeout: Optional[float] = None
+    preamble: Optional[str] = None
+    projectable: bool = False
+    input_model: Optional[Type[BaseModel]] = None
+
+    @property
+    def name(self) -> str:
+        return self.tool.name
+
+    def resolve_handler(self) -> Callable[..., Awaitable[Any]]:
+        """Return the handler, importing its module if given by path."""
+        if callable(self.handler):
+            return self.handler
+        return _import_handler(self.handler)
+
+
+# Handlers already imported, keyed by their "module:function" path
+_handlers: Dict[str, Callable[..., Awaitable[Any]]] = {}
+
+
+def _import_handler(path: str) -> Callable[..., Awaitable[Any]]:
+    handler = _handlers.get(path)
+    if handler is None:
+        module_name, _, function_name = path.partition(":")
+        module = importlib.import_module(module_name, package=__package__)
+        handler = _handlers[path] = getattr(module, function_name)
+    return handler
+
+
+def build_tool_specs() -> List[ToolSpec]:
+    """Build the tool specs, validating every schema with pydantic."""
+    return [
+        ToolSpec(
+            tool=types.Tool(
+                name="get_eval_structure",
+                description=GET_EVAL_STRUCTURE_DESCRIPTION,
+                inputSchema={
+                    "type": "object",
+                    "properties": {
+                        "template_id": {
+                            "type": "string",
+                            "description": "UUID of the evaluation template",
+                        },
+                        "fields": FIELDS_PROPERTY,
+                    },
+                    "required": ["template_id"],
+                },
+            ),
+            handler=".tools.evals:get_eval_structure",
+            concurrency="catalog",
+            projectable=True,
+        ),
+        ToolSpec(
+            tool=types.Tool(
+                name="get_evals_list_for_create_eval",
+                description=GET_EVALS_LIST_FOR_CREATE_EVAL_DESCRIPTION,
+                inputSchema={
+                    "type": "object",
+                    "properties": {
+                        "eval_type": {
+                            "type": "string",
+                            "description": "Type of evaluation templates to retrieve ('preset' or 'user')",
+                        },
+                        "fields": FIELDS_PROPERTY,
+                    },
+                    "required": ["eval_type"],
+                },
+            ),
+            handler=".tools.evals:get_evals_list_for_create_eval",
+            concurrency="catalog",
+            projectable=True,
+        ),
+        ToolSpec(
+            tool=types.Tool(
+                name="create_eval",
+                description=CREATE_EVAL_DESCRIPTION,
+                inputSchema={
+                    "type": "object",
+                    "properties": {
+                        "eval_name": {
+                            "type": "string",
+                            "description": "Name for the new evaluation template",
+                        },
+                        "template_id": {
+                            "type": "string",
+                            "description": "UUID of the base evaluation template to use",
+                        },
+                        "config": {
+                            "type": "object",
+                            "description": "Configuration for the new template",
+                        },
+                    },
+                    "required": ["eval_name", "template_id", "config"],
+                },
+            ),
+            handler=".tools.evals:create_eval",
+        ),
+        ToolSpec(
+            tool=types.Tool(
+                name="evaluate",
+                description=EVALUATE_DESCRIPTION,
+                inputSchema={
+                    "type": "object",
+                    "properties": {
+                        "eval_templates": {
+                            "type": "array",
+                            "description": "List of evaluation templates to use",
+                            "items": {
+                                "type": "object",
+                                "properties": {
+                                    "eval_id": {"type": "string"},
+                                    "config": {
+                                        "type": "object",
+                                        "description": "Additional configuration parameters",
+                                        "properties": {
+                                            "criteria": {"type": "string"},
+                                            "model": {"type": "string"},
+                                        },
+                                        "required": [],
+                                    },
+                                },
+                                "required": ["eval_id", "config"],
+                            },
+                        },
+                        "inputs": {
+                            "type": "array",
+                            "description": "List of test cases to evaluate",
+                            "items": {
+                                "type": "object",
+                                "properties": {
+                                    "text": {"type": "string"},
+                                    "output": {"type": "string"},
+                                    "prompt": {"type": "string"},
+                                    "criteria": {"type": "string"},
+                                },
+                            },
+                        },
+                        "chunk_size": {
+                            "type": "integer",
+                            "description": "Maximum number of inputs evaluated per upstream request",
+                        },
+                        "max_in_flight": {
+                            "type": "integer",
+                            "description": "Maximum number of chunks evaluated concurrently",
+                        },
+                        "cache": {
+                            "type": "boolean",
+                            "description": "Reuse the results of rows already evaluated with the same templates and config, defaults to FI_MCP_EVALUATE_CACHE",
+                        },
+                        "fields": FIELDS_PROPERTY,
+                    },
+                    "required": ["eval_templates", "inputs"],
+                },
+            ),
+            handler=".tools.evals:evaluate",
+            concurrency="evaluation",
+            preamble=EVALUATE_OUTPUT_PREAMBLE,
+            projectable=True,
+        ),
+        ToolSpec(
+            tool=types.Tool(
+                name="all_evaluators",
+                description=ALL_EVALUATORS_DESCRIPTION,
+                inputSchema={
+                    "type": "object",
+                    "properties": {
+                        "fields": FIELDS_PROPERTY,
+                        "tags": {
+                            "type": "array",
+                            "items": {"type": "string"},
+                            "description": "Only return evaluators carrying all of these tags, e.g. ['TEXT', 'SAFETY']",
+                        },
+                        "search": {
+                            "type": "string",
+                            "description": "Words that must each start a word of the evaluator name, description or tags",
+                        },
+                        "limit": {
+                            "type": "integer",
+                            "description": "Maximum number of evaluators to return",
+                        },
+                        "cursor": {
+                            "type": "string",
+                            "description": "next_cursor returned with the previous page",
+                        },
+                    },
+                    "required": [],
+                },
+            ),
+            handler=".tools.evals:all_evaluators",
+            concurrency="catalog",
+        ),
+        ToolSpec(
+            tool=types.Tool(
+                name="search_evaluators",
+                description=SEARCH_EVALUATORS_DESCRIPTION,
+                inputSchema={
+                    "type": "object",
+                    "properties": {
+                        "tags": {
+                            "type": "array",
+                            "items": {"type": "string"},
+                            "description": "Only evaluators carrying all of these tags, e.g. ['RAG']",
+                        },
+                        "required_keys": {
+                            "type": "array",
+                            "items": {"type": "string"},
+                            "description": "Only evaluators requiring all of these keys",
+                        },
+                        "available_keys": {
+                            "type": "array",
+                            "items": {"type": "string"},
+                            "description": "Only evaluators whose required keys are all in this list, e.g. ['input', 'context']",
+                        },
+                        "query": {
+                            "type": "string",
+                            "description": "Words that must each start a word of the evaluator name, description or tags",
+                        },
+                        "fields": FIELDS_PROPERTY,
+                        "limit": {
+                            "type": "integer",
+                            "description": "Maximum number of evaluators to return",
+                        },
+                    },
+                    "required": [],
+                },
+            ),
+            handler=".tools.evals:search_evaluators",
+            concurrency="catalog",
+        ),
+        ToolSpec(
+            tool=types.Tool(
+                name="upload_dataset",
+                description=UPLOAD_DATASET_DESCRIPTION,
+                inputSchema={
+                    "type": "object",
+                    "properties": {
+                        "dataset_name": {
+                            "type": "string",
+                            "description": "Name of the dataset to create",
+                        },
+                        "model_type": {
+                            "type": "string",
+                            "description": "Type of model (e.g., 'GenerativeLLM', 'GenerativeImage')",
+                            "enum": [
+                                "GenerativeLLM",
+                                "GenerativeImage",
+                            ],
+                        },
+                        "source": {
+                            "type": "string",
+                            "description": "Source file path for the dataset (local file path or URL) if not provided, the empty dataset will be created in the FutureAGI platform",
+                        },
+                    },
+                    "required": ["dataset_name", "model_type"],
+                },
+            ),
+            handler=".tools.datasets:upload_dataset",
+            concurrency="dataset_transfer",
+        ),
+        ToolSpec(
+            tool=types.Tool(
+                name="add_evaluation_to_dataset",
+                description=ADD_EVALUATION_TO_DATASET_DESCRIPTION,
+                inputSchema={
+                    "type": "object",
+                    "properties": {
+                        "dataset_name": {
+                            "type": "string",
+                            "description": "Name of the target dataset",
+                        },
+                        "name": {
+                            "type": "string",
+                            "description": "Name for the new evaluation column",
+                        },
+                        "eval_id": {
+                            "type": "string",
+                            "description": "eval_id for the evaluation template, example: '1', '9', '11'",
+                        },
+                        "required_keys_to_column_names": {
+                            "type": "object",
+                            "description": "A dictionary mapping required keys of the eval template to column names in the dataset",
+                        },
+                        "save_as_template": {
+                            "type": "boolean",
+                            "description": "Whether to save as a template",
+                        },
+                        "reason_column": {
+                            "type": "boolean",
+                            "description": "Whether to add a reason column",
+                        },
+                        "config": {
+                            "type": "object",
+                            "description": "Additional configuration parameters, use the config['config'] dictionary in the eval template structure",
+                        },
+                    },
+                    "required": [
+                        "dataset_name",
+                        "name",
+                        "eval_id",
+                        "required_keys_to_column_names",
+                        "config",
+                    ],
+                },
+            ),
+            handler=".tools.datasets:add_evaluation_to_dataset",
+        ),
+        ToolSpec(
+            tool=types.Tool(
+                name="protect",
+                description=PROTECT_DESCRIPTION,
+                inputSchema={
+                    "type": "object",
+                    "properties": {
+                        "inputs": {
+                            "type": "string",
+                            "description": "Input string to evaluate",
+                        },
+                        "protect_rules": PROTECT_RULES_PROPERTY,
+                        "action": {
+                            "type": "string",
+                            "description": "Default action message when rules fail",
+                        },
+                        "reason": {
+                            "type": "boolean",
+                            "description": "Whether to include failure reason",
+                        },
+                        "timeout": {
+                            "type": "integer",
+                            "description": "Timeout for evaluations in milliseconds",
+                        },
+                        "prefilter": {
+                            "type": "boolean",
+                            "description": "Fail obvious personal data and prompt injections locally before calling the API",
+                        },
+                    },
+                    "required": ["inputs", "protect_rules"],
+                },
+            ),
+            handler=".tools.protect:protect",
+            concurrency="protect",
+        ),
+        ToolSpec(
+            tool=types.Tool(
+                name="protect_batch",
+                description=PROTECT_BATCH_DESCRIPTION,
+                inputSchema={
+                    "type": "object",
+                    "properties": {
+                        "inputs": {
+                            "type": "array",
+                            "items": {"type": "string"},
+                            "description": "Input strings to evaluate",
+                        },
+                        "protect_rules": PROTECT_RULES_PROPERTY,
+                        "action": {
+                            "type": "string",
+                            "description": "Default action message when rules fail",
+                        },
+                        "reason": {
+                            "type": "boolean",
+                            "description": "Whether to include failure reason",
+                        },
+                        "timeout": {
+                            "type": "integer",
+                            "description": "Deadline for the whole batch in milliseconds",
+                        },
+                        "max_in_flight": {
+                            "type": "integer",
+                            "description": "Maximum number of inputs screened concurrently",
+                        },
+                        "prefilter": {
+                            "type": "boolean",
+                            "description": "Fail obvious personal data and prompt injections locally before calling the API",
+                        },
+                    },
+                    "required": ["inputs", "protect_rules"],
+                },
+            ),
+            handler=".tools.protect:protect_batch",
+            concurrency="protect",
+        ),
+        ToolSpec(
+            tool=types.Tool(
+                name="download_dataset",
+                description=DOWNLOAD_DATASET_DESCRIPTION,
+                inputSchema={
+                    "type": "object",
+                    "properties": {
+                        "dataset_name": {
+                            "type": "string",
+                            "description": "Name of the dataset to download",
+                        },
+                        "file_path": {
+                            "type": "string",
+                            "description": "Path to save the downloaded dataset",
+                        },
+                    },
+                    "required": ["dataset_name", "file_path"],
+                },
+            ),
+            handler=".tools.datasets:download_dataset",
+            concurrency="dataset_transfer",
+        ),
+        ToolSpec(
+            tool=types.Tool(
+                name="get_evaluation_insights",
+                description=DATASET_EVALUATION_INSIGHTS_DESCRIPTION,
+                inputSchema={
+                    "type": "object",
+                    "properties": {
+                        "dataset_name": {
+                            "type": "string",
+                            "description": "Name of the dataset to get insights",
+                        },
+                        "fields": FIELDS_PROPERTY,
+                    },
+                    "required": ["dataset_name"],
+                },
+            ),
+            handler=".tools.datasets:get_evaluation_insights",
+            projectable=True,
+        ),
+        ToolSpec(
+            tool=types.Tool(
+                name="generate_synthetic_data",
+                description=GENERATE_SYNTHETIC_DATA_DESCRIPTION,
+                inputSchema={
+                    "type": "object",
+                    "properties": {
+                        "dataset": {
+                            "type": "object",
+                            "description": "Metadata describing the dataset to be generated.",
+                            "properties": {
+                                "name": {
+                                    "type": "string",
+                                    "description": "A clear, descriptive title for your dataset. Example: 'Customer Support Logs'",
+                                },
+                                "description": {
+                                    "type": "string",
+                                    "description": "A detailed explanation of the dataset's contents, purpose, and context.",
+                                },
+                                "objective": {
+                                    "type": "string",
+                                    "description": "The main goal or intended use case for the dataset. Example: 'To fine-tune a language model for customer support scenarios.'",
+                                },
+                                "patterns": {
+                                    "type": "string",
+                                    "description": "Specific instructions or stylistic patterns to follow when generating data. Example: 'Follow a conversational pattern with alternating customer and agent messages.'",
+                                },
+                            },
+                            "required": [
+                                "name",
+                                "description",
+                                "objective",
+                                "patterns",
+                            ],
+                        },
+                        "num_rows": {
+                            "type": "integer",
+                            "description": "The total number of rows (examples) to generate in the dataset. Example: 1000.",
+                        },
+                        "columns": {
+                            "type": "array",
+                            "description": "The schema definition for each column in the dataset. Each object describes one column.",
+                            "items": {
+                                "type": "object",
+                                "properties": {
+                                    "name": {
+                                        "type": "string",
+                                        "description": "The column's name. Should be unique and descriptive. Example: 'customer_id'",
+                                    },
+                                    "description": {
+                                        "type": "string",
+                                        "description": "A detailed description of what this column represents. Example: 'The unique identifier for each customer.'",
+                                    },
+                                    "data_type": {
+                                        "type": "string",
+                                        "description": "The type of data stored in this column. Supported types: 'text', 'float', 'integer', 'boolean', 'array', 'json', 'datetime'. Example: 'integer'",
+                                    },
+                                    "property": {
+                                        "type": "object",
+                                        "description": "Additional constraints or characteristics for the column. For numeric columns: specify 'min', 'max', etc. For text columns: specify 'min_length', 'max_length', 'pattern', etc. For categorical columns: specify 'values' (list of allowed values). For all columns: add any other relevant constraints or metadata.",
+                                    },
+                                },
+                                "required": [
+                                    "name",
+                                    "description",
+                                    "data_type",
+                                    "property",
+                                ],
+                            },
+                        },
+                    },
+                    "required": ["dataset", "num_rows", "columns"],
+                },
+            ),
+            handler=".tools.syntheticdatagen:generate_synthetic_data",
+            concurrency="generation",
+        ),
+        ToolSpec(
+            tool=types.Tool(
+                name="server_stats",
+                description=SERVER_STATS_DESCRIPTION,
+                inputSchema={"type": "object", "properties": {}},
+            ),
+            handler=".metrics:server_stats",
+        ),
+    ]
+
+
+def build_tools() -> List[types.Tool]:
+    """Build the tool definitions exposed through tools/list."""
+    return [spec.tool for spec in build_tool_specs()]
+
+
+class PreserializedResult(types.ServerResult):
+    """Server result that is serialized once and reused for every response."""
+
+    def model_post_init(self, __context: Any) -> None:
+        self._dumped = super().model_dump(**_SESSION_DUMP_KWARGS)
+
+    def model_dump(self, **kwargs) -> Any:
+        if kwargs == _SESSION_DUMP_KWARGS:
+            return self._dumped
+        return super().model_dump(**kwargs)
+
+
+class ToolRegistry:
+    """Tools built once at server startup and looked up by name.
+
+    The validated ``types.Tool`` objects and the serialized ``tools/list``
+    response are kept around, so listing tools costs a lookup instead of
+    rebuilding every schema on each request.
+    """
+
+    def __init__(self, specs: Optional[List[ToolSpec]] = None):
+        self.specs: Dict[str, ToolSpec] = {
+            spec.name: spec for spec in (specs or build_tool_specs())
+        }
+        self.tools = [spec.tool for spec in self.specs.values()]
+        self.list_tools_result = PreserializedResult(
+            types.ListToolsResult(tools=self.tools)
+        )
+        for spec in self.specs.values():
+            if spec.concurrency:
+                register_concurrency_class(spec.name, spec.concurrency)
+        # Built on the first call of each tool, to keep startup fast
+        self._input_models: Dict[str, Type[BaseModel]] = {}
+
+    def get(self, name: str) -> Optional[ToolSpec]:
+        """Return the spec registered under name, if any."""
+        return self.specs.get(name)
+
+    async def handle_list_tools(self, _: types.ListToolsRequest) -> types.ServerResult:
+        """Request handler for ``tools/list`` returning the prebuilt result."""
+        return self.list_tools_result
+
+    async def resolve(self, spec: ToolSpec) -> Callable[..., Awaitable[Any]]:
+        """Return the handler of a tool, importing its module on first use."""
+        if callable(spec.handler):
+            return spec.handler
+        handler = _handlers.get(spec.handler)
+        if handler is None:
+            # Importing a tool module pulls in the SDK, keep the loop free
+            handler = await run_blocking(spec.name, spec.resolve_handler)
+        return handler
+
+    async def _run(self, spec: ToolSpec, arguments: Dict[str, Any]) -> Any:
+        handler = await self.resolve(spec)
+        timeout = spec.timeout if spec.timeout is not None else TOOL_TIMEOUT
+        if not timeout:
+            return await handler(**arguments)
+        try:
+            return await asyncio.wait_for(handler(**arguments), timeout)
+        except asyncio.TimeoutError:
+            raise asyncio.TimeoutError(
+                f"Tool {spec.name} timed out after {timeout} seconds"
+            )
+
+    def validate_arguments(
+        self, spec: ToolSpec, arguments: Dict[str, Any]
+    ) -> Optional[Dict[str, Any]]:
+        """Check arguments against the input model of a tool.
+
+        Returns:
+            dict: The error returned to the client, None if the arguments are valid
+        """
+        model = spec.input_model or self._input_models.get(spec.name)
+        if model is None:
+            model = self._input_models[spec.name] = input_model(
+                spec.name, spec.tool.inputSchema
+            )
+        try:
+            model.model_validate(arguments)
+        except ValidationError as e:
+            return invalid_arguments(e)
+        return None
+
+    async def call(
+        self, spec: ToolSpec, arguments: Dict[str, Any]
+    ) -> List[types.TextContent]:
+        """Run a tool and convert its result into MCP content.
+
+        The call count, latency and payload sizes are recorded in the metrics
+        of the tool, and the call is traced along with its serialization.
+
+        Args:
+            spec: Spec of the tool to run
+            arguments: Arguments sent by the client, "fields" projects the
+                result of projectable tools
+
+        Returns:
+            list: Text content holding the preamble, if any, and the result
+
+        Raises:
+            asyncio.TimeoutError: If the call exceeds the timeout of the tool
+        """
+        invalid = self.validate_arguments(spec, arguments)
+        fields = None
+        if spec.projectable and "fields" in arguments:
+            arguments = dict(arguments)
+            fields = arguments.pop("fields")
+        tool_metrics = metrics.tool(spec.name)
+        request_bytes = payload_size(arguments)
+        started_at = tool_metrics.begin(request_bytes)
+        error = True
+        response_bytes = 0
+        with tracer.span(
+            f"tools/call {spec.name}", tool=spec.name, request_bytes=request_bytes
+        ) as span:
+            try:
+                if invalid is not None:
+                    # Rejected before the handler is imported or run
+                    result = invalid
+                else:
+                    result = await self._run(spec, arguments)
+
+                error = is_error_result(result)
+                with tracer.span("serialize", tool=spec.name) as serialize_span:
+                    if fields and not error:
+                        result = project_fields(result, fields)
+                    text = spec.serializer(result)
+                    response_bytes = len(text.encode())
+                    if serialize_span is not None:
+                        serialize_span.set_attribute("response_bytes", response_bytes)
+                if error:
+                    record_error(span, result.get("error") or result.get("messages"))
+            finally:
+                tool_metrics.end(started_at, error, response_bytes)
+
+        output = [types.TextContent(text=text, type="text")]
+        if spec.preamble:
+            output.insert(0, types.TextContent(text=spec.preamble, type="text"))
+        return output
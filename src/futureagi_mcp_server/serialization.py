@@ -0,0 +1,109 @@
+"""Serialization of tool results to the text sent back to the client.
+
+Results are sent as compact JSON by default, since every byte goes through
+the transport and into the context of the model. orjson is used when it is
+installed; results it cannot encode fall back to the standard library.
+"""
+
+import json
+from typing import Any, Dict, List, Optional
+
+from .constants import JSON_BACKEND, OUTPUT_FORMAT
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional dependency
+    orjson = None
+
+OUTPUT_FORMATS = ("compact", "pretty")
+
+# Schema of the argument letting callers pick the keys of a result
+FIELDS_PROPERTY = {
+    "type": "array",
+    "items": {"type": "string"},
+    "description": (
+        "Optional keys to keep in the result, to reduce its size. Nested keys "
+        "are joined with dots, e.g. 'eval_results.output'. Lists are projected "
+        "item by item. Leave empty to get the full result."
+    ),
+}
+
+
+def _dumps_json(value: Any, pretty: bool) -> str:
+    if pretty:
+        return json.dumps(value, indent=2, default=str)
+    return json.dumps(value, separators=(",", ":"), default=str)
+
+
+def _dumps_orjson(value: Any, pretty: bool) -> str:
+    option = orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+    if pretty:
+        option |= orjson.OPT_INDENT_2
+    try:
+        return orjson.dumps(value, default=str, option=option).decode()
+    except TypeError:
+        # e.g. integers above 64 bits, which the standard library handles
+        return _dumps_json(value, pretty)
+
+
+def get_dumps(backend: str = JSON_BACKEND):
+    """Return the JSON encoder of a backend, "auto", "orjson" or "json"."""
+    if backend == "orjson" or (backend == "auto" and orjson is not None):
+        if orjson is None:
+            raise ImportError("FI_MCP_JSON_BACKEND=orjson requires orjson")
+        return _dumps_orjson
+    return _dumps_json
+
+
+_dumps = get_dumps()
+
+
+def serialize_result(result: Any, output_format: Optional[str] = None) -> str:
+    """Serialize a tool result to the text sent back to the client.
+
+    Args:
+        result: Value returned by the tool
+        output_format: "compact" or "pretty", defaults to FI_MCP_OUTPUT_FORMAT
+
+    Returns:
+        str: JSON for dicts and lists, the string form of anything else
+    """
+    if isinstance(result, (dict, list)):
+        return _dumps(result, (output_format or OUTPUT_FORMAT) == "pretty")
+    return str(result)
+
+
+def _field_tree(fields: List[str]) -> Dict[str, Any]:
+    tree: Dict[str, Any] = {}
+    for field in fields:
+        node = tree
+        for key in field.split("."):
+            node = node.setdefault(key, {})
+    return tree
+
+
+def _project(value: Any, tree: Dict[str, Any]) -> Any:
+    if isinstance(value, list):
+        return [_project(item, tree) for item in value]
+    if not isinstance(value, dict):
+        return value
+    return {
+        key: _project(value[key], subtree) if subtree else value[key]
+        for key, subtree in tree.items()
+        if key in value
+    }
+
+
+def project_fields(result: Any, fields: Optional[List[str]]) -> Any:
+    """Keep only the requested keys of a result.
+
+    Args:
+        result: Dict or list result of a tool
+        fields: Keys to keep, nested keys joined with dots
+
+    Returns:
+        The projected result, or the result itself when no fields are given
+    """
+    if not fields:
+        return result
+    return _project(result, _field_tree(fields))
@@ -0,0 +1,135 @@
+"""Registry of the eval template classes shipped with the SDK.
+
+The SDK declares one direct ``EvalTemplate`` subclass per preset evaluator.
+Scanning the subclasses on every request is wasted work, so the classes are
+indexed once and looked up by eval_id, by name, or by the UUID the evaluator
+has in the catalog.
+"""
+
+import re
+import threading
+from typing import Any, Dict, List, Optional, Type
+
+from fi.evals.templates import EvalTemplate
+
+_NAME_SEPARATORS = re.compile(r"[^a-z0-9]")
+
+
+def normalize_name(name: str) -> str:
+    """Fold a template name so that "ContextAdherence" matches "context_adherence"."""
+    return _NAME_SEPARATORS.sub("", str(name).lower())
+
+
+class TemplateRegistry:
+    """Eval template classes indexed by eval_id, name and catalog UUID.
+
+    The index is built on first use. Call ``refresh`` after the SDK defined
+    new templates, and ``learn`` with catalog entries to resolve their UUIDs
+    and display names.
+
+    Only direct subclasses of the base are indexed, because the SDK
+    ``add_evaluation`` only accepts templates among
+    ``EvalTemplate.__subclasses__()``.
+
+    Args:
+        base: Class whose subclasses are the templates
+    """
+
+    def __init__(self, base: type = EvalTemplate):
+        self.base = base
+        self.by_eval_id: Dict[str, Type[EvalTemplate]] = {}
+        self.by_name: Dict[str, Type[EvalTemplate]] = {}
+        self.by_uuid: Dict[str, Type[EvalTemplate]] = {}
+        self._built = False
+        self._lock = threading.Lock()
+
+    def refresh(self) -> int:
+        """Re-index the template classes, returning how many there are."""
+        by_eval_id = {}
+        by_name = {}
+        for cls in self.base.__subclasses__():
+            eval_id = getattr(cls, "eval_id", None)
+            if eval_id is None:
+                continue
+            by_eval_id[str(eval_id)] = cls
+            by_name[normalize_name(cls.__name__)] = cls
+        with self._lock:
+            # Catalog names and UUIDs learned earlier stay valid
+            by_name.update(
+                (name, by_eval_id.get(str(cls.eval_id), cls))
+                for name, cls in self.by_name.items()
+                if name not in by_name
+            )
+            self.by_uuid = {
+                uuid: by_eval_id.get(str(cls.eval_id), cls)
+                for uuid, cls in self.by_uuid.items()
+            }
+            self.by_eval_id = by_eval_id
+            self.by_name = by_name
+            self._built = True
+        return len(by_eval_id)
+
+    def _ensure_built(self):
+        if not self._built:
+            self.refresh()
+
+    def learn(self, evaluators: List[Dict[str, Any]]) -> int:
+        """Map the UUIDs and names of catalog entries to their template class.
+
+        Args:
+            evaluators: Entries of the evaluator catalog, with their eval_id
+
+        Returns:
+            int: Number of entries matched to a template class
+        """
+        self._ensure_built()
+        matched = 0
+        with self._lock:
+            for evaluator in evaluators:
+                cls = self.by_eval_id.get(str(evaluator.get("eval_id")))
+                if cls is None:
+                    continue
+                matched += 1
+                if evaluator.get("id"):
+                    self.by_uuid[str(evaluator["id"])] = cls
+                if evaluator.get("name"):
+                    self.by_name.setdefault(normalize_name(evaluator["name"]), cls)
+        return matched
+
+    def get(self, key: str) -> Optional[Type[EvalTemplate]]:
+        """Return the template class of an eval_id, UUID or name, None if unknown."""
+        self._ensure_built()
+        key = str(key).strip()
+        return (
+            self.by_eval_id.get(key)
+            or self.by_uuid.get(key)
+            or self.by_name.get(normalize_name(key))
+        )
+
+    def resolve(self, key: str) -> Type[EvalTemplate]:
+        """Return the template class of an eval_id, UUID or name.
+
+        Unknown keys trigger one refresh, in case the SDK defined templates
+        since the index was built.
+
+        Raises:
+            ValueError: If no template matches the key
+        """
+        cls = self.get(key)
+        if cls is None:
+            self.refresh()
+            cls = self.get(key)
+        if cls is None:
+            raise ValueError(
+                f"Unknown eval template '{key}'. Use the eval_id, name or UUID of "
+                "an evaluator listed by the all_evaluators tool."
+            )
+        return cls
+
+
+template_registry = TemplateRegistry()
+
+
+def get_template_registry() -> TemplateRegistry:
+    """Return the process-wide template registry."""
+    return template_registry
@@ -0,0 +1,514 @@
+"""Tool descriptions, kept apart so listing tools needs no SDK imports."""
+
+GET_EVAL_STRUCTURE_DESCRIPTION = """
+    Get the structure of an evaluation using the template_id.
+
+    Args:
+        template_id: UUID of the evaluation template
+
+    Returns:
+        dict: A dictionary containing the evaluation structure with fields like:
+            - id: UUID of the evaluation
+            - name: Name of the evaluation (e.g. "Toxicity")
+            - description: Description of what the evaluation does
+            - evalTags: List of tags categorizing the evaluation
+            - requiredKeys: List of required input keys
+            - optionalKeys: List of optional input keys
+            - output: Expected output format (e.g. "Pass/Fail")
+            - config: Configuration parameters
+    """
+
+
+GET_EVALS_LIST_FOR_CREATE_EVAL_DESCRIPTION = """
+    Get a list of available evaluation templates for creating new evaluations.
+
+    This function retrieves the list of evaluation templates that can be used as a base for creating
+    new custom evaluations. It should not be used when adding existing evaluations to datasets.
+
+    Args:
+        eval_type (str): Type of evaluation templates to retrieve:
+            - 'preset': Built-in evaluation templates provided by the system
+            - 'user': Custom evaluation templates created by users
+
+    Returns:
+        dict: Dictionary containing evaluation templates and their configurations. Each template includes:
+            - id: Template ID
+            - name: Template name
+            - description: Template description
+            - config: Template configuration parameters
+    """
+
+
+CREATE_EVAL_DESCRIPTION = """Create a new evaluation template based on an existing template.
+
+    Before calling this tool, you should:
+    1. Get available templates using get_evals_list_for_create_eval()
+    2. Get the template structure using get_eval_structure()
+    3. Construct the config dict using the template structure
+
+    Args:
+        eval_name (str): Name for the new evaluation template
+        template_id (str): UUID of the base evaluation template to use
+        config (dict): Configuration for the new template containing:
+            mapping (dict): Mapping containing the required fields for the evaluation structure and the example values
+            config (dict): Additional configuration parameters specific to this template. Refer to config['config'] in the get_eval_structure output
+            model (str): Name of the model to use (e.g. "gpt-4", "claude-3-sonnet")
+
+    Returns:
+        dict: Response from the evaluation creation API containing the new template details
+            or error information if the creation failed
+    """
+
+
+EVALUATE_DESCRIPTION = """
+    Use this tool to evaluate single and batch of inputs against specified evaluation templates.
+
+    Before using this tool, you MUST:
+    1. Call the all_evaluators tool to retrieve the current list of evaluators.
+    2. Search for the evaluator by name (e.g., "Toxicity") in the returned list.
+    3. Use the eval_id from the all_evaluators output for the evaluation.
+    4. Do NOT use hardcoded or previously known eval_ids, as these may change.
+    5. Only after these steps, call the evaluate tool with the correct eval_id and your input.
+
+
+    DETERMINISTIC EVALS (Only for Deterministic Evals eval_id = '3')
+
+    Steps to create a deterministic evaluation:
+    1. Define placeholders that map to your data fields
+       - Choose meaningful placeholder names that reflect the data being compared
+       - Map each placeholder to the corresponding input field key
+       Example: "placeholder1" -> 'response'
+               "placeholder2" -> 'context'
+
+    2. Write a clear rule prompt using the placeholders
+       - Use double curly braces {{placeholder}} syntax
+       - Make the evaluation criteria explicit
+       Example: "Is the {{placeholder1}} factually supported by the {{placeholder2}}?"
+
+    3. Specify the valid evaluation choices
+       - Define an array of possible outcomes
+       - Keep choices clear and unambiguous
+       Example: ["Yes", "No"] or ["Correct", "Incorrect"] or ["Positive", "Negative", "Neutral"]
+
+    4. Provide input data matching the placeholder mapping
+       - Input field keys must match the values of the corresponding placeholder
+       - Include all required fields for evaluation
+       - Also ensure when providing the url for the image, it is a valid url and input field key is image_url and url should be absolute path
+       - Also ensure when providing the url for the audio, it is a valid url and input field key is input_audio and url should be absolute path
+
+    Example payload:
+    {
+        "eval_templates": [
+            {
+                "eval_id": "3",
+                "config": {
+                    "input": {
+                        "placeholder1": "input_key1",
+                        "placeholder2": "input_key2"
+                    },
+                    "rule_prompt": "can you please check if the {{placeholder1}} is grounded in {{placeholder2}}",
+                    "choices": [
+                        "Yes",
+                        "No"
+                    ],
+                    "multi_choice": False
+                }
+            }
+        ],
+        "inputs": [
+            {
+                "input_key1": "value1",
+                "input_key2": "value2"
+            }
+        ]
+    }
+    """
+
+
+EVALUATE_CONFIG_DESCRIPTION = """
+    Config for the evaluation. The config object may contain the following parameters depending on the evaluator type:
+
+    For Deterministic Evals:
+    - input: Input data or parameters for the evaluation rule
+    - choices: Set of possible choices for multiple-choice outputs
+    - rule_prompt: Specific prompt or rule to evaluate against Use the variable {input} in the prompt
+    - multi_choice: Boolean flag for multiple-choice output format
+
+    For Similarity & Text Analysis:
+    - comparator: Algorithm for text comparison (e.g. CosineSimilarity)
+    - failure_threshold: Numerical threshold for similarity comparison
+    - substring: Characters to check at text start/end
+    - case_sensitive: Boolean for case-sensitive text matching
+    - keywords: List of words/phrases to check for
+    - max_length/min_length: Character length constraints
+    - pattern: Regex pattern for text matching
+
+    For AI/Model Based:
+    - model: Language model to use (e.g. gpt-4, claude-3)
+    - check_internet: Boolean to allow internet access
+    - eval_prompt: Prompt template for AI evaluation
+    - system_prompt: System context for AI agent
+
+    For API/External:
+    - url: API endpoint URL
+    - headers: HTTP request headers
+    - payload: Request body data
+
+    For Custom:
+    - code: Custom Python code string
+    - validations: JSON validation rules
+    - criteria: Natural language evaluation criteria
+    """
+
+
+ALL_EVALUATORS_DESCRIPTION = """
+    Get all evaluators and their configurations, sorted in a specific order:
+    1. CUSTOM evaluators first - These are user-defined custom evaluations
+    2. FUTURE_EVALS evaluators second - FutureAGI's proprietary evaluators
+    3. All remaining evaluators last - Standard/default evaluators
+
+    The returned evaluators will include their complete configurations and metadata.
+
+    Returns a list of all available evaluators with their complete configurations including:
+    - id: Unique UUID identifier for the evaluator
+    - name: Display name of the evaluator
+    - description: description of the evaluator
+    - organization: Optional organization that owns the evaluator
+    - owner: System level ownership designation
+    - eval_tags: Content types supported by evaluator
+    - config.config.input: Rule string type input with default empty array
+    - config.config.choices: Choices type with default empty array
+    - config.config.rule_prompt: Rule prompt type with default empty string
+    - config.config.multi_choice: Boolean flag defaulting to false
+    - config.output: Output format specified as choices
+    - config.eval_type_id: Evaluator implementation type identifier
+    - config.required_keys: Required configuration keys (empty)
+    - config.config_params_desc: Descriptions for all config parameters
+    - eval_id: Numeric identifier for the evaluator
+    - criteria: Optional evaluation criteria
+    - choices: Optional list of valid choices
+    - multi_choice: Flag for multiple choice support
+
+    The full catalog is large. Prefer asking only for the keys you need with
+    fields, e.g. ["eval_id", "name", "eval_tags"], and narrowing it down with
+    tags or search. With tags, search, limit or cursor the evaluators are
+    returned one page at a time.
+
+    Args:
+        fields: Keys of each evaluator to keep
+        tags: Only return evaluators carrying all of these tags
+        search: Words that must each start a word of the evaluator name, description or tags
+        limit: Maximum number of evaluators to return
+        cursor: next_cursor returned with the previous page
+
+    Returns:
+        list: All evaluator configurations, when no filter or page is requested
+        dict: Otherwise evaluators (the page), total (number of matching
+            evaluators) and next_cursor (None on the last page)
+    """
+
+
+SEARCH_EVALUATORS_DESCRIPTION = """
+    Find evaluators by tag, required input keys or words of their name, description and tags.
+    Prefer this tool over all_evaluators to pick evaluators, it returns a short
+    summary of the matching evaluators only.
+
+    Example: evaluators tagged RAG that can run with an input and a context:
+        tags = ["RAG"], available_keys = ["input", "context"]
+
+    Args:
+        tags: Only evaluators carrying all of these tags, e.g. ["TEXT", "SAFETY"]
+        required_keys: Only evaluators requiring all of these keys
+        available_keys: Only evaluators whose required keys are all in this list
+        query: Words that must each start a word of the name, description or tags, e.g. "tox"
+        fields: Keys of each evaluator to return, defaults to eval_id, name,
+            description, eval_tags and config.required_keys
+        limit: Maximum number of evaluators to return, defaults to 20
+
+    Returns:
+        dict: evaluators (matching evaluators in catalog order) and total
+            (number of matching evaluators)
+    """
+
+UPLOAD_DATASET_DESCRIPTION = """
+    This function should be used to upload a dataset to FutureAGI by either:
+
+    Please follow these steps strictly before calling this function:
+    1. Validate source file path:
+       - Check if provided path is absolute using file system tools
+       - If relative path, resolve against current working directory
+       - Verify file exists and is readable
+       - Return error if file not found or inaccessible
+    2. File format validation:
+       - Ensure file has supported extension (.csv, .json, etc.)
+       - Validate file structure and contents
+    3. Dataset creation:
+       - If source file provided, use it to create dataset
+       - If no source, initialize empty dataset structure
+       - Apply any specified dataset configurations
+
+    If the error says "Dataset already exists" then return the following retry with a different dataset name
+
+    Args:
+        dataset_name: Name of the dataset to create
+        model_type: Type of model (e.g., "GenerativeLLM", "GenerativeImage")
+        source: Optional source for the dataset. Can be:
+            - A file path (str) for local files
+            - This should be the absolute path to the file
+            - If the user has not provided the absolute path, try finding the file in the current working directory
+            - If the file is not found, return an error
+
+    Example:
+        dataset_name = "my_dataset"
+        model_type = "GenerativeLLM"
+        source = "/Users/name/Downloads/test.csv"
+
+    Returns:
+        dict: Dataset configuration including ID and name
+    """
+
+
+ADD_EVALUATION_TO_DATASET_DESCRIPTION = """
+
+    Adds an evaluation column to a specified dataset and runs the evaluation.
+
+    Please follow these steps strictly before calling this function:
+    1. Validate eval_id format:
+       - Ensure eval_id is an integer string (e.g. '1', '9', '11')
+       - Do NOT use UUID format
+       - Verify eval_id exists in all_evaluators output
+    2. Fetch evaluation structure:
+       - Get eval template structure using template_id which is the UUID of the eval template
+       - Extract required keys from the eval template
+       - Read the dataset columns either from the local file or download the dataset and read the columns
+       - construct the required_keys_to_column_names dictionary
+    3. For config generation, use the following steps:
+       - Find the config['config'] dictionary in the eval template structure
+       - You MUST add the keys present the config['config'] dictionary to the config dictionary
+
+
+    WHEN ADDINGDETERMINISTIC EVALS (Only for Deterministic Evals eval_id = '3')
+
+    You MUST follow these steps to add a deterministic evaluation:
+    Add these to the config dictionary:
+    1. Define placeholders that map to your column names
+       Example: "placeholder1" -> column_name1
+               "placeholder2" -> column_name2
+
+    2. Write a clear rule prompt using the placeholders
+       - Use double curly braces {{placeholder}} syntax
+       - Make the evaluation criteria explicit
+       Example: "Is the {{placeholder1}} factually supported by the {{placeholder2}}?"
+
+    3. Specify the valid evaluation choices
+       - Define an array of possible outcomes
+       - Keep choices clear and unambiguous
+       Example: ["Yes", "No"] or ["Correct", "Incorrect"] or ["Positive", "Negative", "Neutral"]
+    4. No requirement for input_column_name, output_column_name, context_column_name, expected_column_name
+
+    EXAMPLE PAYLOAD FOR DETERMINISTIC EVALS:
+    {
+        "name": "deterministic_evaluation",
+        "eval_id": "3",
+        "config": {
+            "input": {
+                "placeholder1": "column_name1",
+                "placeholder2": "column_name2"
+            },
+            "rule_prompt": "can you please check if the {{placeholder1}} is grounded in {{placeholder2}}",
+            "choices": ["Yes", "No"],
+            "multi_choice": False
+        },
+        "required_keys_to_column_names": {
+        }
+    }
+    """
+
+
+DOWNLOAD_DATASET_DESCRIPTION = """
+    This function is used to download a dataset from FutureAGI.
+    It will return a dictionary with the dataset name, the file path, and the insights.
+
+    Please follow these steps strictly before calling this function:
+    1. Validate dataset_name format:
+       - Ensure dataset_name is a string
+       - Verify dataset_name exists in FutureAGI
+    2. Validate file_path format:
+       - Ensure file_path is a string
+       - Verify file_path is a valid path
+       - If the Obsolute path is not provided, add the current working directory to the file_path
+"""
+
+
+DATASET_EVALUATION_INSIGHTS_DESCRIPTION = """
+    This function is used to get the insights of the evaluation dataset.
+    It will return a dictionary with the evaluation insights.
+    Please follow these steps strictly before calling this function:
+    1. Validate dataset_name format:
+       - Ensure dataset_name is a string
+       - Verify dataset_name exists in FutureAGI
+
+    The function returns evaluation insights including:
+    - Overall statistics:
+        - totalRows: Total number of rows evaluated
+        - passRate: Overall pass rate percentage
+
+    - Per metric results containing:
+        - metricName: Name of the evaluation metric
+        - id: Unique identifier for the metric
+        - totalRows: Number of rows evaluated for this metric
+        - averageScore: Average score across all rows (0-100)
+        - successRate: Success rate percentage
+        - outputType: Type of output (e.g. "numeric")
+        - percentile scores: p5 through p100 showing score distribution
+"""
+
+
+PROTECT_DESCRIPTION = """
+    Protect input strings against harmful content using a list of protection rules.
+    Do not use this tool for evaluating content. Use the evaluate tool for evaluating content.
+    Use Protect only when the user explicitly uses the word protect or protection in the prompt.
+
+    Args:
+        inputs: Single string to evaluate. Can be text, image file path/URL, or audio file path/URL
+        protect_rules: List of protection rule dictionaries. Each rule must contain:
+            - metric: str, name of the metric to evaluate ('Toxicity', 'Tone', 'Sexism', 'Prompt Injection', 'Data Privacy')
+            - contains: List[str], required for Tone metric only. Possible values: neutral, joy, love, fear, surprise,
+                       sadness, anger, annoyance, confusion
+            - type: str, required for Tone metric only. Either 'any' (default) or 'all'
+        action: Default action message when rules fail. Defaults to DEFAULT_PROTECT_ACTION
+        reason: Whether to include failure reason in output. Defaults to False
+        timeout: Timeout for evaluations in milliseconds. Defaults to DEFAULT_PROTECT_TIMEOUT
+        prefilter: Whether to fail obvious personal data and prompt injections locally, before calling the API
+
+    Returns:
+        Dict with protection results containing:
+            - status: 'passed' or 'failed'
+            - messages: Action message if failed, original input if passed
+            - completed_rules: List of rules that were evaluated
+            - uncompleted_rules: List of rules not evaluated due to failure/timeout
+            - failed_rule: Name of failed rule, or None if passed
+            - reason: Explanation for failure if reason=True
+            - time_taken: Total evaluation duration
+            - decided_by: 'prefilter' if the input failed the local prefilter, 'cache' if the same check was decided recently, 'upstream' otherwise
+    """
+
+
+PROTECT_BATCH_DESCRIPTION = """
+    Protect many input strings against harmful content in a single call, e.g. every message of a conversation.
+    Prefer this tool over calling protect once per input. Same rules and usage restrictions as the protect tool.
+
+    Args:
+        inputs: List of strings to evaluate
+        protect_rules: List of protection rule dictionaries, as for the protect tool
+        action: Default action message when rules fail. Defaults to DEFAULT_PROTECT_ACTION
+        reason: Whether to include failure reason in output. Defaults to False
+        timeout: Deadline for the whole batch in milliseconds. Defaults to DEFAULT_PROTECT_TIMEOUT
+        max_in_flight: Maximum number of inputs screened concurrently
+        prefilter: Whether to fail obvious personal data and prompt injections locally, before calling the API
+
+    Returns:
+        Dict with:
+            - results: One protect result per input, in input order. Inputs not screened
+              before the deadline have the status 'timeout'
+            - passed, failed, errors, timed_out: Number of inputs per status
+            - decided_locally: Number of inputs failed by the local prefilter
+            - time_taken: Duration of the batch in seconds
+    """
+
+
+GENERATE_SYNTHETIC_DATA_DESCRIPTION = """
+Generate a synthetic dataset by specifying the following:
+
+1. Basic Metadata
+
+- **Name (required):**
+  Provide a clear, descriptive title for your dataset.
+
+- **Description (required):**
+  Describe the dataset you want to generate, including its purpose, the type of data it will contain, and the intended use case.
+
+- **Use Case:**
+  Specify the primary use case for your dataset (e.g., "Simulated customer support logs for LLM fine-tuning", "Classification dataset with evenly distributed labels").
+
+- **Pattern (optional):**
+  Define the structure or style of the data, such as "Follow a conversational pattern", "Keep the tone formal", or any other relevant instructions.
+
+2. Define the Schema
+
+- For every column, specify:
+  - **Name:** (e.g., message, label, timestamp, transcript)
+  - **Type:** Choose from: text, float, integer, boolean, array, json, datetime
+  - **Properties:**
+    - Add constraints (e.g., min/max, string patterns) to ensure realistic value ranges.
+    - For categorical columns, specify allowed values or let the generator decide dynamically.
+    - You can add more properties as needed, providing a name and description for each.
+
+**Example Schema:**
+
+- Column 1:
+  Name: review_text
+  Type: text
+  Properties: None (freeform)
+
+- Column 2:
+  Name: rating
+  Type: integer
+  Properties: min: 1, max: 5
+
+- Column 3:
+  Name: sentiment
+  Type: text
+  Properties: Value: positive, negative, neutral
+
+3. Set Row Count
+
+- Specify the number of rows you want the dataset to contain.
+
+4. Define Column Descriptions
+
+- For each column, provide a detailed description to help the generator create rich, realistic data.
+
+By following these steps, you can generate high-quality synthetic datasets tailored to your specific needs.
+
+EXAMPLE CONFIG:
+{
+    "dataset": {
+        "name": "Customer Support Logs",
+        "description": "A dataset of customer support logs",
+        "objective": "To simulate customer support logs for LLM fine-tuning",
+        "patterns": "Follow a conversational pattern"
+    },
+    "num_rows": 50,
+    "columns": [
+        {
+            "name": "customer_id",
+            "description": "The ID of the customer",
+            "data_type": "integer",
+            "property": {}
+        },
+        {
+            "name": "customer_name",
+            "description": "The name of the customer",
+            "data_type": "text",
+            "property": {
+                "max_length": "20",
+                "value": "dynamic",
+                "min_length": "17"
+            }
+        }
+    ]
+}
+"""
+
+SERVER_STATS_DESCRIPTION = """
+    Get call metrics of every tool served by this server process.
+
+    Returns:
+        dict: Metrics of the server containing:
+            - uptime_seconds: Seconds since the server started
+            - in_flight_calls: Blocking SDK calls currently running
+            - tools: Per tool name, the number of calls and errors, the calls
+              in flight, latency percentiles (p50, p95, p99) in milliseconds
+              and the total and largest request and response sizes in bytes
+    """
@@ -1,206 +1,98 @@
+import hashlib
 import json
-import os
-from typing import List, Optional
+import math
+import sqlite3
+from functools import lru_cache
+from typing import FrozenSet, List, Optional, Tuple, Type, Union
 
-from fi.api.auth import APIKeyAuth
 from fi.api.types import HttpMethod, RequestConfig
-from fi.evals import EvalClient
 from fi.evals.templates import EvalTemplate
+from fi.evals.types import BatchRunResult, EvalResult
 from fi.testcases import MLLMTestCase
 from pydantic import ConfigDict
 
+from ..batch import run_chunked
+from ..cache import SQLiteCache, catalog_cache, evaluate_cache
+from ..catalog import check_limit, fetch_evaluators, get_evaluator_index
+from ..clients import get_client_registry
+from ..constants import (
+    EVALUATE_CACHE,
+    EVALUATE_CHUNK_RETRIES,
+    EVALUATE_CHUNK_SIZE,
+    EVALUATE_MAX_IN_FLIGHT,
+    SEARCH_EVALUATORS_LIMIT,
+)
+from ..executor import run_blocking
 from ..logger import get_logger
+from ..prefilter import is_media_reference
+from ..progress import get_progress_reporter
+from ..serialization import project_fields
+from .descriptions import (  # noqa: F401
+    ALL_EVALUATORS_DESCRIPTION,
+    CREATE_EVAL_DESCRIPTION,
+    EVALUATE_CONFIG_DESCRIPTION,
+    EVALUATE_DESCRIPTION,
+    GET_EVAL_STRUCTURE_DESCRIPTION,
+    GET_EVALS_LIST_FOR_CREATE_EVAL_DESCRIPTION,
+    SEARCH_EVALUATORS_DESCRIPTION,
+)
 from .routes import Routes
 
 logger = get_logger()
 
-GET_EVAL_STRUCTURE_DESCRIPTION = """
-    Get the structure of an evaluation using the template_id.
-
-    Args:
-        template_id: UUID of the evaluation template
-
-    Returns:
-        dict: A dictionary containing the evaluation structure with fields like:
-            - id: UUID of the evaluation
-            - name: Name of the evaluation (e.g. "Toxicity")
-            - description: Description of what the evaluation does
-            - evalTags: List of tags categorizing the evaluation
-            - requiredKeys: List of required input keys
-            - optionalKeys: List of optional input keys
-            - output: Expected output format (e.g. "Pass/Fail")
-            - config: Configuration parameters
-    """
-
-GET_EVALS_LIST_FOR_CREATE_EVAL_DESCRIPTION = """
-    Get a list of available evaluation templates for creating new evaluations.
-
-    This function retrieves the list of evaluation templates that can be used as a base for creating
-    new custom evaluations. It should not be used when adding existing evaluations to datasets.
-
-    Args:
-        eval_type (str): Type of evaluation templates to retrieve:
-            - 'preset': Built-in evaluation templates provided by the system
-            - 'user': Custom evaluation templates created by users
-
-    Returns:
-        dict: Dictionary containing evaluation templates and their configurations. Each template includes:
-            - id: Template ID
-            - name: Template name
-            - description: Template description
-            - config: Template configuration parameters
-    """
-
-CREATE_EVAL_DESCRIPTION = """Create a new evaluation template based on an existing template.
+# Keys of each evaluator returned by search_evaluators unless fields are given
+SEARCH_EVALUATORS_FIELDS = [
+    "eval_id",
+    "name",
+    "description",
+    "eval_tags",
+    "config.required_keys",
+]
 
-    Before calling this tool, you should:
-    1. Get available templates using get_evals_list_for_create_eval()
-    2. Get the template structure using get_eval_structure()
-    3. Construct the config dict using the template structure
 
-    Args:
-        eval_name (str): Name for the new evaluation template
-        template_id (str): UUID of the base evaluation template to use
-        config (dict): Configuration for the new template containing:
-            mapping (dict): Mapping containing the required fields for the evaluation structure and the example values
-            config (dict): Additional configuration parameters specific to this template. Refer to config['config'] in the get_eval_structure output
-            model (str): Name of the model to use (e.g. "gpt-4", "claude-3-sonnet")
+@lru_cache(maxsize=256)
+def _test_case_class(fields: FrozenSet[Tuple[str, type]]) -> Type[MLLMTestCase]:
+    """Create the test case class for a set of input fields and their types.
 
-    Returns:
-        dict: Response from the evaluation creation API containing the new template details
-            or error information if the creation failed
+    Classes are cached per field signature, so pydantic builds the schema once
+    instead of once per input row.
     """
+    return type(
+        "DynamicTestCase",
+        (MLLMTestCase,),
+        {
+            "__annotations__": {name: Optional[kind] for name, kind in sorted(fields)},
+            "model_config": ConfigDict(extra="allow"),
+        },
+    )
 
-EVALUATE_DESCRIPTION = """
-    Use this tool to evaluate single and batch of inputs against specified evaluation templates.
-
-    Before using this tool, you MUST:
-    1. Call the all_evaluators tool to retrieve the current list of evaluators.
-    2. Search for the evaluator by name (e.g., "Toxicity") in the returned list.
-    3. Use the eval_id from the all_evaluators output for the evaluation.
-    4. Do NOT use hardcoded or previously known eval_ids, as these may change.
-    5. Only after these steps, call the evaluate tool with the correct eval_id and your input.
-
-
-    DETERMINISTIC EVALS (Only for Deterministic Evals eval_id = '3')
-
-    Steps to create a deterministic evaluation:
-    1. Define placeholders that map to your data fields
-       - Choose meaningful placeholder names that reflect the data being compared
-       - Map each placeholder to the corresponding input field key
-       Example: "placeholder1" -> 'response'
-               "placeholder2" -> 'context'
-
-    2. Write a clear rule prompt using the placeholders
-       - Use double curly braces {{placeholder}} syntax
-       - Make the evaluation criteria explicit
-       Example: "Is the {{placeholder1}} factually supported by the {{placeholder2}}?"
-
-    3. Specify the valid evaluation choices
-       - Define an array of possible outcomes
-       - Keep choices clear and unambiguous
-       Example: ["Yes", "No"] or ["Correct", "Incorrect"] or ["Positive", "Negative", "Neutral"]
-
-    4. Provide input data matching the placeholder mapping
-       - Input field keys must match the values of the corresponding placeholder
-       - Include all required fields for evaluation
-       - Also ensure when providing the url for the image, it is a valid url and input field key is image_url and url should be absolute path
-       - Also ensure when providing the url for the audio, it is a valid url and input field key is input_audio and url should be absolute path
-
-    Example payload:
-    {
-        "eval_templates": [
-            {
-                "eval_id": "3",
-                "config": {
-                    "input": {
-                        "placeholder1": "input_key1",
-                        "placeholder2": "input_key2"
-                    },
-                    "rule_prompt": "can you please check if the {{placeholder1}} is grounded in {{placeholder2}}",
-                    "choices": [
-                        "Yes",
-                        "No"
-                    ],
-                    "multi_choice": False
-                }
-            }
-        ],
-        "inputs": [
-            {
-                "input_key1": "value1",
-                "input_key2": "value2"
-            }
-        ]
-    }
-    """
 
-EVALUATE_CONFIG_DESCRIPTION = """
-    Config for the evaluation. The config object may contain the following parameters depending on the evaluator type:
-
-    For Deterministic Evals:
-    - input: Input data or parameters for the evaluation rule
-    - choices: Set of possible choices for multiple-choice outputs
-    - rule_prompt: Specific prompt or rule to evaluate against Use the variable {input} in the prompt
-    - multi_choice: Boolean flag for multiple-choice output format
-
-    For Similarity & Text Analysis:
-    - comparator: Algorithm for text comparison (e.g. CosineSimilarity)
-    - failure_threshold: Numerical threshold for similarity comparison
-    - substring: Characters to check at text start/end
-    - case_sensitive: Boolean for case-sensitive text matching
-    - keywords: List of words/phrases to check for
-    - max_length/min_length: Character length constraints
-    - pattern: Regex pattern for text matching
-
-    For AI/Model Based:
-    - model: Language model to use (e.g. gpt-4, claude-3)
-    - check_internet: Boolean to allow internet access
-    - eval_prompt: Prompt template for AI evaluation
-    - system_prompt: System context for AI agent
-
-    For API/External:
-    - url: API endpoint URL
-    - headers: HTTP request headers
-    - payload: Request body data
-
-    For Custom:
-    - code: Custom Python code string
-    - validations: JSON validation rules
-    - criteria: Natural language evaluation criteria
-    """
+def build_eval_templates(eval_templates: List[dict]) -> List[EvalTemplate]:
+    """Build the SDK eval templates from their eval_id and config."""
+    constructed_eval_templates = []
+    for template_input in eval_templates:
+        current_eval_template = EvalTemplate(config=template_input["config"])
+        current_eval_template.eval_id = template_input["eval_id"]
+        constructed_eval_templates.append(current_eval_template)
+    return constructed_eval_templates
 
-ALL_EVALUATORS_DESCRIPTION = """
-    Get all evaluators and their configurations, sorted in a specific order:
-    1. CUSTOM evaluators first - These are user-defined custom evaluations
-    2. FUTURE_EVALS evaluators second - FutureAGI's proprietary evaluators
-    3. All remaining evaluators last - Standard/default evaluators
 
-    The returned evaluators will include their complete configurations and metadata.
+def build_test_cases(inputs: List[dict]) -> List[MLLMTestCase]:
+    """Build a test case for every input row.
 
-    Returns a list of all available evaluators with their complete configurations including:
-    - id: Unique UUID identifier for the evaluator
-    - name: Display name of the evaluator
-    - description: description of the evaluator
-    - organization: Optional organization that owns the evaluator
-    - owner: System level ownership designation
-    - eval_tags: Content types supported by evaluator
-    - config.config.input: Rule string type input with default empty array
-    - config.config.choices: Choices type with default empty array
-    - config.config.rule_prompt: Rule prompt type with default empty string
-    - config.config.multi_choice: Boolean flag defaulting to false
-    - config.output: Output format specified as choices
-    - config.eval_type_id: Evaluator implementation type identifier
-    - config.required_keys: Required configuration keys (empty)
-    - config.config_params_desc: Descriptions for all config parameters
-    - eval_id: Numeric identifier for the evaluator
-    - criteria: Optional evaluation criteria
-    - choices: Optional list of valid choices
-    - multi_choice: Flag for multiple choice support
+    Args:
+        inputs: Input rows mapping field names to values
 
     Returns:
-        dict: Dictionary containing all evaluator configurations
+        List[MLLMTestCase]: One test case per row, in the same order
     """
+    test_cases = []
+    for input_item in inputs:
+        test_case_class = _test_case_class(
+            frozenset((key, type(value)) for key, value in input_item.items())
+        )
+        test_cases.append(test_case_class(**input_item))
+    return test_cases
 
 
 async def get_eval_structure(template_id: str):
@@ -221,19 +113,27 @@ async def get_eval_structure(template_id: str):
             - output: Expected output format (e.g. "Pass/Fail")
             - config: Configuration parameters
     """
-    request_handler = APIKeyAuth(
-        os.getenv("FI_API_KEY"), os.getenv("FI_SECRET_KEY"), os.getenv("FI_BASE_URL")
-    )
+    cache_key = ("eval_structure", template_id)
+    cached = await catalog_cache.aget(cache_key)
+    if cached is not None:
+        return cached
+
+    request_handler = get_client_registry().api_client()
     url = Routes.eval_structure(template_id)
     config = RequestConfig(
         method=HttpMethod.POST, url=url, json={"eval_type": "preset"}
     )
 
     try:
-        response = request_handler.request(config)
-        return response.json()
+        response = await run_blocking(
+            "get_eval_structure", request_handler.request, config
+        )
+        result = response.json()
+        if response.status_code == 200:
+            await catalog_cache.aset(cache_key, result)
+        return result
     except Exception as e:
-        logger.error(f"Failed to get evaluation structure: {str(e)}", exc_info=True)
+        logger.error("Failed to get evaluation structure: %s", e, exc_info=True)
         return {"error": str(e)}
 
 
@@ -256,17 +156,25 @@ async def get_evals_list_for_create_eval(eval_type: str) -> dict:
             - description: Template description
             - config: Template configuration parameters
     """
-    request_handler = APIKeyAuth(
-        os.getenv("FI_API_KEY"), os.getenv("FI_SECRET_KEY"), os.getenv("FI_BASE_URL")
-    )
+    cache_key = ("evals_list", eval_type)
+    cached = await catalog_cache.aget(cache_key)
+    if cached is not None:
+        return cached
+
+    request_handler = get_client_registry().api_client()
     url = Routes.EVALS_LIST.value
     json_data = {"eval_type": eval_type, "search_text": ""}
     config = RequestConfig(method=HttpMethod.POST, url=url, json=json_data)
     try:
-        response = request_handler.request(config)
-        return response.json()
+        response = await run_blocking(
+            "get_evals_list_for_create_eval", request_handler.request, config
+        )
+        result = response.json()
+        if response.status_code == 200:
+            await catalog_cache.aset(cache_key, result)
+        return result
     except Exception as e:
-        logger.error(f"Failed to get evaluations list: {str(e)}", exc_info=True)
+        logger.error("Failed to get evaluations list: %s", e, exc_info=True)
         return {"error": str(e)}
 
 
@@ -290,9 +198,7 @@ async def create_eval(eval_name: str, template_id: str, config: dict) -> dict:
         dict: Response from the evaluation creation API containing the new template details
             or error information if the creation failed
     """
-    request_handler = APIKeyAuth(
-        os.getenv("FI_API_KEY"), os.getenv("FI_SECRET_KEY"), os.getenv("FI_BASE_URL")
-    )
+    request_handler = get_client_registry().api_client()
     config_dict = config if isinstance(config, dict) else json.loads(config)
 
     # Make request to run evaluation
@@ -308,14 +214,23 @@ async def create_eval(eval_name: str, template_id: str, config: dict) -> dict:
     config = RequestConfig(method=HttpMethod.POST, url=url, json=payload)
 
     try:
-        response = request_handler.request(config)
+        response = await run_blocking("create_eval", request_handler.request, config)
+        if response.status_code == 200:
+            # The new template shows up in the catalog and eval lists
+            await catalog_cache.ainvalidate()
         return response.json()
     except Exception as e:
-        logger.error(f"Failed to create evaluation: {str(e)}", exc_info=True)
+        logger.error("Failed to create evaluation: %s", e, exc_info=True)
         return {"error": str(e)}
 
 
-async def evaluate(eval_templates: List[dict], inputs: List[dict]) -> dict:
+async def evaluate(
+    eval_templates: List[dict],
+    inputs: List[dict],
+    chunk_size: int = EVALUATE_CHUNK_SIZE,
+    max_in_flight: int = EVALUATE_MAX_IN_FLIGHT,
+    cache: Optional[bool] = None,
+) -> dict:
     """
     Args:
         eval_templates: List[
@@ -343,46 +258,234 @@ async def evaluate(eval_templates: List[dict], inputs: List[dict]) -> dict:
                 "context": Union[List[str], str] = None
             }
         ]
+        chunk_size: Maximum number of inputs sent upstream in one request
+        max_in_flight: Maximum number of chunks evaluated concurrently
+        cache: Reuse the results of rows already evaluated with the same
+            templates, defaults to FI_MCP_EVALUATE_CACHE
 
     Returns:
-        List[BatchRunResult]
+        List[BatchRunResult]. Results of every chunk are merged in input order.
+        Chunks that still fail after retrying are listed under failed_chunks.
+        With the cache enabled, cache_hits counts the rows served from it.
     """
     try:
-        eval_client = EvalClient()
-        constructed_eval_templates = []
-
-        for template_input in eval_templates:
-            current_eval_template = EvalTemplate(config=template_input["config"])
-            current_eval_template.eval_id = template_input["eval_id"]
-            constructed_eval_templates.append(current_eval_template)
-
-        constructed_inputs = []
-        for input_item in inputs:
-            # Dynamically create a class inheriting from TestCase with input fields
-            input_fields = {k: Optional[type(v)] for k, v in input_item.items()}
-            DynamicTestCase = type(
-                "DynamicTestCase",
-                (MLLMTestCase,),
-                {
-                    "__annotations__": input_fields,
-                    "model_config": ConfigDict(extra="allow"),
-                },
+        eval_client = get_client_registry().eval_client()
+        progress = get_progress_reporter()
+        result_cache = evaluate_cache if _resolve_cache(cache) else None
+
+        # Results of each input row, filled from the cache, then from upstream
+        row_results: List[Optional[list]] = [None] * len(inputs)
+        keys: List[Optional[str]] = [None] * len(inputs)
+        if result_cache is not None:
+            # Hashing rows and checking their file paths is slow for large
+            # batches, so it runs on the worker pool with the lookup
+            keys, row_results = await run_blocking(
+                "evaluate", _cached_results, result_cache, eval_templates, inputs
             )
+        # Only the rows missing from the cache are sent upstream
+        positions = [p for p, results in enumerate(row_results) if results is None]
+        cache_hits = len(inputs) - len(positions)
+        rows_done = cache_hits
+        chunks_done = 0
+
+        # Building test cases is CPU bound for large batches
+        constructed_inputs = await run_blocking(
+            "evaluate", build_test_cases, [inputs[p] for p in positions]
+        )
 
-            # Initialize the dynamic class with input values
-            current_input = DynamicTestCase(**input_item)
-            constructed_inputs.append(current_input)
-
-        eval_results = eval_client.evaluate(
-            constructed_eval_templates, constructed_inputs
+        async def evaluate_chunk(chunk_inputs):
+            # The SDK fills in template metadata, so every chunk gets its own
+            eval_results = await run_blocking(
+                "evaluate",
+                eval_client.evaluate,
+                build_eval_templates(eval_templates),
+                chunk_inputs,
+            )
+            return eval_results.eval_results
+
+        def chunk_rows(chunk):
+            start, end = chunk.start, chunk.end
+            return positions[start:end]
+
+        def chunk_span(chunk):
+            rows = chunk_rows(chunk)
+            span = {"start": rows[0], "end": rows[-1] + 1}
+            if len(rows) != span["end"] - span["start"]:
+                # Cached rows in between were not sent with the chunk
+                span["rows"] = rows
+            return span
+
+        async def report_chunk(chunk):
+            # Stream each chunk as soon as it is done instead of after the batch
+            nonlocal rows_done, chunks_done
+            rows_done += len(chunk.items)
+            chunks_done += 1
+            await progress.update(
+                rows_done,
+                total=len(inputs),
+                message=f"Evaluated {chunks_done}/{chunk_count} chunks",
+            )
+            partial = chunk_span(chunk)
+            if chunk.error is None:
+                partial["eval_results"] = [
+                    result.model_dump() if result is not None else None
+                    for result in chunk.result
+                ]
+            else:
+                partial["error"] = str(chunk.error)
+            await progress.partial_result(partial)
+
+        chunk_count = math.ceil(len(constructed_inputs) / max(1, chunk_size))
+        await progress.update(rows_done, total=len(inputs))
+        chunks = await run_chunked(
+            constructed_inputs,
+            evaluate_chunk,
+            chunk_size=chunk_size,
+            max_in_flight=max_in_flight,
+            retries=EVALUATE_CHUNK_RETRIES,
+            on_chunk_done=report_chunk if progress.enabled else None,
         )
-        return eval_results.model_dump()
+        failed_chunks = [chunk for chunk in chunks if chunk.error is not None]
+        if failed_chunks and len(failed_chunks) == len(chunks) and not cache_hits:
+            raise failed_chunks[0].error
+
+        fresh = []
+        for chunk in chunks:
+            if chunk.error is not None:
+                continue
+            rows = chunk_rows(chunk)
+            per_row = split_row_results(chunk.result, len(rows), len(eval_templates))
+            if per_row is None:
+                # Results cannot be told apart by row, keep the chunk together
+                row_results[rows[0]] = chunk.result
+                continue
+            for position, results in zip(rows, per_row):
+                row_results[position] = results
+                if keys[position] is not None and None not in results:
+                    fresh.append(
+                        (keys[position], [result.model_dump() for result in results])
+                    )
+        if fresh:
+            await _store_results(result_cache, fresh)
+
+        merged = [result for results in row_results if results for result in results]
+        response = BatchRunResult(eval_results=merged).model_dump()
+        if result_cache is not None:
+            response["cache_hits"] = cache_hits
+        if failed_chunks:
+            response["failed_chunks"] = [
+                {**chunk_span(chunk), "error": str(chunk.error)}
+                for chunk in failed_chunks
+            ]
+        return response
     except Exception as e:
-        logger.error(f"Error during evaluation: {str(e)}", exc_info=True)
+        logger.error("Error during evaluation: %s", e, exc_info=True)
         return {"error": str(e)}
 
 
-async def all_evaluators() -> dict:
+def _resolve_cache(enabled: Optional[bool]) -> bool:
+    """Tell whether results are cached, by the caller or FI_MCP_EVALUATE_CACHE."""
+    if enabled is None:
+        enabled = EVALUATE_CACHE
+    return enabled and evaluate_cache.enabled
+
+
+def evaluate_cache_key(eval_templates: List[dict], row: dict) -> str:
+    """Hash the templates and an input row into the key of the row's results.
+
+    The key is built from canonical JSON, so the order of the keys of the
+    configs and of the row does not matter. The order of the templates does,
+    since it is the order of the results.
+    """
+    templates = [
+        {"eval_id": str(template["eval_id"]), "config": template.get("config") or {}}
+        for template in eval_templates
+    ]
+    payload = json.dumps(
+        {"eval_templates": templates, "input": row},
+        sort_keys=True,
+        separators=(",", ":"),
+        ensure_ascii=False,
+        default=str,
+    )
+    return hashlib.sha256(payload.encode()).hexdigest()
+
+
+def split_row_results(results: list, rows: int, templates: int) -> Optional[List[list]]:
+    """Split the results of a chunk into the results of each of its rows.
+
+    Upstream returns the result of every template for the first row, then
+    for the next one. Returns None unless there is exactly one result per
+    row and template, as the results cannot be attributed to rows then.
+    """
+    if not rows or not templates or len(results) != rows * templates:
+        return None
+    bounds = range(0, len(results) + 1, templates)
+    return [results[start:end] for start, end in zip(bounds, bounds[1:])]
+
+
+def is_cacheable(row: dict) -> bool:
+    """Tell whether the results of an input row can be cached.
+
+    Images and audio given by URL or file path would be keyed by their
+    reference and not their content, so rows holding one are always sent
+    upstream.
+    """
+    values = list(row.values())
+    while values:
+        value = values.pop()
+        if isinstance(value, str):
+            if is_media_reference(value):
+                return False
+        elif isinstance(value, (list, tuple)):
+            values.extend(value)
+        elif isinstance(value, dict):
+            values.extend(value.values())
+    return True
+
+
+def _cached_results(
+    result_cache: SQLiteCache, eval_templates: List[dict], inputs: List[dict]
+) -> Tuple[List[Optional[str]], List[Optional[list]]]:
+    """Key the input rows and read the results cached for them.
+
+    Returns:
+        tuple: The key of every row, None for rows that cannot be cached, and
+            the cached results of every row, None for the rows not found
+    """
+    keys = [
+        evaluate_cache_key(eval_templates, row) if is_cacheable(row) else None
+        for row in inputs
+    ]
+    try:
+        found = result_cache.get_many([key for key in keys if key])
+    except (sqlite3.Error, OSError) as e:
+        # A broken cache only costs the upstream calls it would have saved
+        logger.warning("Failed to read cached evaluation results: %s", e)
+        found = {}
+    row_results = [
+        [EvalResult.model_validate(result) for result in found[key]]
+        if key in found
+        else None
+        for key in keys
+    ]
+    return keys, row_results
+
+
+async def _store_results(result_cache: SQLiteCache, items: List[tuple]):
+    try:
+        await run_blocking("evaluate", result_cache.set_many, items)
+    except (sqlite3.Error, OSError) as e:
+        logger.warning("Failed to cache evaluation results: %s", e)
+
+
+async def all_evaluators(
+    fields: Optional[List[str]] = None,
+    tags: Optional[List[str]] = None,
+    search: Optional[str] = None,
+    limit: Optional[int] = None,
+    cursor: Optional[str] = None,
+) -> Union[list, dict]:
     """Get all evaluators and their configurations, always print the evaluators in the order of CUSTOM, then FUTURE_EVALS, then the rest
 
     Returns a list of all available evaluators with their complete configurations including:
@@ -405,18 +508,64 @@ async def all_evaluators() -> dict:
     - choices: Optional list of valid choices
     - multi_choice: Flag for multiple choice support
 
+    Args:
+        fields: Keys of each evaluator to keep, e.g. ["eval_id", "name", "eval_tags"]
+        tags: Only return evaluators carrying all of these tags
+        search: Words that must each start a word of the name, description or
+            tags
+        limit: Maximum number of evaluators to return
+        cursor: next_cursor returned with the previous page
+
+    Returns:
+        list: All evaluator configurations, when no filter or page is requested
+        dict: Otherwise the matching evaluators, their total count and the
+            next_cursor of the following page, None on the last page
+    """
+    try:
+        evaluators = await fetch_evaluators()
+        if tags is None and search is None and limit is None and cursor is None:
+            return project_fields(evaluators, fields)
+        return get_evaluator_index(evaluators).page(
+            tags=tags, search=search, limit=limit, cursor=cursor, fields=fields
+        )
+    except Exception as e:
+        logger.error("Failed to fetch evaluators: %s", e, exc_info=True)
+        return {"error": str(e)}
+
+
+async def search_evaluators(
+    tags: Optional[List[str]] = None,
+    required_keys: Optional[List[str]] = None,
+    available_keys: Optional[List[str]] = None,
+    query: Optional[str] = None,
+    fields: Optional[List[str]] = None,
+    limit: Optional[int] = SEARCH_EVALUATORS_LIMIT,
+) -> dict:
+    """Search the evaluator catalog through its inverted index.
+
+    Args:
+        tags: Only evaluators carrying all of these tags, e.g. ["RAG"]
+        required_keys: Only evaluators requiring all of these keys
+        available_keys: Only evaluators whose required keys are all in this list
+        query: Words that must each start a word of the name, description or tags
+        fields: Keys of each evaluator to return, defaults to a short summary
+        limit: Maximum number of evaluators to return, a positive integer
+
     Returns:
-        dict: Dictionary containing all evaluator configurations
+        dict: The matching evaluators, in catalog order, and their total count
     """
     try:
-        logger.info("Fetching evaluators")
-        eval_client = EvalClient()
-        evaluators = eval_client.list_evaluations()
-        evaluators.sort(
-            key=lambda x: x["eval_tags"] and "CUSTOM" in x["eval_tags"], reverse=True
+        check_limit(limit)
+        evaluators = await fetch_evaluators()
+        index = get_evaluator_index(evaluators)
+        ids = index.search(
+            tags=tags, required=required_keys, available=available_keys, query=query
         )
-        logger.info(f"Evaluators: {evaluators}")
-        return evaluators
+        matches = [index.evaluators[ident] for ident in ids[:limit]]
+        return {
+            "evaluators": project_fields(matches, fields or SEARCH_EVALUATORS_FIELDS),
+            "total": len(ids),
+        }
     except Exception as e:
-        logger.error(f"Failed to fetch evaluators: {str(e)}", exc_info=True)
+        logger.error("Failed to search evaluators: %s", e, exc_info=True)
         return {"error": str(e)}
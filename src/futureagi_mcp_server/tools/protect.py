@@ -1,16 +1,42 @@
-from typing import Dict, List
+import asyncio
+import hashlib
+import json
+import time
+import unicodedata
+from typing import Any, Dict, List, Optional
 
-from fi.evals import EvalClient, ProtectClient
-
-from ..constants import DEFAULT_PROTECT_ACTION, DEFAULT_PROTECT_TIMEOUT
+from ..cache import protect_cache
+from ..clients import get_client_registry
+from ..constants import (
+    DEFAULT_PROTECT_ACTION,
+    DEFAULT_PROTECT_TIMEOUT,
+    PROTECT_BATCH_MAX_IN_FLIGHT,
+    PROTECT_PREFILTER,
+)
+from ..executor import get_executor
 from ..logger import get_logger
+from ..prefilter import Prefilter, PrefilterMatch, get_prefilter, is_media_reference
+from ..progress import get_progress_reporter
+from .descriptions import PROTECT_BATCH_DESCRIPTION  # noqa: F401
+from .descriptions import PROTECT_DESCRIPTION  # noqa: F401
 
 logger = get_logger()
 
-PROTECT_DESCRIPTION = """
+PROTECT_METRICS = ("Toxicity", "Tone", "Sexism", "Prompt Injection", "Data Privacy")
+RULE_TYPES = ("any", "all")
+
+
+async def protect(
+    inputs: str,
+    protect_rules: List[Dict],
+    action: str = DEFAULT_PROTECT_ACTION,
+    reason: bool = False,
+    timeout: int = DEFAULT_PROTECT_TIMEOUT,
+    prefilter: Optional[bool] = None,
+) -> Dict:
+    """
     Protect input strings against harmful content using a list of protection rules.
     Do not use this tool for evaluating content. Use the evaluate tool for evaluating content.
-    Use Protect only when the user explicitly uses the word protect or protection in the prompt.
 
     Args:
         inputs: Single string to evaluate. Can be text, image file path/URL, or audio file path/URL
@@ -22,6 +48,8 @@ PROTECT_DESCRIPTION = """
         action: Default action message when rules fail. Defaults to DEFAULT_PROTECT_ACTION
         reason: Whether to include failure reason in output. Defaults to False
         timeout: Timeout for evaluations in milliseconds. Defaults to DEFAULT_PROTECT_TIMEOUT
+        prefilter: Fail obvious personal data and prompt injections locally,
+            before calling the API. Defaults to FI_MCP_PROTECT_PREFILTER
 
     Returns:
         Dict with protection results containing:
@@ -32,59 +60,373 @@ PROTECT_DESCRIPTION = """
             - failed_rule: Name of failed rule, or None if passed
             - reason: Explanation for failure if reason=True
             - time_taken: Total evaluation duration
+            - decided_by: 'prefilter' if failed locally, 'cache' if the same
+              check was decided recently, 'upstream' otherwise
     """
+    try:
+        rules = prepare_rules(protect_rules, action, reason)
+        protect_client = get_client_registry().protect_client()
+        return await check_rules(
+            protect_client, inputs, rules, timeout, _resolve_prefilter(prefilter)
+        )
+    except Exception as e:
+        logger.error("Error during protection evaluation: %s", e, exc_info=True)
+        return _error_result(e)
 
 
-async def protect(
+def _error_result(error: Any) -> Dict:
+    return {
+        "status": "error",
+        "messages": f"Error during protection evaluation: {error}",
+    }
+
+
+def prepare_rules(protect_rules: List[Dict], action: str, reason: bool) -> List[Dict]:
+    """Validate protect rules and fill in their defaults, as the SDK does.
+
+    Args:
+        protect_rules: Rules given by the caller, left unchanged
+        action: Message returned when a rule fails
+        reason: Whether failing rules report their reason
+
+    Returns:
+        list: New rules with their contains, type, action and reason set
+
+    Raises:
+        ValueError, TypeError: If a rule is invalid
+    """
+    if not isinstance(protect_rules, list):
+        raise TypeError("protect_rules must be a list")
+    if not protect_rules:
+        raise ValueError("protect_rules cannot be empty")
+    rules = []
+    for i, rule in enumerate(protect_rules):
+        if not isinstance(rule, dict):
+            raise TypeError(f"Rule at index {i} must be a dictionary")
+        if "metric" not in rule:
+            raise ValueError(f"Rule at index {i} is missing required key 'metric'")
+        metric = rule["metric"]
+        if metric not in PROTECT_METRICS:
+            raise ValueError(
+                f"Invalid metric '{metric}' at index {i}. "
+                f"Valid metrics are: {list(PROTECT_METRICS)}"
+            )
+        allowed = {"metric", "contains", "type"} if metric == "Tone" else {"metric"}
+        invalid = set(rule) - allowed
+        if invalid:
+            raise ValueError(
+                f"Invalid key(s) found in rule at index {i}: {invalid}. "
+                f"Valid keys are: {allowed}"
+            )
+        if metric == "Tone":
+            contains = rule.get("contains")
+            if not isinstance(contains, list) or not contains:
+                raise ValueError("'contains' must be a non-empty list for Tone metric")
+            rule_type = rule.get("type", "any")
+            if rule_type not in RULE_TYPES:
+                raise ValueError(
+                    f"Invalid type '{rule_type}' at index {i}. "
+                    f"Must be one of: {list(RULE_TYPES)}"
+                )
+        else:
+            contains, rule_type = ["Failed"], "any"
+        rules.append(
+            {
+                "metric": metric,
+                "contains": list(contains),
+                "type": rule_type,
+                "action": action,
+                "reason": reason,
+            }
+        )
+    return rules
+
+
+def _build_test_case(inputs: str):
+    from fi.testcases import MLLMTestCase
+
+    return MLLMTestCase(input=inputs, call_type="protect")
+
+
+def normalize_input(inputs: str) -> str:
+    """Normalize the unicode form and whitespace of a protect input."""
+    return " ".join(unicodedata.normalize("NFC", inputs).split())
+
+
+def protect_cache_key(inputs: str, rules: List[Dict]) -> str:
+    """Return the cache key of a protect decision.
+
+    The key is a hash of the normalized input and of the rules in a
+    canonical form, so the order of the rules and of the Tone values they
+    contain does not matter.
+
+    Args:
+        inputs: Input of the protect call
+        rules: Rules returned by ``prepare_rules``
+    """
+    canonical_rules = sorted(
+        json.dumps({**rule, "contains": sorted(rule["contains"])}, sort_keys=True)
+        for rule in rules
+    )
+    payload = json.dumps([normalize_input(inputs), canonical_rules])
+    return hashlib.sha256(payload.encode()).hexdigest()
+
+
+def _resolve_prefilter(enabled: Optional[bool]) -> Optional[Prefilter]:
+    """Return the prefilter when enabled, by the caller or FI_MCP_PROTECT_PREFILTER."""
+    if enabled is None:
+        enabled = PROTECT_PREFILTER
+    return get_prefilter() if enabled else None
+
+
+def _prefilter_result(rules: List[Dict], match: PrefilterMatch) -> Dict:
+    """Build the protect result of an input failed by the prefilter."""
+    failed = next(rule for rule in rules if rule["metric"] == match.metric)
+    return {
+        "status": "failed",
+        "completed_rules": [match.metric],
+        "uncompleted_rules": [rule["metric"] for rule in rules if rule is not failed],
+        "failed_rule": match.metric,
+        "messages": failed["action"],
+        "reasons": f"Local prefilter matched {match.kind}" if failed["reason"] else "",
+        "time_taken": 0.0,
+        "decided_by": "prefilter",
+    }
+
+
+async def check_rules(
+    protect_client: Any,
     inputs: str,
+    rules: List[Dict],
+    timeout: float,
+    prefilter: Optional[Prefilter] = None,
+    tool_name: str = "protect",
+) -> Dict:
+    """Check one input against prepared protect rules, all rules at once.
+
+    Every rule is checked concurrently on the protect client's threads. The
+    first rule that triggers decides the result and the checks still running
+    are abandoned, so a failing input costs about one rule's latency. While
+    its rules are checked, the input holds a slot of the concurrency limit
+    of the tool.
+
+    Args:
+        protect_client: Protect client whose evaluator checks the rules
+        inputs: String to check, text or an image or audio path/URL
+        rules: Rules returned by ``prepare_rules``
+        timeout: Budget in milliseconds, rules not done by then are uncompleted
+        prefilter: Local prefilter failing clear cases without calling the API
+        tool_name: Tool the check belongs to, used for its concurrency limit
+
+    Returns:
+        dict: The protect result, in the format of ``ProtectClient.protect``,
+            with ``decided_by`` set to "prefilter", "cache" or "upstream"
+    """
+    if not isinstance(inputs, str):
+        raise TypeError(f"inputs must be a string, got {type(inputs)}")
+    if not inputs.strip():
+        raise ValueError("inputs cannot be empty or whitespace")
+    started = time.perf_counter()
+    if prefilter is not None:
+        match = prefilter.check(inputs, (rule["metric"] for rule in rules))
+        if match is not None:
+            result = _prefilter_result(rules, match)
+            result["time_taken"] = time.perf_counter() - started
+            return result
+    cache_key = None
+    if protect_cache.ttl > 0 and not is_media_reference(inputs):
+        cache_key = protect_cache_key(inputs, rules)
+        cached = await protect_cache.aget(cache_key)
+        if cached is not None:
+            result = dict(cached)
+            if result["status"] == "passed":
+                result["messages"] = inputs
+            result["time_taken"] = time.perf_counter() - started
+            result["decided_by"] = "cache"
+            return result
+    deadline = started + timeout / 1000
+    async with get_executor().slot(tool_name):
+        completed, failed_rule, message, failure_reason = await _check_upstream(
+            protect_client, inputs, rules, deadline
+        )
+
+    completed_rules = [rules[index]["metric"] for index in completed]
+    uncompleted_rules = [
+        rule["metric"] for index, rule in enumerate(rules) if index not in completed
+    ]
+    result = {
+        "status": "failed" if failed_rule else "passed",
+        "completed_rules": completed_rules,
+        "uncompleted_rules": uncompleted_rules,
+        "failed_rule": failed_rule,
+        "messages": message if failed_rule else inputs,
+        "reasons": failure_reason if failed_rule else "All checks passed",
+        "time_taken": time.perf_counter() - started,
+        "decided_by": "upstream",
+    }
+    if not completed_rules:
+        result["reason"] = "No checks completed"
+    elif cache_key is not None and (failed_rule or not uncompleted_rules):
+        # Only decisions are cached, not results cut short by the timeout. The
+        # input passed back is never stored, hits get the current one.
+        decision = {key: value for key, value in result.items() if key != "messages"}
+        if failed_rule:
+            decision["messages"] = message
+        await protect_cache.aset(cache_key, decision)
+    return result
+
+
+async def _check_upstream(
+    protect_client: Any, inputs: str, rules: List[Dict], deadline: float
+) -> tuple:
+    """Check the rules with the API until one triggers or the deadline passes.
+
+    Returns:
+        tuple: Indexes of the completed rules, and the metric, message and
+            reason of the rule that triggered, None when none did
+    """
+    loop = asyncio.get_running_loop()
+    executor = protect_client.executor
+    test_case = await loop.run_in_executor(executor, _build_test_case, inputs)
+
+    pending = {
+        asyncio.ensure_future(
+            loop.run_in_executor(
+                executor, protect_client._check_rule_sync, rule, test_case
+            )
+        ): index
+        for index, rule in enumerate(rules)
+    }
+    completed: List[int] = []
+    failed_rule = message = failure_reason = None
+    try:
+        while pending and failed_rule is None:
+            remaining = deadline - time.perf_counter()
+            if remaining <= 0:
+                break
+            done, _ = await asyncio.wait(
+                pending, timeout=remaining, return_when=asyncio.FIRST_COMPLETED
+            )
+            for future in done:
+                index = pending.pop(future)
+                try:
+                    metric, triggered, rule_message, rule_reason = future.result()
+                except Exception as e:
+                    # As in the SDK, a rule that errors is left uncompleted
+                    logger.warning(
+                        "Error processing rule %s: %s", rules[index]["metric"], e
+                    )
+                    continue
+                completed.append(index)
+                if triggered and failed_rule is None:
+                    failed_rule = metric
+                    message, failure_reason = rule_message, rule_reason
+    finally:
+        # Checks already running finish on their thread, their result is dropped
+        for future in pending:
+            future.cancel()
+    return completed, failed_rule, message, failure_reason
+
+
+async def protect_batch(
+    inputs: List[str],
     protect_rules: List[Dict],
     action: str = DEFAULT_PROTECT_ACTION,
     reason: bool = False,
     timeout: int = DEFAULT_PROTECT_TIMEOUT,
+    max_in_flight: int = PROTECT_BATCH_MAX_IN_FLIGHT,
+    prefilter: Optional[bool] = None,
 ) -> Dict:
     """
-    Protect input strings against harmful content using a list of protection rules.
-    Do not use this tool for evaluating content. Use the evaluate tool for evaluating content.
+    Protect many input strings against harmful content in a single call.
+
+    The inputs are screened concurrently through one shared protect client,
+    each against every rule, as the protect tool would.
 
     Args:
-        inputs: Single string to evaluate. Can be text, image file path/URL, or audio file path/URL
-        protect_rules: List of protection rule dictionaries. Each rule must contain:
-            - metric: str, name of the metric to evaluate ('Toxicity', 'Tone', 'Sexism', 'Prompt Injection', 'Data Privacy')
-            - contains: List[str], required for Tone metric only. Possible values: neutral, joy, love, fear, surprise,
-                       sadness, anger, annoyance, confusion
-            - type: str, required for Tone metric only. Either 'any' (default) or 'all'
+        inputs: Strings to evaluate, e.g. the messages of a conversation
+        protect_rules: List of protection rule dictionaries, as for protect
         action: Default action message when rules fail. Defaults to DEFAULT_PROTECT_ACTION
         reason: Whether to include failure reason in output. Defaults to False
-        timeout: Timeout for evaluations in milliseconds. Defaults to DEFAULT_PROTECT_TIMEOUT
+        timeout: Deadline in milliseconds for the whole batch. Defaults to DEFAULT_PROTECT_TIMEOUT
+        max_in_flight: Maximum number of inputs screened concurrently
+        prefilter: Fail obvious personal data and prompt injections locally,
+            before calling the API. Defaults to FI_MCP_PROTECT_PREFILTER
 
     Returns:
-        Dict with protection results containing:
-            - status: 'passed' or 'failed'
-            - messages: Action message if failed, original input if passed
-            - completed_rules: List of rules that were evaluated
-            - uncompleted_rules: List of rules not evaluated due to failure/timeout
-            - failed_rule: Name of failed rule, or None if passed
-            - reason: Explanation for failure if reason=True
-            - time_taken: Total evaluation duration
+        Dict with:
+            - results: One protect result per input, in input order. Inputs not
+              screened before the deadline get the status 'timeout'
+            - passed, failed, errors, timed_out: Number of inputs per status
+            - decided_locally: Number of inputs failed by the prefilter
+            - time_taken: Duration of the batch in seconds
     """
     try:
-        eval_client = EvalClient()
-        protect_client = ProtectClient(evaluator=eval_client)
-
-        # Convert timeout from milliseconds to microseconds for the client
-        client_timeout = timeout * 1000
-        result = protect_client.protect(
-            inputs=inputs,
-            protect_rules=protect_rules,
-            action=action,
-            reason=reason,
-            timeout=client_timeout,
-        )
+        if not isinstance(inputs, list) or not inputs:
+            raise ValueError("inputs must be a non-empty list of strings")
+        started = time.perf_counter()
+        rules = prepare_rules(protect_rules, action, reason)
+        local = _resolve_prefilter(prefilter)
+        protect_client = get_client_registry().protect_client()
+        progress = get_progress_reporter()
+        semaphore = asyncio.Semaphore(max(1, max_in_flight))
+        deadline = started + timeout / 1000
+        screened = 0
 
-        return result
-    except Exception as e:
-        logger.error(f"Error during protection evaluation: {e}", exc_info=True)
+        async def screen(text: str) -> Dict:
+            nonlocal screened
+            async with semaphore:
+                remaining = (deadline - time.perf_counter()) * 1000
+                if remaining <= 0:
+                    raise asyncio.TimeoutError
+                try:
+                    result = await check_rules(
+                        protect_client, text, rules, remaining, local, "protect_batch"
+                    )
+                    if (
+                        not result["completed_rules"]
+                        and time.perf_counter() >= deadline
+                    ):
+                        raise asyncio.TimeoutError
+                    return result
+                finally:
+                    screened += 1
+                    await progress.update(screened, total=len(inputs))
+
+        tasks = [asyncio.ensure_future(screen(text)) for text in inputs]
+        _, pending = await asyncio.wait(tasks, timeout=timeout / 1000)
+        for task in pending:
+            task.cancel()
+        await asyncio.gather(*pending, return_exceptions=True)
+
+        results = []
+        for task in tasks:
+            error = None if task.cancelled() else task.exception()
+            if task in pending or isinstance(error, asyncio.TimeoutError):
+                results.append(
+                    {
+                        "status": "timeout",
+                        "messages": "Deadline reached before the input was screened",
+                    }
+                )
+            elif error is not None:
+                logger.warning("Error during protection evaluation: %s", error)
+                results.append(_error_result(error))
+            else:
+                results.append(task.result())
+
+        statuses = [result.get("status") for result in results]
         return {
-            "status": "error",
-            "messages": f"Error during protection evaluation: {e}",
+            "results": results,
+            "passed": statuses.count("passed"),
+            "failed": statuses.count("failed"),
+            "errors": statuses.count("error"),
+            "timed_out": statuses.count("timeout"),
+            "decided_locally": sum(
+                result.get("decided_by") == "prefilter" for result in results
+            ),
+            "time_taken": time.perf_counter() - started,
         }
+    except Exception as e:
+        logger.error("Error during batch protection evaluation: %s", e, exc_info=True)
+        return _error_result(e)
@@ -0,0 +1,211 @@
+"""Optional tracing of tool calls, SDK requests, cache lookups and serialization.
+
+Spans are opened through the OpenTelemetry API, so they join the traces of an
+application that already configured OpenTelemetry. Without
+``opentelemetry-api`` installed, opening a span costs a single check, and
+until a tracer provider is configured the spans are not recorded.
+
+The ``otel`` extra installs the SDK, the exporters and the instrumentation of
+``requests``. ``setup_tracing`` then exports spans to the exporter named by
+FI_MCP_TRACE_EXPORTER, and requests sent to the FutureAGI API get a span and
+the W3C ``traceparent`` header of that span.
+"""
+
+import importlib
+import os
+from typing import Any, Callable, Optional
+
+from .constants import SERVER_NAME, TRACE_EXPORTER, TRACE_FILE
+from .logger import get_logger
+
+try:
+    from opentelemetry import trace
+    from opentelemetry.trace import Status, StatusCode
+except ImportError:
+    trace = None
+
+logger = get_logger()
+
+TRACER_NAME = "futureagi_mcp_server"
+
+
+class _NoSpanScope:
+    """Scope used while tracing is disabled, yielding no span."""
+
+    __slots__ = ()
+
+    def __enter__(self) -> None:
+        return None
+
+    def __exit__(self, exc_type, exc, tb):
+        return None
+
+
+_NO_SPAN = _NoSpanScope()
+
+
+class Tracer:
+    """Opens spans through the OpenTelemetry API.
+
+    Spans go to the global tracer provider, configured by ``setup_tracing``
+    or by the application hosting the server.
+
+    Args:
+        name: Name of the instrumentation scope of the spans
+    """
+
+    def __init__(self, name: str = TRACER_NAME):
+        self._tracer = trace.get_tracer(name) if trace is not None else None
+
+    @property
+    def enabled(self) -> bool:
+        return self._tracer is not None
+
+    def span(self, name: str, **attributes):
+        """Open a span that is current for the duration of a with block.
+
+        Exceptions raised in the block mark the span as failed. The block
+        receives None when opentelemetry-api is not installed.
+        """
+        if self._tracer is None:
+            return _NO_SPAN
+        return self._tracer.start_as_current_span(name, attributes=attributes)
+
+
+def record_error(span: Any, error: Any):
+    """Mark a span as failed, with an exception or an error message."""
+    if span is None:
+        return
+    if isinstance(error, BaseException):
+        span.record_exception(error)
+    span.set_status(Status(StatusCode.ERROR, str(error)))
+
+
+tracer = Tracer()
+
+
+def _file_exporter(path: str) -> Any:
+    """Build an exporter appending finished spans to a file as JSON lines."""
+    from opentelemetry.sdk.trace.export import ConsoleSpanExporter
+
+    os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+    return ConsoleSpanExporter(
+        out=open(path, "a"),
+        formatter=lambda span: span.to_json(indent=None) + "\n",
+    )
+
+
+def create_exporter(name: str) -> Optional[Any]:
+    """Build the span exporter named by FI_MCP_TRACE_EXPORTER.
+
+    Args:
+        name: "otlp", "console", "file", "memory", the "module:Class" path of
+            an OpenTelemetry span exporter, or empty to disable tracing
+
+    Returns:
+        The exporter, or None when tracing is disabled
+
+    Raises:
+        ImportError: If the otel extra is not installed
+    """
+    if not name:
+        return None
+    if name == "otlp":
+        from opentelemetry.exporter.otlp.proto.http.trace_exporter import (
+            OTLPSpanExporter,
+        )
+
+        return OTLPSpanExporter()
+    if name == "console":
+        from opentelemetry.sdk.trace.export import ConsoleSpanExporter
+
+        return ConsoleSpanExporter()
+    if name == "file":
+        return _file_exporter(TRACE_FILE)
+    if name == "memory":
+        from opentelemetry.sdk.trace.export.in_memory_span_exporter import (
+            InMemorySpanExporter,
+        )
+
+        return InMemorySpanExporter()
+    module_name, _, class_name = name.partition(":")
+    return getattr(importlib.import_module(module_name), class_name)()
+
+
+def has_tracer_provider() -> bool:
+    """Return whether a global tracer provider was already set."""
+    return not isinstance(
+        trace.get_tracer_provider(),
+        (trace.ProxyTracerProvider, trace.NoOpTracerProvider),
+    )
+
+
+def configure_tracing(exporter: Callable[[], Any], batch: bool = True) -> Any:
+    """Install a global tracer provider exporting spans to an exporter.
+
+    OpenTelemetry allows one global tracer provider per process. When the
+    hosting application already set one, it is kept and no exporter is
+    built. Requests are instrumented either way.
+
+    Args:
+        exporter: Builds the OpenTelemetry span exporter
+        batch: Export spans in batches from a background thread, instead of
+            as each span ends
+
+    Returns:
+        The global tracer provider
+    """
+    from opentelemetry.sdk.resources import Resource
+    from opentelemetry.sdk.trace import TracerProvider
+    from opentelemetry.sdk.trace.export import BatchSpanProcessor, SimpleSpanProcessor
+
+    if has_tracer_provider():
+        logger.info("Keeping the tracer provider set by the application")
+    else:
+        provider = TracerProvider(
+            resource=Resource.create({"service.name": SERVER_NAME})
+        )
+        processor = BatchSpanProcessor if batch else SimpleSpanProcessor
+        provider.add_span_processor(processor(exporter()))
+        trace.set_tracer_provider(provider)
+    instrument_requests()
+    return trace.get_tracer_provider()
+
+
+def instrument_requests() -> bool:
+    """Trace the requests sent with ``requests``, the HTTP stack of the SDK.
+
+    Each request gets a span, a child of the current span, and carries the
+    traceparent header of that span.
+
+    Returns:
+        bool: Whether the requests instrumentation is installed
+    """
+    try:
+        from opentelemetry.instrumentation.requests import RequestsInstrumentor
+    except ImportError:
+        return False
+    instrumentor = RequestsInstrumentor()
+    if not instrumentor.is_instrumented_by_opentelemetry:
+        instrumentor.instrument()
+    return True
+
+
+def setup_tracing(name: str = TRACE_EXPORTER) -> Optional[Any]:
+    """Export spans to the exporter named by FI_MCP_TRACE_EXPORTER, if any.
+
+    Tracing stays disabled, with a warning, when the otel extra is missing.
+
+    Returns:
+        The tracer provider, or None when tracing is disabled
+    """
+    if not name:
+        return None
+    try:
+        return configure_tracing(lambda: create_exporter(name), batch=name != "memory")
+    except ImportError as e:
+        logger.warning(
+            "Tracing disabled, install futureagi-mcp-server[otel] to export spans: %s",
+            e,
+        )
+        return None
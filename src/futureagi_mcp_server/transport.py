@@ -0,0 +1,379 @@
+"""Transports the FutureAGI MCP server can be served over."""
+
+import hmac
+import ipaddress
+import os
+import shutil
+import tempfile
+from contextlib import asynccontextmanager
+from typing import Callable, Optional
+
+import anyio
+import mcp
+from mcp.server import NotificationOptions, Server
+from mcp.server.models import InitializationOptions
+from mcp.server.sse import SseServerTransport
+from starlette.applications import Starlette
+from starlette.middleware import Middleware
+from starlette.requests import Request
+from starlette.responses import JSONResponse, PlainTextResponse
+from starlette.routing import Mount, Route
+
+from .constants import (
+    AUTH_TOKEN,
+    MESSAGES_PATH,
+    SERVER_NAME,
+    SERVER_VERSION,
+    SHUTDOWN_TIMEOUT,
+    SSE_PATH,
+    STATE_DIR,
+    WARMUP,
+)
+from .executor import get_executor
+from .logger import get_logger
+from .metrics import metrics
+from .workers import LoadReporter, WorkerMessageRouter, read_worker_loads
+
+logger = get_logger()
+
+
+def build_init_options(server: Server) -> InitializationOptions:
+    """Build the options the server announces when a session is initialized."""
+    return InitializationOptions(
+        server_name=SERVER_NAME,
+        server_version=SERVER_VERSION,
+        capabilities=server.get_capabilities(
+            notification_options=NotificationOptions(),
+            experimental_capabilities={},
+        ),
+    )
+
+
+async def run_stdio(server: Server):
+    """Serve a single client over stdin and stdout."""
+    async with mcp.server.stdio.stdio_server() as (read_stream, write_stream):
+        await server.run(read_stream, write_stream, build_init_options(server))
+
+
+def is_loopback(host: str) -> bool:
+    """Tell whether a listening address only accepts local connections."""
+    if host == "localhost":
+        return True
+    try:
+        return ipaddress.ip_address(host).is_loopback
+    except ValueError:
+        return False
+
+
+def check_bind(host: str, auth_token: Optional[str]):
+    """Refuse to serve the tools beyond this machine without authentication.
+
+    Raises:
+        ValueError: If host is not a loopback address and no token is set
+    """
+    if not auth_token and not is_loopback(host):
+        raise ValueError(
+            f"Listening on {host} exposes the tools, and the API keys they run "
+            "with, to other hosts. Set FI_MCP_AUTH_TOKEN or --auth-token to "
+            "require a bearer token, or listen on 127.0.0.1."
+        )
+
+
+class BearerAuthMiddleware:
+    """ASGI middleware rejecting requests without the expected bearer token.
+
+    Args:
+        app: App to protect
+        token: Token clients send as "Authorization: Bearer <token>"
+        public_paths: Paths served without a token
+    """
+
+    def __init__(self, app, token: str, public_paths=("/health",)):
+        self.app = app
+        self.expected = f"Bearer {token}".encode()
+        self.public_paths = frozenset(public_paths)
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http" or scope["path"] in self.public_paths:
+            await self.app(scope, receive, send)
+            return
+        authorization = dict(scope["headers"]).get(b"authorization", b"")
+        if hmac.compare_digest(authorization, self.expected):
+            await self.app(scope, receive, send)
+            return
+        response = JSONResponse(
+            {"error": "Missing or invalid bearer token"},
+            status_code=401,
+            headers={"WWW-Authenticate": "Bearer"},
+        )
+        await response(scope, receive, send)
+
+
+class SseEndpoint:
+    """ASGI app running one MCP session per SSE connection.
+
+    Every session is served by the same ``Server``, so they share its tool
+    registry, pooled SDK clients, caches and worker pool.
+    """
+
+    def __init__(self, server: Server, transport: SseServerTransport):
+        self.server = server
+        self.transport = transport
+        self.init_options = build_init_options(server)
+        self.active_sessions = 0
+
+    async def __call__(self, scope, receive, send):
+        disconnected = anyio.Event()
+
+        async def receive_or_disconnect():
+            message = await receive()
+            if message["type"] == "http.disconnect":
+                disconnected.set()
+            return message
+
+        async with self.transport.connect_sse(scope, receive_or_disconnect, send) as (
+            read_stream,
+            write_stream,
+        ):
+            self.active_sessions += 1
+            logger.info("SSE session opened, %d active", self.active_sessions)
+            try:
+                async with anyio.create_task_group() as task_group:
+                    # The read stream is never closed by the transport, so a
+                    # client that goes away would leave its session running
+                    async def close_on_disconnect():
+                        await disconnected.wait()
+                        task_group.cancel_scope.cancel()
+
+                    task_group.start_soon(close_on_disconnect)
+                    await self.server.run(read_stream, write_stream, self.init_options)
+                    task_group.cancel_scope.cancel()
+            finally:
+                self.active_sessions -= 1
+                logger.info("SSE session closed, %d active", self.active_sessions)
+
+
+def create_sse_app(
+    server: Server,
+    on_shutdown: Optional[Callable[[], None]] = None,
+    worker_id: Optional[str] = None,
+    state_dir: Optional[str] = None,
+    on_startup: Optional[Callable[[], None]] = None,
+    auth_token: Optional[str] = None,
+) -> Starlette:
+    """Create an ASGI app serving many MCP clients over SSE.
+
+    Args:
+        server: MCP server shared by every session
+        on_shutdown: Called once when the app shuts down
+        worker_id: Id of this process when several workers share the socket
+        state_dir: Directory shared by the workers, required with worker_id
+        on_startup: Called once the app is started, inside its event loop
+        auth_token: Bearer token required on every endpoint but /health,
+            None serves them without authentication
+
+    Returns:
+        Starlette: App exposing the SSE stream, the message endpoint, /health
+            and /metrics, plus /workers when running as one of several workers
+    """
+    if worker_id is None:
+        transport = SseServerTransport(MESSAGES_PATH)
+    else:
+        transport = SseServerTransport(f"{MESSAGES_PATH}{worker_id}/")
+    sse_endpoint = SseEndpoint(server, transport)
+
+    async def health(request: Request) -> JSONResponse:
+        return JSONResponse(
+            {"status": "ok", "active_sessions": sse_endpoint.active_sessions}
+        )
+
+    labels = {"worker": worker_id} if worker_id is not None else None
+
+    async def prometheus_metrics(request: Request) -> PlainTextResponse:
+        return PlainTextResponse(
+            metrics.render_prometheus(labels),
+            media_type="text/plain; version=0.0.4",
+        )
+
+    routes = [
+        Route(SSE_PATH, endpoint=sse_endpoint),
+        Route("/health", endpoint=health),
+        Route("/metrics", endpoint=prometheus_metrics),
+    ]
+    router = reporter = None
+    if worker_id is None:
+        routes.append(Mount(MESSAGES_PATH, app=transport.handle_post_message))
+    else:
+        router = WorkerMessageRouter(transport, worker_id, state_dir)
+        reporter = LoadReporter(
+            worker_id,
+            state_dir,
+            lambda: {
+                "active_sessions": sse_endpoint.active_sessions,
+                "in_flight_calls": get_executor().in_flight,
+            },
+        )
+
+        async def workers(request: Request) -> JSONResponse:
+            return JSONResponse({"workers": read_worker_loads(state_dir)})
+
+        routes += [
+            Route(f"{MESSAGES_PATH}{{worker_id}}/", endpoint=router, methods=["POST"]),
+            Route("/workers", endpoint=workers),
+        ]
+
+    @asynccontextmanager
+    async def lifespan(app: Starlette):
+        if router is not None:
+            await router.start()
+            reporter.start()
+        if on_startup is not None:
+            on_startup()
+        try:
+            yield
+        finally:
+            if router is not None:
+                await reporter.stop()
+                await router.stop()
+            if on_shutdown is not None:
+                on_shutdown()
+
+    middleware = []
+    if auth_token:
+        middleware.append(Middleware(BearerAuthMiddleware, token=auth_token))
+    return Starlette(routes=routes, lifespan=lifespan, middleware=middleware)
+
+
+def run_sse(
+    server: Server,
+    host: str,
+    port: int,
+    on_shutdown: Optional[Callable[[], None]] = None,
+    shutdown_timeout: float = SHUTDOWN_TIMEOUT,
+    on_startup: Optional[Callable[[], None]] = None,
+    auth_token: Optional[str] = AUTH_TOKEN,
+):
+    """Serve MCP clients over SSE until the process is interrupted.
+
+    On SIGINT or SIGTERM the listener stops accepting connections and open
+    sessions get shutdown_timeout seconds to finish before they are closed.
+
+    Args:
+        server: MCP server shared by every session
+        host: Interface to listen on
+        port: Port to listen on
+        on_shutdown: Called once after the last session is closed
+        shutdown_timeout: Seconds to wait for open sessions on shutdown
+        on_startup: Called once the server is started, inside its event loop
+        auth_token: Bearer token clients must send, required unless host is
+            a loopback address
+
+    Raises:
+        ValueError: If host is not a loopback address and no token is set
+    """
+    import uvicorn
+
+    check_bind(host, auth_token)
+    app = create_sse_app(
+        server,
+        on_shutdown=on_shutdown,
+        on_startup=on_startup,
+        auth_token=auth_token,
+    )
+    logger.info("Serving MCP over SSE on http://%s:%s%s", host, port, SSE_PATH)
+    uvicorn.run(
+        app,
+        host=host,
+        port=port,
+        timeout_graceful_shutdown=shutdown_timeout,
+        log_config=None,
+    )
+
+
+def create_worker_app() -> Starlette:
+    """App factory run in every worker process of the multi-worker mode.
+
+    Credentials and settings are inherited from the parent through the
+    environment.
+    """
+    from .server import get_server, shutdown_server
+    from .warmup import log_ready, start_warmup
+
+    def on_startup():
+        log_ready()
+        if WARMUP:
+            start_warmup()
+
+    server = get_server(
+        api_key=os.environ["FI_API_KEY"],
+        secret_key=os.environ["FI_SECRET_KEY"],
+        base_url=os.environ["FI_BASE_URL"],
+    )
+    return create_sse_app(
+        server,
+        on_shutdown=shutdown_server,
+        worker_id=str(os.getpid()),
+        state_dir=STATE_DIR,
+        on_startup=on_startup,
+        auth_token=os.environ.get("FI_MCP_AUTH_TOKEN"),
+    )
+
+
+def run_sse_workers(
+    host: str,
+    port: int,
+    workers: int,
+    shutdown_timeout: float = SHUTDOWN_TIMEOUT,
+    auth_token: Optional[str] = AUTH_TOKEN,
+):
+    """Serve MCP clients over SSE from several processes sharing one socket.
+
+    Workers share a state directory used to route client messages to the
+    worker holding their session, to report their load and to share the
+    catalog cache. Without FI_MCP_STATE_DIR a temporary one is created and
+    removed on exit.
+
+    Args:
+        host: Interface to listen on
+        port: Port to listen on
+        workers: Number of worker processes
+        shutdown_timeout: Seconds to wait for open sessions on shutdown
+        auth_token: Bearer token clients must send, required unless host is
+            a loopback address
+
+    Raises:
+        ValueError: If host is not a loopback address and no token is set
+    """
+    import uvicorn
+
+    check_bind(host, auth_token)
+    if auth_token:
+        os.environ["FI_MCP_AUTH_TOKEN"] = auth_token
+    state_dir = STATE_DIR or tempfile.mkdtemp(prefix="futureagi-mcp-")
+    # Workers are spawned fresh and read their settings from the environment
+    os.environ["FI_MCP_STATE_DIR"] = state_dir
+    os.environ.setdefault(
+        "FI_MCP_CATALOG_SHARED_CACHE_DIR", os.path.join(state_dir, "catalog")
+    )
+    logger.info(
+        "Serving MCP over SSE on http://%s:%s%s with %d workers",
+        host,
+        port,
+        SSE_PATH,
+        workers,
+    )
+    try:
+        uvicorn.run(
+            # Import the factory the way this module was imported, so that
+            # checkouts run through main.py work without being installed
+            f"{__name__}:create_worker_app",
+            factory=True,
+            host=host,
+            port=port,
+            workers=workers,
+            timeout_graceful_shutdown=shutdown_timeout,
+            log_config=None,
+        )
+    finally:
+        if not STATE_DIR:
+            shutil.rmtree(state_dir, ignore_errors=True)
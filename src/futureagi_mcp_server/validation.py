@@ -0,0 +1,83 @@
+"""Validation of tool arguments against the input schema of the tool.
+
+Each tool gets a pydantic model built from the JSON schema it advertises
+through tools/list, so arguments are checked before the handler runs and a
+bad call gets a structured error instead of a TypeError from the handler.
+"""
+
+from typing import Any, Dict, List, Literal, Optional, Type
+
+from pydantic import BaseModel, ConfigDict, Field, ValidationError, create_model
+
+_JSON_TYPES = {"string": str, "integer": int, "number": float, "boolean": bool}
+
+
+def _schema_type(schema: Dict[str, Any], name: str) -> Any:
+    """Return the Python type of a JSON schema, nested objects become models."""
+    if "enum" in schema:
+        return Literal[tuple(schema["enum"])]
+    kind = schema.get("type")
+    if kind == "array":
+        item_type = _schema_type(schema.get("items", {}), name)
+        return List[item_type]
+    if kind == "object":
+        if schema.get("properties"):
+            return schema_model(schema, name)
+        return Dict[str, Any]
+    return _JSON_TYPES.get(kind, Any)
+
+
+def schema_model(
+    schema: Dict[str, Any], name: str, extra: str = "allow"
+) -> Type[BaseModel]:
+    """Build a pydantic model validating objects against a JSON schema.
+
+    Supports the subset of JSON schema the tool schemas use: types,
+    properties, required, items and enum.
+
+    Args:
+        schema: JSON schema of an object
+        name: Name of the model, nested models are named after their path
+        extra: "allow" or "forbid" keys missing from the properties
+    """
+    required = set(schema.get("required", ()))
+    fields = {}
+    for position, (key, prop) in enumerate(schema.get("properties", {}).items()):
+        annotation = _schema_type(prop, f"{name}_{key}")
+        # Properties are aliased, so names like "json" or "fields" never
+        # collide with the attributes of BaseModel
+        if key in required:
+            fields[f"field_{position}"] = (annotation, Field(alias=key))
+        else:
+            fields[f"field_{position}"] = (
+                Optional[annotation],
+                Field(default=None, alias=key),
+            )
+    return create_model(name, __config__=ConfigDict(extra=extra), **fields)
+
+
+def input_model(tool_name: str, input_schema: Dict[str, Any]) -> Type[BaseModel]:
+    """Build the model of the arguments of a tool.
+
+    Arguments are passed to the handler as keywords, so arguments missing
+    from the declared properties are rejected. A schema declaring no
+    properties at all accepts any argument.
+    """
+    extra = "forbid" if "properties" in input_schema else "allow"
+    return schema_model(input_schema, f"{tool_name}_arguments", extra=extra)
+
+
+def invalid_arguments(error: ValidationError) -> Dict[str, Any]:
+    """Describe why arguments failed validation, in the tool error format."""
+    problems = [
+        {
+            "argument": ".".join(str(part) for part in problem["loc"]),
+            "message": problem["msg"],
+        }
+        for problem in error.errors(include_url=False)
+    ]
+    summary = "; ".join(
+        f"{problem['argument'] or 'arguments'}: {problem['message']}"
+        for problem in problems
+    )
+    return {"error": f"Invalid arguments: {summary}", "invalid_arguments": problems}
@@ -0,0 +1,108 @@
+"""Background warm-up of catalogs and pooled connections at startup."""
+
+import asyncio
+import os
+import time
+from typing import Any, Dict, List, Optional, Set, Tuple
+
+from .logger import get_logger
+
+logger = get_logger()
+
+# Tool calls whose results are cached, run to fill the catalog cache
+WARMUP_CALLS: List[Tuple[str, Dict[str, Any]]] = [
+    ("all_evaluators", {}),
+    ("get_evals_list_for_create_eval", {"eval_type": "preset"}),
+    ("get_evals_list_for_create_eval", {"eval_type": "user"}),
+]
+
+# Keeps running warm-up tasks referenced until they finish
+_tasks: Set[asyncio.Task] = set()
+
+
+def process_start_time() -> float:
+    """Return the wall clock time the process started.
+
+    Read from /proc where available, otherwise the current time is used.
+    """
+    try:
+        with open("/proc/self/stat") as f:
+            # Fields after the command name, starttime is the 22nd field
+            start_ticks = int(f.read().rsplit(")", 1)[1].split()[19])
+        with open("/proc/uptime") as f:
+            uptime = float(f.read().split()[0])
+        return time.time() - uptime + start_ticks / os.sysconf("SC_CLK_TCK")
+    except (OSError, ValueError, IndexError):
+        return time.time()
+
+
+_process_started_at = process_start_time()
+
+
+def seconds_since_start() -> float:
+    return time.time() - _process_started_at
+
+
+def log_ready():
+    """Log how long the process took to be ready to serve clients."""
+    logger.info("Server ready %.0f ms after start", seconds_since_start() * 1000)
+
+
+async def warm_up(
+    calls: Optional[List[Tuple[str, Dict[str, Any]]]] = None,
+) -> Dict[str, Any]:
+    """Run the warm-up tool calls concurrently.
+
+    The calls import the tool modules and the SDK, open pooled connections
+    and fill the catalog cache, so the first client request finds them warm.
+
+    Args:
+        calls: Tool names and arguments to run, defaults to WARMUP_CALLS
+
+    Returns:
+        dict: Number of calls that succeeded and failed, and the elapsed seconds
+    """
+    from .server import get_tool_registry
+
+    tool_registry = get_tool_registry()
+    start = time.perf_counter()
+
+    async def run(name: str, arguments: Dict[str, Any]) -> bool:
+        try:
+            handler = await tool_registry.resolve(tool_registry.get(name))
+            result = await handler(**arguments)
+        except Exception as e:
+            logger.warning("Warm-up call %s failed: %s", name, e)
+            return False
+        if isinstance(result, dict) and "error" in result:
+            logger.warning("Warm-up call %s failed: %s", name, result["error"])
+            return False
+        return True
+
+    outcomes = await asyncio.gather(
+        *(run(name, arguments) for name, arguments in calls or WARMUP_CALLS)
+    )
+    summary = {
+        "succeeded": sum(outcomes),
+        "failed": len(outcomes) - sum(outcomes),
+        "elapsed": time.perf_counter() - start,
+    }
+    logger.info(
+        "Server warm %.0f ms after start, warm-up took %.0f ms "
+        "(%d succeeded, %d failed)",
+        seconds_since_start() * 1000,
+        summary["elapsed"] * 1000,
+        summary["succeeded"],
+        summary["failed"],
+    )
+    return summary
+
+
+def start_warmup(
+    calls: Optional[List[Tuple[str, Dict[str, Any]]]] = None,
+) -> asyncio.Task:
+    """Start the warm-up in the background of the running event loop."""
+    task = asyncio.create_task(warm_up(calls))
+    _tasks.add(task)
+    task.add_done_callback(_tasks.discard)
+    return task
@@ -0,0 +1,219 @@
+"""Coordination between server processes sharing one listening socket.
+
+With several worker processes behind one socket, the POST carrying a client
+message can be accepted by a different worker than the one holding the SSE
+stream of its session. Every worker therefore advertises a message endpoint
+tagged with its id, and forwards messages meant for another worker over that
+worker's unix socket in the shared state directory.
+"""
+
+import asyncio
+import json
+import os
+import time
+from typing import Callable, Dict, List, Optional
+
+from mcp.server.sse import SseServerTransport
+from starlette.requests import Request
+from starlette.responses import Response
+
+from .constants import LOAD_REPORT_INTERVAL
+from .logger import get_logger
+
+logger = get_logger()
+
+SOCKETS_DIR = "sockets"
+LOAD_DIR = "load"
+
+
+class WorkerMessageRouter:
+    """ASGI app delivering client messages to the worker that owns the session.
+
+    Args:
+        transport: SSE transport of this worker
+        worker_id: Id of this worker, part of its message endpoint
+        state_dir: Directory shared by every worker
+    """
+
+    def __init__(self, transport: SseServerTransport, worker_id: str, state_dir: str):
+        self.transport = transport
+        self.worker_id = worker_id
+        self.sockets_dir = os.path.join(state_dir, SOCKETS_DIR)
+        self._server: Optional[asyncio.AbstractServer] = None
+
+    def socket_path(self, worker_id: str) -> str:
+        return os.path.join(self.sockets_dir, f"{worker_id}.sock")
+
+    async def start(self):
+        """Listen for messages forwarded by other workers."""
+        os.makedirs(self.sockets_dir, exist_ok=True)
+        path = self.socket_path(self.worker_id)
+        if os.path.exists(path):
+            os.remove(path)
+        self._server = await asyncio.start_unix_server(self._handle_forwarded, path)
+
+    async def stop(self):
+        if self._server is not None:
+            self._server.close()
+            await self._server.wait_closed()
+            self._server = None
+        try:
+            os.remove(self.socket_path(self.worker_id))
+        except FileNotFoundError:
+            pass
+
+    async def __call__(self, scope, receive, send):
+        owner = scope["path_params"]["worker_id"]
+        if owner == self.worker_id:
+            await self.transport.handle_post_message(scope, receive, send)
+            return
+
+        body = await Request(scope, receive).body()
+        try:
+            status, text = await self._forward(owner, scope["query_string"], body)
+        except (OSError, ValueError) as e:
+            logger.warning("Failed to forward message to worker %s: %s", owner, e)
+            status, text = 404, "Could not find session"
+        await Response(text, status_code=status)(scope, receive, send)
+
+    async def _forward(self, owner: str, query_string: bytes, body: bytes):
+        reader, writer = await asyncio.open_unix_connection(self.socket_path(owner))
+        try:
+            header = {"query_string": query_string.decode(), "length": len(body)}
+            writer.write(json.dumps(header).encode() + b"\n" + body)
+            await writer.drain()
+            status = int(await reader.readline())
+            text = (await reader.read()).decode()
+            return status, text
+        finally:
+            writer.close()
+
+    async def _handle_forwarded(self, reader, writer):
+        try:
+            header = json.loads(await reader.readline())
+            body = await reader.readexactly(header["length"])
+            response = {"status": 500, "body": b""}
+
+            async def receive():
+                return {"type": "http.request", "body": body, "more_body": False}
+
+            async def send(message):
+                if message["type"] == "http.response.start":
+                    response["status"] = message["status"]
+                elif message["type"] == "http.response.body":
+                    response["body"] += message.get("body", b"")
+                    if not message.get("more_body"):
+                        # Answer before the message is handed to the session,
+                        # which can take until the session reads it
+                        writer.write(
+                            f"{response['status']}\n".encode() + response["body"]
+                        )
+                        await writer.drain()
+                        writer.close()
+
+            scope = {
+                "type": "http",
+                "method": "POST",
+                "path": "/",
+                "query_string": header["query_string"].encode(),
+                "headers": [],
+            }
+            await self.transport.handle_post_message(scope, receive, send)
+        except Exception as e:
+            logger.warning("Failed to handle forwarded message: %s", e)
+            writer.close()
+
+
+class LoadReporter:
+    """Periodically write the load of this worker to the shared state directory.
+
+    Args:
+        worker_id: Id of this worker
+        state_dir: Directory shared by every worker
+        collect: Returns the load figures of this worker
+        interval: Seconds between two reports
+    """
+
+    def __init__(
+        self,
+        worker_id: str,
+        state_dir: str,
+        collect: Callable[[], Dict[str, int]],
+        interval: float = LOAD_REPORT_INTERVAL,
+    ):
+        self.worker_id = worker_id
+        self.path = os.path.join(state_dir, LOAD_DIR, f"{worker_id}.json")
+        self.collect = collect
+        self.interval = interval
+        self.started_at = time.time()
+        self._task: Optional[asyncio.Task] = None
+
+    def report(self):
+        """Write the current load of this worker."""
+        load = {
+            "worker_id": self.worker_id,
+            "pid": os.getpid(),
+            "started_at": self.started_at,
+            "updated_at": time.time(),
+            **self.collect(),
+        }
+        tmp_path = f"{self.path}.tmp"
+        with open(tmp_path, "w") as f:
+            json.dump(load, f)
+        os.replace(tmp_path, self.path)
+
+    async def _run(self):
+        while True:
+            try:
+                self.report()
+            except OSError as e:
+                logger.warning("Failed to report worker load: %s", e)
+            await asyncio.sleep(self.interval)
+
+    def start(self):
+        os.makedirs(os.path.dirname(self.path), exist_ok=True)
+        self._task = asyncio.create_task(self._run())
+
+    async def stop(self):
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+        try:
+            os.remove(self.path)
+        except FileNotFoundError:
+            pass
+
+
+def read_worker_loads(
+    state_dir: str, interval: float = LOAD_REPORT_INTERVAL
+) -> List[dict]:
+    """Read the last load report of every worker.
+
+    Reports older than three intervals are flagged as stale, the worker is
+    likely gone or stuck.
+
+    Args:
+        state_dir: Directory shared by every worker
+        interval: Seconds between two reports of a worker
+
+    Returns:
+        List[dict]: Load reports sorted by worker id
+    """
+    load_dir = os.path.join(state_dir, LOAD_DIR)
+    loads = []
+    now = time.time()
+    for name in sorted(os.listdir(load_dir)) if os.path.isdir(load_dir) else []:
+        if not name.endswith(".json"):
+            continue
+        try:
+            with open(os.path.join(load_dir, name)) as f:
+                load = json.load(f)
+        except (OSError, ValueError):
+            continue
+        load["stale"] = now - load["updated_at"] > 3 * interval
+        loads.append(load)
+    return loads
@@ -0,0 +1,95 @@
+import asyncio
+
+import pytest
+
+from futureagi_mcp_server.batch import run_chunked, split_chunks
+
+
+def test_split_chunks():
+    chunks = split_chunks(list(range(7)), 3)
+
+    assert [chunk.items for chunk in chunks] == [[0, 1, 2], [3, 4, 5], [6]]
+    assert [(chunk.start, chunk.end) for chunk in chunks] == [(0, 3), (3, 6), (6, 7)]
+
+
+@pytest.mark.asyncio
+async def test_results_keep_batch_order():
+    """Test that chunks finishing out of order are returned in batch order"""
+
+    async def worker(items):
+        await asyncio.sleep(0.01 * (10 - items[0]))
+        return [item * 2 for item in items]
+
+    chunks = await run_chunked(list(range(10)), worker, chunk_size=2, max_in_flight=5)
+
+    assert [item for chunk in chunks for item in chunk.result] == [
+        item * 2 for item in range(10)
+    ]
+
+
+@pytest.mark.asyncio
+async def test_in_flight_window_is_bounded():
+    """Test that no more than max_in_flight chunks run at once"""
+    active = 0
+    peak = 0
+
+    async def worker(items):
+        nonlocal active, peak
+        active += 1
+        peak = max(peak, active)
+        await asyncio.sleep(0.01)
+        active -= 1
+        return items
+
+    await run_chunked(list(range(20)), worker, chunk_size=2, max_in_flight=3)
+
+    assert peak == 3
+
+
+@pytest.mark.asyncio
+async def test_only_failed_chunks_are_retried():
+    """Test that a failing chunk is retried without re-running the others"""
+    calls = []
+
+    async def worker(items):
+        calls.append(items[0])
+        if items[0] == 2 and calls.count(2) == 1:
+            raise RuntimeError("temporary failure")
+        return items
+
+    chunks = await run_chunked(
+        list(range(6)), worker, chunk_size=2, max_in_flight=3, retry_delay=0
+    )
+
+    assert sorted(calls) == [0, 2, 2, 4]
+    assert all(chunk.error is None for chunk in chunks)
+    assert chunks[1].attempts == 2
+
+
+@pytest.mark.asyncio
+async def test_exhausted_retries_keep_error():
+    """Test that a chunk failing every attempt reports its error"""
+    done = []
+
+    async def worker(items):
+        if items[0] == 0:
+            raise RuntimeError("permanent failure")
+        return items
+
+    async def on_chunk_done(chunk):
+        done.append(chunk.index)
+
+    chunks = await run_chunked(
+        list(range(4)),
+        worker,
+        chunk_size=2,
+        max_in_flight=2,
+        retries=2,
+        retry_delay=0,
+        on_chunk_done=on_chunk_done,
+    )
+
+    assert str(chunks[0].error) == "permanent failure"
+    assert chunks[0].attempts == 3
+    assert chunks[1].result == [2, 3]
+    assert sorted(done) == [0, 1]
@@ -0,0 +1,309 @@
+import threading
+
+import pytest
+
+from futureagi_mcp_server import catalog as catalog_module
+from futureagi_mcp_server.cache import (
+    SharedFileCache,
+    SQLiteCache,
+    TTLCache,
+    catalog_cache,
+)
+from futureagi_mcp_server.tools import evals
+
+
+class FakeTimer:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+class FakeResponse:
+    def __init__(self, payload, status_code=200):
+        self.payload = payload
+        self.status_code = status_code
+
+    def json(self):
+        return self.payload
+
+
+class FakeApiClient:
+    def __init__(self):
+        self.requests = []
+
+    def request(self, config):
+        self.requests.append(config)
+        return FakeResponse({"status": True, "result": {"url": config.url}})
+
+
+class FakeEvalClient:
+    def __init__(self):
+        self.list_calls = 0
+
+    def _get_eval_info(self):
+        pass
+
+    _get_eval_info.cache_clear = lambda: None
+
+    def list_evaluations(self):
+        self.list_calls += 1
+        return [
+            {"eval_id": "1", "eval_tags": ["TEXT"]},
+            {"eval_id": "2", "eval_tags": ["CUSTOM"]},
+        ]
+
+
+class FakeRegistry:
+    def __init__(self):
+        self.api = FakeApiClient()
+        self.evals = FakeEvalClient()
+
+    def api_client(self):
+        return self.api
+
+    def eval_client(self):
+        return self.evals
+
+
+@pytest.fixture
+def fake_registry(monkeypatch):
+    registry = FakeRegistry()
+    monkeypatch.setattr(evals, "get_client_registry", lambda: registry)
+    monkeypatch.setattr(catalog_module, "get_client_registry", lambda: registry)
+    catalog_cache.invalidate()
+    yield registry
+    catalog_cache.invalidate()
+
+
+def test_ttl_expiry():
+    timer = FakeTimer()
+    cache = TTLCache(maxsize=4, ttl=10, timer=timer)
+    cache.set("key", "value")
+    assert cache.get("key") == "value"
+
+    timer.now = 11
+    assert cache.get("key") is None
+    assert cache.stats()["hits"] == 1
+    assert cache.stats()["misses"] == 1
+
+
+def test_lru_eviction():
+    cache = TTLCache(maxsize=2, ttl=10)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    cache.get("a")
+    cache.set("c", 3)
+
+    assert cache.get("b") is None
+    assert cache.get("a") == 1
+    assert cache.get("c") == 3
+    assert cache.stats()["evictions"] == 1
+
+
+def test_invalidate():
+    cache = TTLCache(maxsize=4, ttl=10)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    cache.invalidate("a")
+    assert cache.get("a") is None
+    assert cache.get("b") == 2
+
+    cache.invalidate()
+    assert len(cache) == 0
+
+
+def test_zero_ttl_disables_cache():
+    cache = TTLCache(maxsize=4, ttl=0)
+    cache.set("a", 1)
+    assert cache.get("a") is None
+
+
+def test_shared_cache_across_processes(tmp_path):
+    """Test that an entry cached by one worker is served to another"""
+    wall_clock = FakeTimer()
+    first = TTLCache(ttl=10, shared=SharedFileCache(str(tmp_path), timer=wall_clock))
+    second = TTLCache(ttl=10, shared=SharedFileCache(str(tmp_path), timer=wall_clock))
+
+    first.set(("all_evaluators",), [{"eval_id": "1"}])
+    assert second.get(("all_evaluators",)) == [{"eval_id": "1"}]
+    assert second.stats()["shared_hits"] == 1
+    # The entry is now held locally too
+    assert second.get(("all_evaluators",)) == [{"eval_id": "1"}]
+    assert second.stats()["hits"] == 1
+
+    second.invalidate()
+    third = TTLCache(ttl=10, shared=SharedFileCache(str(tmp_path), timer=wall_clock))
+    assert third.get(("all_evaluators",)) is None
+
+
+def test_invalidation_reaches_every_worker(tmp_path):
+    """Test that local copies are dropped once another worker invalidated"""
+    first = TTLCache(ttl=10, shared=SharedFileCache(str(tmp_path)))
+    second = TTLCache(ttl=10, shared=SharedFileCache(str(tmp_path)))
+    first.set(("all_evaluators",), ["old"])
+    first.set(("eval_structure", "1"), {"id": "1"})
+    assert second.get(("all_evaluators",)) == ["old"]
+    assert second.get(("eval_structure", "1")) == {"id": "1"}
+
+    first.invalidate(("all_evaluators",))
+    assert second.get(("all_evaluators",)) is None
+    # Other keys are dropped locally too, and read back from the shared tier
+    assert second.get(("eval_structure", "1")) == {"id": "1"}
+    assert first.get(("eval_structure", "1")) == {"id": "1"}
+    assert first.stats()["hits"] == 1
+
+    first.set(("all_evaluators",), ["new"])
+    assert second.get(("all_evaluators",)) == ["new"]
+    second.invalidate()
+    assert first.get(("all_evaluators",)) is None
+    assert first.get(("eval_structure", "1")) is None
+
+
+@pytest.mark.asyncio
+async def test_async_invalidation_reaches_every_worker(tmp_path):
+    first = TTLCache(ttl=10, shared=SharedFileCache(str(tmp_path)))
+    second = TTLCache(ttl=10, shared=SharedFileCache(str(tmp_path)))
+    await first.aset(("all_evaluators",), ["old"])
+    assert await second.aget(("all_evaluators",)) == ["old"]
+
+    await first.ainvalidate()
+    assert await second.aget(("all_evaluators",)) is None
+    await first.aset(("all_evaluators",), ["new"])
+    assert await first.aget(("all_evaluators",)) == ["new"]
+    assert first.stats()["hits"] == 1
+
+
+def test_shared_cache_prunes_old_entries(tmp_path):
+    wall_clock = FakeTimer()
+    shared = SharedFileCache(str(tmp_path), timer=wall_clock, max_entries=20)
+    shared.set("expired", "value", ttl=1)
+    wall_clock.now = 2
+    for index in range(30):
+        shared.set(index, index, ttl=10)
+
+    # Pruned every other write
+    assert len(list(tmp_path.iterdir())) <= 21
+    assert shared.get("expired")[1] == 0
+    assert shared.get(29) == (29, 10)
+
+
+def test_shared_cache_expiry(tmp_path):
+    wall_clock = FakeTimer()
+    shared = SharedFileCache(str(tmp_path), timer=wall_clock)
+    TTLCache(ttl=10, shared=shared).set("key", "value")
+
+    wall_clock.now = 11
+    assert TTLCache(ttl=10, shared=shared).get("key") is None
+
+
+class RecordingFileCache(SharedFileCache):
+    """Shared tier recording the threads its file operations run on"""
+
+    def __init__(self, directory):
+        super().__init__(directory)
+        self.threads = []
+
+    def get(self, key):
+        self.threads.append(threading.current_thread())
+        return super().get(key)
+
+    def set(self, key, value, ttl):
+        self.threads.append(threading.current_thread())
+        super().set(key, value, ttl)
+
+
+@pytest.mark.asyncio
+async def test_shared_tier_is_used_off_the_event_loop(tmp_path):
+    first = TTLCache(ttl=10, shared=RecordingFileCache(str(tmp_path)))
+    second = TTLCache(ttl=10, shared=RecordingFileCache(str(tmp_path)))
+
+    await first.aset(("all_evaluators",), [{"eval_id": "1"}])
+    assert await second.aget(("all_evaluators",)) == [{"eval_id": "1"}]
+    # Served from memory now, without reading the entry files
+    assert await second.aget(("all_evaluators",)) == [{"eval_id": "1"}]
+    assert await second.aget("missing") is None
+
+    assert len(first.shared.threads) == 1 and len(second.shared.threads) == 2
+    loop_thread = threading.current_thread()
+    assert loop_thread not in first.shared.threads + second.shared.threads
+    assert second.stats()["shared_hits"] == 1
+
+    await first.ainvalidate()
+    assert TTLCache(ttl=10, shared=SharedFileCache(str(tmp_path))).get("x") is None
+    assert not list(tmp_path.glob("*.json"))
+
+
+def test_sqlite_cache_across_restarts(tmp_path):
+    """Test that entries written by one process are read back by the next"""
+    path = str(tmp_path / "cache" / "evaluate.db")
+    first = SQLiteCache(path, ttl=10)
+    first.set_many([("a", [{"data": 1}]), ("b", [])])
+    first.close()
+
+    second = SQLiteCache(path, ttl=10)
+    assert second.get_many(["a", "b", "c"]) == {"a": [{"data": 1}], "b": []}
+    stats = second.stats()
+    assert (stats["hits"], stats["misses"], stats["size"]) == (2, 1, 2)
+
+
+def test_sqlite_cache_evicts_least_recently_used(tmp_path):
+    wall_clock = FakeTimer()
+    cache = SQLiteCache(str(tmp_path / "cache.db"), maxsize=3, ttl=10, timer=wall_clock)
+    cache.set_many([("a", 1), ("b", 2), ("c", 3)])
+    wall_clock.now = 1
+    cache.get_many(["a"])
+    wall_clock.now = 2
+    cache.set_many([("d", 4)])
+
+    assert cache.get_many(["a", "b", "c", "d"]) == {"a": 1, "c": 3, "d": 4}
+
+    wall_clock.now = 13
+    assert cache.get_many(["a", "d"]) == {}
+    cache.set_many([("e", 5)])
+    assert cache.stats()["size"] == 1
+
+
+def test_sqlite_cache_invalidate(tmp_path):
+    cache = SQLiteCache(str(tmp_path / "cache.db"), ttl=10)
+    cache.set_many([("a", 1), ("b", 2)])
+    cache.invalidate(["a"])
+    assert cache.get_many(["a", "b"]) == {"b": 2}
+    cache.invalidate()
+    assert cache.get_many(["b"]) == {}
+
+    unused = SQLiteCache(str(tmp_path / "unused.db"), ttl=10)
+    unused.invalidate()
+    assert not (tmp_path / "unused.db").exists()
+
+
+@pytest.mark.asyncio
+async def test_all_evaluators_is_cached(fake_registry):
+    """Test that the evaluator catalog is fetched once and served from cache"""
+    first = await evals.all_evaluators()
+    second = await evals.all_evaluators()
+
+    assert first is second
+    assert first[0]["eval_id"] == "2"
+    assert fake_registry.evals.list_calls == 1
+
+
+@pytest.mark.asyncio
+async def test_eval_structure_is_cached_per_template(fake_registry):
+    """Test that eval structures are cached per template id"""
+    await evals.get_eval_structure(template_id="a")
+    await evals.get_eval_structure(template_id="a")
+    await evals.get_eval_structure(template_id="b")
+
+    assert len(fake_registry.api.requests) == 2
+
+
+@pytest.mark.asyncio
+async def test_create_eval_invalidates_catalog(fake_registry):
+    """Test that creating an eval drops cached catalog entries"""
+    await evals.get_evals_list_for_create_eval(eval_type="user")
+    await evals.create_eval(eval_name="new", template_id="a", config={})
+    await evals.get_evals_list_for_create_eval(eval_type="user")
+
+    assert len(fake_registry.api.requests) == 3
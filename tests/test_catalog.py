@@ -0,0 +1,201 @@
+import pytest
+
+from futureagi_mcp_server import catalog as catalog_module
+from futureagi_mcp_server.cache import catalog_cache
+from futureagi_mcp_server.catalog import EvaluatorIndex, get_evaluator_index
+from futureagi_mcp_server.tools import evals
+
+EVALUATORS = [
+    {
+        "eval_id": "1",
+        "name": "Tone",
+        "description": "Detects the emotional tone of a text",
+        "eval_tags": ["TEXT"],
+        "config": {"required_keys": ["output"]},
+    },
+    {
+        "eval_id": "2",
+        "name": "Toxicity",
+        "description": "Flags toxic or abusive language",
+        "eval_tags": ["TEXT", "SAFETY"],
+        "config": {"required_keys": ["output"]},
+    },
+    {
+        "eval_id": "3",
+        "name": "Caption Hallucination",
+        "description": "Checks that an image caption matches the image",
+        "eval_tags": ["IMAGE"],
+        "config": {"required_keys": ["image", "output"]},
+    },
+    {
+        "eval_id": "4",
+        "name": "Context Adherence",
+        "description": "Checks that the output sticks to the retrieved context",
+        "eval_tags": ["TEXT", "RAG"],
+        "config": {"required_keys": ["output", "context"]},
+    },
+]
+
+
+class FakeEvalClient:
+    """Eval client without the template info memo of some SDK versions"""
+
+    def __init__(self):
+        self.list_calls = 0
+
+    def list_evaluations(self):
+        self.list_calls += 1
+        return [dict(evaluator) for evaluator in EVALUATORS]
+
+
+class FakeRegistry:
+    def __init__(self):
+        self.evals = FakeEvalClient()
+
+    def eval_client(self):
+        return self.evals
+
+
+@pytest.fixture
+def fake_registry(monkeypatch):
+    registry = FakeRegistry()
+    monkeypatch.setattr(evals, "get_client_registry", lambda: registry)
+    monkeypatch.setattr(catalog_module, "get_client_registry", lambda: registry)
+    catalog_cache.invalidate()
+    yield registry
+    catalog_cache.invalidate()
+
+
+def indexed(evaluators):
+    index = EvaluatorIndex()
+    index.update(evaluators)
+    return index
+
+
+def test_pages_follow_the_cursor():
+    index = indexed(EVALUATORS)
+
+    first = index.page(limit=3, fields=["eval_id"])
+    assert first == {
+        "evaluators": [{"eval_id": "1"}, {"eval_id": "2"}, {"eval_id": "3"}],
+        "total": 4,
+        "next_cursor": "3",
+    }
+    last = index.page(limit=3, cursor=first["next_cursor"], fields=["eval_id"])
+    assert last == {"evaluators": [{"eval_id": "4"}], "total": 4, "next_cursor": None}
+    assert index.page(tags=["TEXT"], search="TOX", fields=["eval_id"]) == {
+        "evaluators": [{"eval_id": "2"}],
+        "total": 1,
+        "next_cursor": None,
+    }
+
+    with pytest.raises(ValueError):
+        index.page(limit=0)
+    with pytest.raises(ValueError):
+        index.page(cursor="abc")
+
+
+def test_index_is_reused_for_the_same_catalog():
+    evaluators = list(EVALUATORS)
+    index = get_evaluator_index(evaluators)
+    assert get_evaluator_index(evaluators) is index
+    assert index.search(query="tox") == ["2"]
+    assert get_evaluator_index([EVALUATORS[0]]).search(query="tox") == []
+
+
+@pytest.mark.asyncio
+async def test_all_evaluators_filters_the_cached_catalog(fake_registry):
+    """Test filtering, paging and projecting evaluators without refetching"""
+    full = await evals.all_evaluators()
+    assert [evaluator["eval_id"] for evaluator in full] == ["1", "2", "3", "4"]
+
+    projected = await evals.all_evaluators(fields=["eval_id", "name"])
+    assert projected[1] == {"eval_id": "2", "name": "Toxicity"}
+
+    page = await evals.all_evaluators(
+        tags=["TEXT"], limit=1, fields=["eval_id", "eval_tags"]
+    )
+    assert page == {
+        "evaluators": [{"eval_id": "1", "eval_tags": ["TEXT"]}],
+        "total": 3,
+        "next_cursor": "1",
+    }
+    page = await evals.all_evaluators(tags=["TEXT"], limit=1, cursor="1")
+    assert page["evaluators"][0]["name"] == "Toxicity"
+
+    assert "error" in await evals.all_evaluators(cursor="not-a-cursor")
+    assert fake_registry.evals.list_calls == 1
+
+
+def test_index_search():
+    index = indexed(EVALUATORS)
+
+    assert index.search() == ["1", "2", "3", "4"]
+    assert index.search(tags=["rag"]) == ["4"]
+    assert index.search(required=["output", "context"]) == ["4"]
+    assert index.search(available=["output", "context"]) == ["1", "2", "4"]
+    assert index.search(tags=["TEXT"], available=["output"]) == ["1", "2"]
+    assert index.search(query="tox") == ["2"]
+    assert index.search(query="checks image") == ["3"]
+    assert index.search(query="safety") == ["2"]
+    assert index.search(tags=["AUDIO"], query="tone") == []
+
+
+def test_index_is_updated_incrementally():
+    """Test that a catalog refresh only re-indexes what changed"""
+    index = EvaluatorIndex()
+    assert index.update(EVALUATORS) == {"added": 4, "changed": 0, "removed": 0}
+    assert index.update([dict(e) for e in EVALUATORS]) == {
+        "added": 0,
+        "changed": 0,
+        "removed": 0,
+    }
+
+    refreshed = [dict(e) for e in EVALUATORS[1:]]
+    refreshed[0]["eval_tags"] = ["TEXT", "SAFETY", "CUSTOM"]
+    refreshed.append({"eval_id": "5", "name": "Tone Shift", "eval_tags": ["TEXT"]})
+    assert index.update(refreshed) == {"added": 1, "changed": 1, "removed": 1}
+
+    assert index.search(query="tone") == ["5"]
+    assert index.search(tags=["custom"]) == ["2"]
+    assert "1" not in index.by_tag["TEXT"]
+    assert "emotional" not in index.by_token
+
+
+@pytest.mark.asyncio
+async def test_search_evaluators(fake_registry):
+    result = await evals.search_evaluators(
+        tags=["RAG"], available_keys=["input", "output", "context"]
+    )
+    assert result == {
+        "evaluators": [
+            {
+                "eval_id": "4",
+                "name": "Context Adherence",
+                "description": "Checks that the output sticks to the retrieved context",
+                "eval_tags": ["TEXT", "RAG"],
+                "config": {"required_keys": ["output", "context"]},
+            }
+        ],
+        "total": 1,
+    }
+
+    result = await evals.search_evaluators(tags=["TEXT"], fields=["eval_id"], limit=2)
+    assert result == {"evaluators": [{"eval_id": "1"}, {"eval_id": "2"}], "total": 3}
+    assert fake_registry.evals.list_calls == 1
+
+
+@pytest.mark.asyncio
+async def test_both_tools_match_the_same_evaluators(fake_registry):
+    for words in ["tox", "image caption", "safety", "ext"]:
+        page = await evals.all_evaluators(search=words, fields=["eval_id"])
+        found = await evals.search_evaluators(query=words, fields=["eval_id"])
+        assert page["evaluators"] == found["evaluators"]
+        assert page["total"] == found["total"]
+
+
+@pytest.mark.asyncio
+async def test_search_evaluators_rejects_non_positive_limits(fake_registry):
+    for limit in [0, -1]:
+        assert "error" in await evals.search_evaluators(limit=limit)
+        assert "error" in await evals.all_evaluators(limit=limit)
@@ -0,0 +1,71 @@
+import pytest
+
+from futureagi_mcp_server.clients import (
+    ClientRegistry,
+    close_client_registry,
+    get_client_registry,
+    set_client_registry,
+)
+
+
+@pytest.fixture
+def registry():
+    client_registry = ClientRegistry(
+        api_key="test_api_key",
+        secret_key="test_secret_key",
+        base_url="https://api.futureagi.test",
+        pool_size=4,
+        idle_timeout=60,
+    )
+    yield client_registry
+    client_registry.close()
+
+
+def test_clients_are_reused(registry):
+    """Test that repeated lookups return the same client instances"""
+    assert registry.api_client() is registry.api_client()
+    assert registry.eval_client() is registry.eval_client()
+    assert registry.protect_client() is registry.protect_client()
+    assert registry.protect_client().evaluator is registry.eval_client()
+
+
+def test_clients_share_one_session(registry):
+    """Test that every client sends requests through the shared session"""
+    session = registry.session()
+    assert registry.api_client()._session is session
+    assert registry.eval_client()._session is session
+
+    adapter = session.get_adapter("https://api.futureagi.test")
+    assert adapter._pool_maxsize == 4
+
+
+def test_idle_connections_are_dropped(registry):
+    """Test that pooled connections are closed after the idle timeout"""
+    session = registry.session()
+    adapter = session.get_adapter("https://api.futureagi.test")
+    adapter.poolmanager.connection_from_url("https://api.futureagi.test")
+    assert len(adapter.poolmanager.pools) == 1
+
+    registry.idle_timeout = 0
+    registry._last_used -= 1
+    assert registry.session() is session
+    assert len(adapter.poolmanager.pools) == 0
+
+
+def test_close_resets_clients(registry):
+    """Test that closing the registry releases the session and clients"""
+    eval_client = registry.eval_client()
+    protect_client = registry.protect_client()
+    registry.close()
+
+    assert protect_client.executor._shutdown
+    assert registry.eval_client() is not eval_client
+
+
+def test_process_wide_registry(registry):
+    """Test installing and closing the process-wide registry"""
+    set_client_registry(registry)
+    assert get_client_registry() is registry
+
+    close_client_registry()
+    assert registry._session is None
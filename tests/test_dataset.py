@@ -2,15 +2,41 @@ import csv
 import os
 import tempfile
 import uuid
+from types import SimpleNamespace
 
 import pytest
 
+from futureagi_mcp_server.cache import column_cache
 from futureagi_mcp_server.tools.datasets import (
     add_evaluation_to_dataset,
+    cache_column_ids,
+    get_column_ids,
     upload_dataset,
 )
 
 
+class FakeDatasetClient:
+    """Dataset client answering table requests from a list of column names"""
+
+    def __init__(self, columns):
+        self.dataset_config = SimpleNamespace(id=uuid.uuid4())
+        self._base_url = "https://api.test"
+        self.columns = list(columns)
+        self.table_requests = 0
+
+    def request(self, config, response_handler):
+        self.table_requests += 1
+        return SimpleNamespace(
+            columns=[
+                SimpleNamespace(name=name, id=f"id-{name}") for name in self.columns
+            ]
+        )
+
+    def add_columns(self, columns):
+        self.columns.extend(column["name"] for column in columns)
+        return self
+
+
 @pytest.fixture
 def sample_csv_file():
     """Create a temporary CSV file for testing"""
@@ -86,3 +112,33 @@ async def test_add_evaluation_to_dataset(sample_csv_file):
     assert isinstance(response_data, dict)
     if response_data.get("error"):
         pytest.fail(f"Add evaluation failed: {response_data.get('error')}")
+
+
+def test_column_ids_are_fetched_once_per_dataset():
+    client = cache_column_ids(FakeDatasetClient(["input", "output", "context"]))
+    try:
+        for _ in range(10):
+            assert client.get_column_id("input") == "id-input"
+            assert get_column_ids(client, ["output", "context"])["context"] == (
+                "id-context"
+            )
+
+        assert client.table_requests == 1
+    finally:
+        column_cache.invalidate()
+
+
+def test_column_ids_are_refetched_when_columns_change():
+    client = cache_column_ids(FakeDatasetClient(["input"]))
+    try:
+        assert client.get_column_id("input") == "id-input"
+        client.add_columns([{"name": "output", "data_type": "text"}])
+        assert get_column_ids(client) == {"input": "id-input", "output": "id-output"}
+
+        # Columns added elsewhere, e.g. by an evaluation, are found on a miss
+        client.columns.append("eval_result")
+        assert client.get_column_id("eval_result") == "id-eval_result"
+        assert client.get_column_id("missing") is None
+        assert client.table_requests == 4
+    finally:
+        column_cache.invalidate()
@@ -1,15 +1,24 @@
 import asyncio
+import threading
 import time
 
 import pytest
+from fi.evals.types import BatchRunResult, EvalResult
+
+from futureagi_mcp_server.cache import SQLiteCache
 
 # Import tool functions directly
+from futureagi_mcp_server.tools import evals
 from futureagi_mcp_server.tools.evals import (
+    _test_case_class,
     all_evaluators,
+    build_test_cases,
     create_eval,
     evaluate,
+    evaluate_cache_key,
     get_eval_structure,
     get_evals_list_for_create_eval,
+    split_row_results,
 )
 
 path_to_image = "./tests/testimage.png"
@@ -191,3 +200,217 @@ async def test_mllm_deterministic_eval():
     response_data = await evaluate(**mllm_eval_payload)
     assert "eval_results" in response_data
     assert isinstance(response_data["eval_results"], list)
+
+
+def test_test_case_class_is_cached_per_signature():
+    """Test that rows with the same fields share one test case class"""
+    test_cases = build_test_cases(
+        [
+            {"input": "a", "context": "b"},
+            {"context": "d", "input": "c"},
+            {"input": "e", "context": ["f", "g"]},
+        ]
+    )
+
+    first, second, third = (test_case.__class__ for test_case in test_cases)
+    assert first is second
+    assert first is not third
+    assert test_cases[1].input == "c"
+    assert test_cases[2].context == ["f", "g"]
+    assert _test_case_class.cache_info().currsize >= 2
+
+
+class FakeEvalClient:
+    """Eval client that returns one result per input and fails chunks on demand"""
+
+    def __init__(self, fail_once=()):
+        self.fail_once = set(fail_once)
+        self.batches = []
+
+    def evaluate(self, eval_templates, inputs):
+        self.batches.append([test_case.input for test_case in inputs])
+        for test_case in inputs:
+            if test_case.input in self.fail_once:
+                self.fail_once.remove(test_case.input)
+                raise RuntimeError("upstream error")
+        return BatchRunResult(
+            eval_results=[
+                EvalResult(
+                    data=[test_case.input],
+                    failure=False,
+                    reason="",
+                    runtime=0,
+                    metrics=[],
+                )
+                for test_case in inputs
+            ]
+        )
+
+
+@pytest.fixture
+def fake_eval_client(monkeypatch):
+    client = FakeEvalClient(fail_once={"row 4"})
+
+    class FakeRegistry:
+        def eval_client(self):
+            return client
+
+    monkeypatch.setattr(evals, "get_client_registry", FakeRegistry)
+    monkeypatch.setattr(evals, "EVALUATE_CHUNK_RETRIES", 1)
+    return client
+
+
+@pytest.mark.asyncio
+async def test_evaluate_in_chunks(fake_eval_client):
+    """Test that large batches are split, retried per chunk and merged in order"""
+    inputs = [{"input": f"row {index}"} for index in range(10)]
+    response_data = await evaluate(
+        eval_templates=[{"eval_id": "1", "config": {}}],
+        inputs=inputs,
+        chunk_size=3,
+        max_in_flight=2,
+    )
+
+    assert "failed_chunks" not in response_data
+    assert [result["data"] for result in response_data["eval_results"]] == [
+        [row["input"]] for row in inputs
+    ]
+    # Only the chunk holding row 4 was sent twice
+    assert len(fake_eval_client.batches) == 5
+    assert fake_eval_client.batches.count(["row 3", "row 4", "row 5"]) == 2
+
+
+@pytest.fixture
+def evaluate_cache(monkeypatch, tmp_path):
+    cache = SQLiteCache(str(tmp_path / "evaluate.db"), ttl=60)
+    monkeypatch.setattr(evals, "evaluate_cache", cache)
+    return cache
+
+
+@pytest.mark.asyncio
+async def test_evaluate_only_sends_cache_misses(fake_eval_client, evaluate_cache):
+    """Test that cached rows are not sent again and results stay in input order"""
+    fake_eval_client.fail_once.clear()
+    eval_templates = [{"eval_id": "1", "config": {"model": "turing_flash"}}]
+    first = await evaluate(
+        eval_templates=eval_templates,
+        inputs=[{"input": "row 1"}, {"input": "row 3"}],
+        cache=True,
+    )
+    assert first["cache_hits"] == 0
+
+    inputs = [{"input": f"row {index}"} for index in range(5)]
+    second = await evaluate(
+        eval_templates=eval_templates, inputs=inputs, chunk_size=2, cache=True
+    )
+
+    assert second["cache_hits"] == 2
+    assert [result["data"] for result in second["eval_results"]] == [
+        [row["input"]] for row in inputs
+    ]
+    assert fake_eval_client.batches[1:] == [["row 0", "row 2"], ["row 4"]]
+
+    # Another config is another key, and so is a disabled cache
+    await evaluate(
+        eval_templates=[{"eval_id": "1", "config": {"model": "turing_large"}}],
+        inputs=inputs[:1],
+        cache=True,
+    )
+    await evaluate(eval_templates=eval_templates, inputs=inputs[:1], cache=False)
+    assert fake_eval_client.batches[3:] == [["row 0"], ["row 0"]]
+
+    third = await evaluate(eval_templates=eval_templates, inputs=inputs, cache=True)
+    assert third["cache_hits"] == 5
+    assert len(fake_eval_client.batches) == 5
+
+
+@pytest.mark.asyncio
+async def test_failed_chunks_are_reported_by_input_row(
+    fake_eval_client, evaluate_cache
+):
+    eval_templates = [{"eval_id": "1", "config": {}}]
+    inputs = [{"input": f"row {index}"} for index in range(6)]
+    await evaluate(eval_templates=eval_templates, inputs=inputs[::2], cache=True)
+
+    fake_eval_client.fail_once = {"row 3"}
+    with pytest.MonkeyPatch.context() as patch:
+        patch.setattr(evals, "EVALUATE_CHUNK_RETRIES", 0)
+        response = await evaluate(
+            eval_templates=eval_templates, inputs=inputs, chunk_size=2, cache=True
+        )
+
+    assert response["failed_chunks"] == [
+        {"start": 1, "end": 4, "rows": [1, 3], "error": "upstream error"}
+    ]
+    assert [result["data"] for result in response["eval_results"]] == [
+        ["row 0"],
+        ["row 2"],
+        ["row 4"],
+        ["row 5"],
+    ]
+
+
+def test_evaluate_cache_key_is_canonical():
+    templates = [{"eval_id": 1, "config": {"model": "a", "criteria": "b"}}]
+    same = [{"eval_id": "1", "config": {"criteria": "b", "model": "a"}}]
+    row = {"input": "x", "context": ["y"]}
+
+    assert evaluate_cache_key(templates, row) == evaluate_cache_key(
+        same, {"context": ["y"], "input": "x"}
+    )
+    assert evaluate_cache_key(templates, row) != evaluate_cache_key(
+        templates, {"input": "x", "context": ["z"]}
+    )
+
+
+@pytest.mark.asyncio
+async def test_evaluate_without_a_usable_cache(fake_eval_client, monkeypatch, tmp_path):
+    """Test that a cache file that cannot be created does not fail evaluate"""
+    fake_eval_client.fail_once.clear()
+    (tmp_path / "file").write_text("")
+    cache = SQLiteCache(str(tmp_path / "file" / "evaluate.db"), ttl=60)
+    monkeypatch.setattr(evals, "evaluate_cache", cache)
+
+    response = await evaluate(
+        eval_templates=[{"eval_id": "1", "config": {}}],
+        inputs=[{"input": "row 0"}],
+        cache=True,
+    )
+
+    assert response["cache_hits"] == 0
+    assert [result["data"] for result in response["eval_results"]] == [["row 0"]]
+
+
+@pytest.mark.asyncio
+async def test_media_rows_are_not_cached(fake_eval_client, evaluate_cache, monkeypatch):
+    fake_eval_client.fail_once.clear()
+    key_threads = set()
+
+    def recording_cache_key(eval_templates, row):
+        key_threads.add(threading.current_thread())
+        return evaluate_cache_key(eval_templates, row)
+
+    monkeypatch.setattr(evals, "evaluate_cache_key", recording_cache_key)
+    eval_templates = [{"eval_id": "1", "config": {}}]
+    inputs = [
+        {"input": "row 0", "image_url": "https://example.com/cat.png"},
+        {"input": "row 1", "context": [path_to_image]},
+        {"input": "row 2"},
+        # Names an existing file, but not a media file
+        {"input": "row 3", "context": ["README.md"]},
+    ]
+    for _ in range(2):
+        response = await evaluate(
+            eval_templates=eval_templates, inputs=inputs, cache=True
+        )
+
+    assert response["cache_hits"] == 2
+    assert fake_eval_client.batches[1] == ["row 0", "row 1"]
+    assert key_threads and threading.current_thread() not in key_threads
+
+
+def test_split_row_results_checks_the_result_count():
+    assert split_row_results([1, 2, 3, 4], rows=2, templates=2) == [[1, 2], [3, 4]]
+    assert split_row_results([1, 2, 3, 4], rows=2, templates=1) is None
+    assert split_row_results([1, 2, 3], rows=3, templates=2) is None
+    assert split_row_results([], rows=0, templates=1) is None
@@ -0,0 +1,106 @@
+import asyncio
+import contextvars
+import threading
+import time
+
+import pytest
+
+from futureagi_mcp_server.executor import (
+    ToolExecutor,
+    parse_concurrency_limits,
+    register_concurrency_class,
+)
+
+
+@pytest.fixture
+def executor():
+    tool_executor = ToolExecutor(max_workers=8, tool_limits={"slow": 1})
+    yield tool_executor
+    tool_executor.shutdown()
+
+
+class ConcurrencyTracker:
+    """Blocking callable that records how many calls overlap"""
+
+    def __init__(self, delay=0.1):
+        self.delay = delay
+        self.active = 0
+        self.peak = 0
+        self._lock = threading.Lock()
+
+    def __call__(self):
+        with self._lock:
+            self.active += 1
+            self.peak = max(self.peak, self.active)
+        time.sleep(self.delay)
+        with self._lock:
+            self.active -= 1
+
+
+@pytest.mark.asyncio
+async def test_blocking_calls_overlap(executor):
+    """Test that blocking calls for the same tool run concurrently"""
+    tracker = ConcurrencyTracker(delay=0.2)
+    start = time.perf_counter()
+    await asyncio.gather(*(executor.run("protect", tracker) for _ in range(4)))
+    elapsed = time.perf_counter() - start
+
+    assert tracker.peak == 4
+    assert elapsed < 0.6
+
+
+@pytest.mark.asyncio
+async def test_per_tool_limit(executor):
+    """Test that a tool never exceeds its concurrency limit"""
+    tracker = ConcurrencyTracker(delay=0.05)
+    await asyncio.gather(*(executor.run("slow", tracker) for _ in range(3)))
+
+    assert tracker.peak == 1
+
+
+@pytest.mark.asyncio
+async def test_concurrency_class_limit():
+    """Test that tools in one concurrency class share its limit"""
+    register_concurrency_class("first", "shared")
+    register_concurrency_class("second", "shared")
+    tool_executor = ToolExecutor(max_workers=4, tool_limits={"shared": 1})
+    tracker = ConcurrencyTracker(delay=0.05)
+    await asyncio.gather(
+        tool_executor.run("first", tracker), tool_executor.run("second", tracker)
+    )
+    tool_executor.shutdown()
+
+    assert tracker.peak == 1
+
+
+@pytest.mark.asyncio
+async def test_event_loop_not_blocked(executor):
+    """Test that the event loop keeps running while a blocking call is in flight"""
+    ticks = 0
+
+    async def ticker():
+        nonlocal ticks
+        while True:
+            ticks += 1
+            await asyncio.sleep(0.01)
+
+    ticker_task = asyncio.create_task(ticker())
+    await executor.run("protect", time.sleep, 0.2)
+    ticker_task.cancel()
+
+    assert ticks > 5
+
+
+@pytest.mark.asyncio
+async def test_context_is_propagated(executor):
+    """Test that context variables are visible inside the worker thread"""
+    request_id = contextvars.ContextVar("request_id")
+    request_id.set("abc")
+
+    assert await executor.run("protect", request_id.get) == "abc"
+
+
+def test_parse_concurrency_limits():
+    limits = parse_concurrency_limits("evaluate=8, protect=16,bad,zero=0")
+    assert limits == {"evaluate": 8, "protect": 16, "zero": 1}
+    assert parse_concurrency_limits("") == {}
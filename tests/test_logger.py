@@ -0,0 +1,113 @@
+import json
+import logging
+import threading
+
+from futureagi_mcp_server.logger import (
+    MCP_LOGGING,
+    JsonFormatter,
+    setup_logging,
+    stop_logging,
+    summarize,
+)
+
+
+class CountingValue:
+    def __init__(self):
+        self.rendered = 0
+
+    def __str__(self):
+        self.rendered += 1
+        return "value"
+
+
+class RecordingHandler(logging.Handler):
+    records = []
+
+    def emit(self, record):
+        RecordingHandler.records.append((threading.current_thread(), record))
+
+
+def test_summarize_truncates_large_arguments():
+    arguments = {
+        "inputs": ["x" * 1000] * 50,
+        "image": "data:image/png;base64," + "A" * 10000,
+        "reason": True,
+    }
+    summary = str(summarize(arguments))
+
+    assert len(summary) < 3000
+    assert "...(1000 chars)" in summary
+    assert "...(50 items)" in summary
+    assert "'reason': True" in summary
+
+
+def test_disabled_levels_are_not_formatted():
+    """Test that arguments of filtered records are never rendered"""
+    value = CountingValue()
+    logger = logging.getLogger("futureagi-mcp.test")
+    logger.setLevel(logging.ERROR)
+    logger.info("Received %s", value)
+    logger.info("Received %s", summarize({"value": value}))
+
+    assert value.rendered == 0
+
+
+def test_json_formatter():
+    record = logging.LogRecord(
+        "futureagi-mcp", logging.ERROR, __file__, 10, "Failed %s", ("call",), None
+    )
+    entry = json.loads(JsonFormatter().format(record))
+
+    assert entry["level"] == "ERROR"
+    assert entry["message"] == "Failed call"
+    assert entry["logger"] == "futureagi-mcp"
+
+
+def test_records_are_written_from_the_listener_thread():
+    """Test that queued records reach their handlers off the calling thread"""
+    config = {
+        "version": 1,
+        "disable_existing_loggers": False,
+        "handlers": {
+            "recording": {"()": RecordingHandler, "level": "INFO"},
+        },
+        "loggers": {
+            "futureagi-mcp.queued": {"handlers": ["recording"], "level": "INFO"},
+        },
+    }
+    RecordingHandler.records.clear()
+    try:
+        setup_logging(config, use_queue=True)
+        arguments = {"value": 1}
+        logging.getLogger("futureagi-mcp.queued").info("Received %s", arguments)
+        arguments["value"] = 2
+        stop_logging()
+    finally:
+        setup_logging(MCP_LOGGING)
+        logging.getLogger("futureagi-mcp.queued").handlers.clear()
+
+    ((thread, record),) = RecordingHandler.records
+    assert thread is not threading.current_thread()
+    assert record.getMessage() == "Received {'value': 1}"
+
+
+def test_setup_logging_creates_log_directories(tmp_path):
+    log_file = tmp_path / "logs" / "server.log"
+    config = {
+        "version": 1,
+        "disable_existing_loggers": False,
+        "handlers": {
+            "file": {"class": "logging.FileHandler", "filename": str(log_file)},
+        },
+        "loggers": {"futureagi-mcp.files": {"handlers": ["file"], "level": "INFO"}},
+    }
+    try:
+        setup_logging(config, use_queue=False)
+        logging.getLogger("futureagi-mcp.files").info("written")
+    finally:
+        for handler in logging.getLogger("futureagi-mcp.files").handlers:
+            handler.close()
+        logging.getLogger("futureagi-mcp.files").handlers.clear()
+        setup_logging(MCP_LOGGING)
+
+    assert log_file.read_text().strip() == "written"
@@ -0,0 +1,157 @@
+import asyncio
+import json
+
+import mcp.types as types
+import pytest
+from mcp.shared.memory import create_connected_server_and_client_session
+
+from futureagi_mcp_server.metrics import Histogram, metrics, payload_size
+from futureagi_mcp_server.registry import ToolRegistry, ToolSpec
+from futureagi_mcp_server.server import get_server, shutdown_server
+
+
+async def echo(**kwargs):
+    return kwargs
+
+
+async def failing(**kwargs):
+    return {"error": "backend unavailable"}
+
+
+async def raising(**kwargs):
+    await asyncio.sleep(0)
+    raise RuntimeError("boom")
+
+
+@pytest.fixture
+def registry():
+    metrics.reset()
+    yield ToolRegistry(
+        specs=[
+            ToolSpec(
+                tool=types.Tool(name=name, inputSchema={"type": "object"}),
+                handler=handler,
+            )
+            for name, handler in (
+                ("echo", echo),
+                ("failing", failing),
+                ("raising", raising),
+            )
+        ]
+    )
+    metrics.reset()
+
+
+def test_histogram_quantiles():
+    histogram = Histogram((1, 2, 5, 10))
+    for value in range(1, 101):
+        histogram.observe(value / 10)
+
+    assert histogram.count == 100
+    assert histogram.quantile(0.5) == pytest.approx(5)
+    assert histogram.quantile(0.95) == pytest.approx(9.5)
+    assert histogram.quantile(0.99) == pytest.approx(9.9)
+    assert histogram.cumulative_counts()[-1] == (float("inf"), 100)
+    assert Histogram((1,)).quantile(0.5) == 0.0
+
+
+def test_payload_size():
+    arguments = {
+        "inputs": [{"input": "hello", "score": 1.5, "ok": True, "none": None}],
+        "image": "data:image/png;base64," + "A" * 1000,
+        "reason": False,
+        "timeout": 30000,
+    }
+    assert payload_size(arguments) == len(json.dumps(arguments, separators=(",", ":")))
+
+    # Long lists are extrapolated from their first items
+    rows = [{"input": "x" * 10}] * 1000
+    assert payload_size(rows) == len(json.dumps(rows, separators=(",", ":")))
+
+
+@pytest.mark.asyncio
+async def test_calls_are_recorded(registry):
+    """Test that calls, errors and payload sizes are recorded per tool"""
+    for _ in range(3):
+        await registry.call(registry.get("echo"), {"value": "x" * 100})
+    await registry.call(registry.get("failing"), {})
+    with pytest.raises(RuntimeError):
+        await registry.call(registry.get("raising"), {})
+
+    tools = metrics.snapshot()["tools"]
+    assert tools["echo"]["calls"] == 3
+    assert tools["echo"]["errors"] == 0
+    assert tools["echo"]["in_flight"] == 0
+    assert tools["echo"]["request_bytes"]["max"] == len('{"value":""}') + 100
+    assert tools["echo"]["response_bytes"]["total"] > 300
+    assert tools["failing"]["errors"] == 1
+    assert tools["raising"]["errors"] == 1
+    assert set(tools["echo"]["latency_ms"]) == {"p50", "p95", "p99", "max", "mean"}
+
+
+@pytest.mark.asyncio
+async def test_in_flight_gauge(registry):
+    release = asyncio.Event()
+
+    async def blocked():
+        await release.wait()
+        return {}
+
+    spec = ToolSpec(
+        tool=types.Tool(name="blocked", inputSchema={"type": "object"}),
+        handler=blocked,
+    )
+    task = asyncio.create_task(registry.call(spec, {}))
+    await asyncio.sleep(0.01)
+    assert metrics.tool("blocked").in_flight == 1
+
+    release.set()
+    await task
+    assert metrics.tool("blocked").in_flight == 0
+
+
+@pytest.mark.asyncio
+async def test_prometheus_rendering(registry):
+    await registry.call(registry.get("echo"), {})
+
+    text = metrics.render_prometheus({"worker": "a"})
+    assert "# TYPE futureagi_mcp_tool_duration_seconds histogram" in text
+    assert 'futureagi_mcp_tool_calls_total{tool="echo",worker="a"} 1' in text
+    assert (
+        'futureagi_mcp_tool_duration_seconds_bucket{tool="echo",worker="a",le="+Inf"} 1'
+        in text
+    )
+    assert 'futureagi_mcp_uptime_seconds{worker="a"}' in text
+    assert 'futureagi_mcp_cache_hit_ratio{cache="protect",worker="a"}' in text
+
+
+@pytest.mark.asyncio
+async def test_server_stats_tool(monkeypatch):
+    """Test reading the metrics through the server_stats tool"""
+    monkeypatch.setenv("FI_API_KEY", "test_api_key")
+    monkeypatch.setenv("FI_SECRET_KEY", "test_secret_key")
+    monkeypatch.setenv("FI_BASE_URL", "https://api.futureagi.test")
+    metrics.reset()
+    server = get_server(
+        api_key="test_api_key",
+        secret_key="test_secret_key",
+        base_url="https://api.futureagi.test",
+    )
+    try:
+        async with create_connected_server_and_client_session(server) as client:
+            await client.call_tool("server_stats", {})
+            result = await client.call_tool("server_stats", {})
+    finally:
+        shutdown_server()
+        metrics.reset()
+
+    stats = json.loads(result.content[0].text)
+    assert stats["tools"]["server_stats"]["calls"] == 2
+    assert stats["in_flight_calls"] == 0
+    assert set(stats["caches"]) == {
+        "catalog",
+        "dataset_columns",
+        "evaluate",
+        "protect",
+    }
+    assert "hit_rate" in stats["caches"]["protect"]
@@ -0,0 +1,167 @@
+import asyncio
+import time
+
+import mcp.types as types
+import pytest
+from fi.evals.types import BatchRunResult, EvalResult
+from mcp.shared.memory import create_connected_server_and_client_session
+
+from futureagi_mcp_server.progress import PARTIAL_RESULTS_LOGGER
+from futureagi_mcp_server.server import get_server, shutdown_server
+from futureagi_mcp_server.tools import evals
+
+CHUNK_DELAY = 0.2
+
+
+class SlowEvalClient:
+    """Eval client that takes CHUNK_DELAY seconds per request"""
+
+    def evaluate(self, eval_templates, inputs):
+        time.sleep(CHUNK_DELAY)
+        return BatchRunResult(
+            eval_results=[
+                EvalResult(
+                    data=[test_case.input],
+                    failure=False,
+                    reason="",
+                    runtime=0,
+                    metrics=[],
+                )
+                for test_case in inputs
+            ]
+        )
+
+
+class FakeRegistry:
+    def eval_client(self):
+        return SlowEvalClient()
+
+
+@pytest.fixture
+def server(monkeypatch):
+    monkeypatch.setenv("FI_API_KEY", "test_api_key")
+    monkeypatch.setenv("FI_SECRET_KEY", "test_secret_key")
+    monkeypatch.setenv("FI_BASE_URL", "https://api.futureagi.test")
+    mcp_server = get_server(
+        api_key="test_api_key",
+        secret_key="test_secret_key",
+        base_url="https://api.futureagi.test",
+    )
+    monkeypatch.setattr(evals, "get_client_registry", FakeRegistry)
+    yield mcp_server
+    shutdown_server()
+
+
+class NotificationRecorder:
+    """Collect progress and partial result notifications with arrival times"""
+
+    def __init__(self):
+        self.start = time.perf_counter()
+        self.progress = []
+        self.partial_results = []
+
+    async def message_handler(self, message):
+        if isinstance(message, types.ServerNotification) and isinstance(
+            message.root, types.ProgressNotification
+        ):
+            self.progress.append(message.root.params)
+
+    async def logging_callback(self, params):
+        if params.logger == PARTIAL_RESULTS_LOGGER:
+            elapsed = time.perf_counter() - self.start
+            self.partial_results.append((elapsed, params.data))
+
+
+def call_evaluate_request(progress_token=None):
+    meta = (
+        types.RequestParams.Meta(progressToken=progress_token)
+        if progress_token is not None
+        else None
+    )
+    return types.ClientRequest(
+        types.CallToolRequest(
+            method="tools/call",
+            params=types.CallToolRequestParams(
+                name="evaluate",
+                arguments={
+                    "eval_templates": [{"eval_id": "1", "config": {}}],
+                    "inputs": [{"input": f"row {index}"} for index in range(6)],
+                    "chunk_size": 2,
+                    "max_in_flight": 1,
+                },
+                _meta=meta,
+            ),
+        )
+    )
+
+
+@pytest.mark.asyncio
+async def test_evaluate_streams_progress_and_partial_results(server):
+    """Test that each chunk is reported as soon as it is evaluated"""
+    recorder = NotificationRecorder()
+    async with create_connected_server_and_client_session(
+        server,
+        message_handler=recorder.message_handler,
+        logging_callback=recorder.logging_callback,
+    ) as client:
+        recorder.start = time.perf_counter()
+        result = await client.send_request(
+            call_evaluate_request(progress_token="evaluate-1"), types.CallToolResult
+        )
+        total_elapsed = time.perf_counter() - recorder.start
+        # Notifications may still be in flight when the response arrives
+        await asyncio.sleep(0.05)
+
+    assert not result.isError
+    assert [params.progress for params in recorder.progress] == [0, 2, 4, 6]
+    assert all(params.total == 6 for params in recorder.progress)
+    assert recorder.progress[-1].message == "Evaluated 3/3 chunks"
+
+    assert [
+        data["partial_result"]["start"] for _, data in recorder.partial_results
+    ] == [0, 2, 4]
+    first_elapsed, first = recorder.partial_results[0]
+    assert first["progressToken"] == "evaluate-1"
+    assert [row["data"] for row in first["partial_result"]["eval_results"]] == [
+        ["row 0"],
+        ["row 1"],
+    ]
+    # The first chunk arrives after roughly one chunk, not the whole batch
+    assert first_elapsed < total_elapsed - CHUNK_DELAY
+
+
+@pytest.mark.asyncio
+async def test_no_notifications_without_progress_token(server):
+    """Test that clients that did not ask for progress get none"""
+    recorder = NotificationRecorder()
+    async with create_connected_server_and_client_session(
+        server,
+        message_handler=recorder.message_handler,
+        logging_callback=recorder.logging_callback,
+    ) as client:
+        result = await client.send_request(
+            call_evaluate_request(), types.CallToolResult
+        )
+
+    assert not result.isError
+    assert recorder.progress == []
+    assert recorder.partial_results == []
+
+
+@pytest.mark.asyncio
+async def test_log_level_suppresses_partial_results(server):
+    """Test that partial results respect the level set through logging/setLevel"""
+    recorder = NotificationRecorder()
+    async with create_connected_server_and_client_session(
+        server,
+        message_handler=recorder.message_handler,
+        logging_callback=recorder.logging_callback,
+    ) as client:
+        await client.set_logging_level("warning")
+        await client.send_request(
+            call_evaluate_request(progress_token=7), types.CallToolResult
+        )
+        await asyncio.sleep(0.05)
+
+    assert len(recorder.progress) == 4
+    assert recorder.partial_results == []
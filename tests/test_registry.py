@@ -0,0 +1,187 @@
+import asyncio
+import json
+
+import mcp.types as types
+import pytest
+from mcp.shared.memory import create_connected_server_and_client_session
+
+from futureagi_mcp_server import registry as registry_module
+from futureagi_mcp_server.executor import get_executor
+from futureagi_mcp_server.registry import ToolRegistry, ToolSpec, build_tools
+from futureagi_mcp_server.server import get_server, shutdown_server
+
+
+@pytest.fixture
+def server(monkeypatch):
+    monkeypatch.setenv("FI_API_KEY", "test_api_key")
+    monkeypatch.setenv("FI_SECRET_KEY", "test_secret_key")
+    monkeypatch.setenv("FI_BASE_URL", "https://api.futureagi.test")
+    mcp_server = get_server(
+        api_key="test_api_key",
+        secret_key="test_secret_key",
+        base_url="https://api.futureagi.test",
+    )
+    yield mcp_server
+    shutdown_server()
+
+
+def test_tool_names_are_unique():
+    names = [tool.name for tool in build_tools()]
+    assert len(names) == len(set(names))
+
+
+@pytest.mark.asyncio
+async def test_list_tools_returns_prebuilt_result():
+    """Test that tools/list serves the same prebuilt result every time"""
+    registry = ToolRegistry()
+    request = types.ListToolsRequest(method="tools/list")
+    first = await registry.handle_list_tools(request)
+    second = await registry.handle_list_tools(request)
+
+    assert first is second
+    dump_kwargs = {"by_alias": True, "mode": "json", "exclude_none": True}
+    assert first.model_dump(**dump_kwargs) is second.model_dump(**dump_kwargs)
+    assert first.model_dump(**dump_kwargs) == types.ServerResult(
+        types.ListToolsResult(tools=build_tools())
+    ).model_dump(**dump_kwargs)
+
+
+@pytest.mark.asyncio
+async def test_list_tools_over_session(server):
+    """Test listing tools through a connected MCP client session"""
+    async with create_connected_server_and_client_session(server) as client:
+        result = await client.list_tools()
+
+    assert [tool.name for tool in result.tools] == [tool.name for tool in build_tools()]
+
+
+async def echo(**kwargs):
+    return kwargs
+
+
+async def sleepy():
+    await asyncio.sleep(1)
+
+
+@pytest.fixture
+def registry():
+    return ToolRegistry(
+        specs=[
+            ToolSpec(
+                tool=types.Tool(name="echo", inputSchema={"type": "object"}),
+                handler=echo,
+                concurrency="echo_class",
+                preamble="Format the output",
+            ),
+            ToolSpec(
+                tool=types.Tool(name="sleepy", inputSchema={"type": "object"}),
+                handler=sleepy,
+                timeout=0.05,
+            ),
+        ]
+    )
+
+
+@pytest.mark.asyncio
+async def test_call_dispatches_to_handler(registry):
+    """Test that a call runs the handler and serializes its result"""
+    output = await registry.call(registry.get("echo"), {"value": 1})
+
+    assert output[0].text == "Format the output"
+    assert json.loads(output[1].text) == {"value": 1}
+    assert registry.get("missing") is None
+
+
+@pytest.mark.asyncio
+async def test_call_honors_timeout(registry):
+    """Test that a call is abandoned after the timeout of its spec"""
+    with pytest.raises(asyncio.TimeoutError, match="sleepy timed out"):
+        await registry.call(registry.get("sleepy"), {})
+
+
+def test_concurrency_class_is_registered(registry):
+    assert get_executor().limit_key("echo") == "echo_class"
+    assert get_executor().limit_key("sleepy") == "sleepy"
+
+
+@pytest.mark.asyncio
+async def test_unknown_tool_over_session(server):
+    """Test calling a tool that is not registered"""
+    async with create_connected_server_and_client_session(server) as client:
+        result = await client.call_tool("missing", {})
+
+    assert result.content[0].text == "Unknown tool name: missing"
+
+
+@pytest.mark.asyncio
+async def test_handler_path_is_imported_on_first_call():
+    """Test that handlers given by path are resolved once and then reused"""
+    from futureagi_mcp_server.tools.protect import protect
+
+    spec = ToolSpec(
+        tool=types.Tool(name="protect", inputSchema={"type": "object"}),
+        handler=".tools.protect:protect",
+    )
+    registry = ToolRegistry([spec])
+    output = await registry.call(spec, {"inputs": "hello", "protect_rules": []})
+
+    assert json.loads(output[0].text)["status"] == "error"
+    assert spec.resolve_handler() is protect
+    assert registry_module._handlers[".tools.protect:protect"] is protect
+
+
+@pytest.mark.asyncio
+async def test_invalid_arguments_are_rejected_before_dispatch():
+    """Test that arguments are checked against the schema of the tool"""
+    calls = []
+
+    async def record(**kwargs):
+        calls.append(kwargs)
+        return kwargs
+
+    spec = ToolSpec(
+        tool=types.Tool(
+            name="record",
+            inputSchema={
+                "type": "object",
+                "properties": {
+                    "name": {"type": "string"},
+                    "limit": {"type": "integer"},
+                    "mode": {"type": "string", "enum": ["fast", "slow"]},
+                },
+                "required": ["name"],
+            },
+        ),
+        handler=record,
+    )
+    registry = ToolRegistry([spec])
+
+    missing = json.loads((await registry.call(spec, {"limit": 1}))[0].text)
+    assert missing["invalid_arguments"][0]["argument"] == "name"
+    assert missing["error"].startswith("Invalid arguments: name:")
+
+    unknown = json.loads(
+        (await registry.call(spec, {"name": "a", "nmae": "b"}))[0].text
+    )
+    assert [problem["argument"] for problem in unknown["invalid_arguments"]] == ["nmae"]
+
+    mistyped = json.loads(
+        (await registry.call(spec, {"name": "a", "limit": "many", "mode": "x"}))[0].text
+    )
+    assert {problem["argument"] for problem in mistyped["invalid_arguments"]} == {
+        "limit",
+        "mode",
+    }
+    assert calls == []
+
+    output = await registry.call(spec, {"name": "a", "limit": 2})
+    assert json.loads(output[0].text) == {"name": "a", "limit": 2}
+    assert calls == [{"name": "a", "limit": 2}]
+
+
+def test_tool_schemas_build_input_models():
+    """Test that the schema of every tool can be turned into a model"""
+    registry = ToolRegistry()
+    for tool in build_tools():
+        spec = registry.get(tool.name)
+        assert registry.validate_arguments(spec, {"__unknown__": 1}) is not None
@@ -0,0 +1,85 @@
+import json
+
+import mcp.types as types
+import pytest
+
+from futureagi_mcp_server.registry import ToolRegistry, ToolSpec
+from futureagi_mcp_server.serialization import (
+    get_dumps,
+    project_fields,
+    serialize_result,
+)
+
+CATALOG = [
+    {
+        "name": "Toxicity",
+        "eval_id": "15",
+        "eval_tags": ["TEXT", "SAFETY"],
+        "config": {"required_keys": ["output"], "model": "turing_flash"},
+    },
+    {
+        "name": "Tone",
+        "eval_id": "18",
+        "eval_tags": ["TEXT"],
+        "config": {"required_keys": ["output"]},
+    },
+]
+
+
+def test_output_formats():
+    compact = serialize_result(CATALOG, "compact")
+    pretty = serialize_result(CATALOG, "pretty")
+
+    assert "\n" not in compact
+    assert ", " not in compact
+    assert pretty.startswith('[\n  {\n    "name"')
+    assert json.loads(compact) == json.loads(pretty) == CATALOG
+    assert len(compact) < len(pretty)
+    assert serialize_result("done") == "done"
+
+
+@pytest.mark.parametrize("backend", ["json", "orjson"])
+def test_backends_encode_the_same_values(backend):
+    dumps = get_dumps(backend)
+    value = {"catalog": CATALOG, "count": 2, 1: "non string key", "big": 2**70}
+
+    assert json.loads(dumps(value, False)) == json.loads(json.dumps(value, default=str))
+
+
+def test_project_fields():
+    assert project_fields(CATALOG, ["name", "config.model"]) == [
+        {"name": "Toxicity", "config": {"model": "turing_flash"}},
+        {"name": "Tone", "config": {}},
+    ]
+    result = {"eval_results": [{"output": "Passed", "reason": "long"}], "total": 1}
+    assert project_fields(result, ["eval_results.output"]) == {
+        "eval_results": [{"output": "Passed"}]
+    }
+    assert project_fields(result, []) is result
+
+
+async def catalog(**kwargs):
+    return {"error": "unavailable"} if kwargs else CATALOG
+
+
+@pytest.mark.asyncio
+async def test_fields_argument():
+    """Test that projectable tools consume "fields" and project their result"""
+    registry = ToolRegistry(
+        [
+            ToolSpec(
+                tool=types.Tool(name=name, inputSchema={"type": "object"}),
+                handler=catalog,
+                projectable=projectable,
+            )
+            for name, projectable in (("projectable", True), ("plain", False))
+        ]
+    )
+    arguments = {"fields": ["eval_id"]}
+    output = await registry.call(registry.get("projectable"), arguments)
+    assert json.loads(output[0].text) == [{"eval_id": "15"}, {"eval_id": "18"}]
+    assert arguments == {"fields": ["eval_id"]}
+
+    # Other tools receive the argument, errors are never projected away
+    output = await registry.call(registry.get("plain"), arguments)
+    assert json.loads(output[0].text) == {"error": "unavailable"}
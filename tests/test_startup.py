@@ -0,0 +1,67 @@
+import json
+import os
+import subprocess
+import sys
+import time
+
+# Seconds the stdio server may take to answer initialize on a cold start
+STARTUP_BUDGET = float(os.getenv("FI_MCP_STARTUP_BUDGET", "3"))
+
+INITIALIZE_REQUEST = {
+    "jsonrpc": "2.0",
+    "id": 1,
+    "method": "initialize",
+    "params": {
+        "protocolVersion": "2024-11-05",
+        "capabilities": {},
+        "clientInfo": {"name": "test", "version": "0"},
+    },
+}
+
+
+def test_import_does_not_load_sdk():
+    """Test that importing the server leaves the FutureAGI SDK unloaded"""
+    code = (
+        "import sys\n"
+        "from futureagi_mcp_server.registry import ToolRegistry\n"
+        "import futureagi_mcp_server\n"
+        "ToolRegistry()\n"
+        "print(sorted(m for m in sys.modules if m == 'fi' or m.startswith('fi.')))\n"
+    )
+    output = subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, text=True, check=True
+    ).stdout
+
+    assert output.strip() == "[]"
+
+
+def test_time_to_initialize_response(record_property):
+    """Test that a fresh stdio server answers initialize within the budget"""
+    env = {
+        **os.environ,
+        "FI_API_KEY": "test_api_key",
+        "FI_SECRET_KEY": "test_secret_key",
+        "FI_BASE_URL": "https://api.futureagi.test",
+    }
+    start = time.perf_counter()
+    process = subprocess.Popen(
+        [sys.executable, "-c", "from futureagi_mcp_server import main; main()"],
+        env=env,
+        stdin=subprocess.PIPE,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.DEVNULL,
+        text=True,
+    )
+    try:
+        process.stdin.write(json.dumps(INITIALIZE_REQUEST) + "\n")
+        process.stdin.flush()
+        response = json.loads(process.stdout.readline())
+        elapsed = time.perf_counter() - start
+    finally:
+        process.kill()
+        process.wait()
+
+    record_property("time_to_initialize_response", elapsed)
+    assert response["id"] == 1
+    assert response["result"]["serverInfo"]["name"] == "futureagi"
+    assert elapsed < STARTUP_BUDGET
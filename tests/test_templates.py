@@ -0,0 +1,73 @@
+import pytest
+from fi.evals.templates import EvalTemplate
+
+from futureagi_mcp_server.templates import TemplateRegistry
+
+
+class Base:
+    pass
+
+
+class Direct(Base):
+    eval_id = "1"
+
+
+class Indirect(Direct):
+    eval_id = "2"
+
+
+class Other(Base):
+    eval_id = "2"
+
+
+def test_only_direct_subclasses_are_indexed():
+    """Indirect subclasses are not templates the SDK accepts"""
+    registry = TemplateRegistry(Base)
+
+    assert registry.get("1") is Direct
+    assert registry.get("2") is Other
+    assert registry.get("indirect") is None
+    with pytest.raises(ValueError, match="Unknown eval template 'Indirect'"):
+        registry.resolve("Indirect")
+
+
+def test_lookup_by_catalog_uuid_and_name():
+    registry = TemplateRegistry(Base)
+    registry.learn(
+        [
+            {"eval_id": "2", "id": "5b1f0c52-uuid", "name": "other_check"},
+            {"eval_id": "99", "id": "unknown-uuid", "name": "unknown"},
+        ]
+    )
+
+    assert registry.get("5b1f0c52-uuid") is Other
+    assert registry.get("Other Check") is Other
+    assert registry.get("unknown-uuid") is None
+
+
+def test_refresh_picks_up_new_templates():
+    registry = TemplateRegistry(Base)
+    registry.learn([{"eval_id": "1", "id": "direct-uuid"}])
+    assert registry.get("3") is None
+
+    class Late(Base):
+        eval_id = "3"
+
+    assert registry.resolve("3") is Late
+    assert registry.get("direct-uuid") is Direct
+
+
+def test_unknown_template_raises_value_error():
+    registry = TemplateRegistry(Base)
+
+    with pytest.raises(ValueError, match="Unknown eval template 'missing'"):
+        registry.resolve("missing")
+
+
+def test_sdk_templates():
+    registry = TemplateRegistry()
+
+    assert registry.refresh() == len(
+        [cls for cls in EvalTemplate.__subclasses__() if hasattr(cls, "eval_id")]
+    )
+    assert registry.resolve("1").__name__ == "ConversationCoherence"
@@ -0,0 +1,226 @@
+import json
+import os
+import subprocess
+import sys
+
+import mcp.types as types
+import pytest
+from requests import Response
+from requests.adapters import BaseAdapter
+from requests_futures.sessions import FuturesSession
+
+from futureagi_mcp_server import tracing
+from futureagi_mcp_server.cache import TTLCache
+from futureagi_mcp_server.executor import ContextThreadPoolExecutor, run_blocking
+from futureagi_mcp_server.registry import ToolRegistry, ToolSpec
+from futureagi_mcp_server.tracing import (
+    Tracer,
+    configure_tracing,
+    create_exporter,
+    setup_tracing,
+    tracer,
+)
+
+
+class FakeAdapter(BaseAdapter):
+    """Transport adapter answering every request with 200, recording headers"""
+
+    def __init__(self):
+        super().__init__()
+        self.headers = []
+
+    def send(self, request, **kwargs):
+        self.headers.append(dict(request.headers))
+        response = Response()
+        response.status_code = 200
+        response.request = request
+        return response
+
+    def close(self):
+        pass
+
+
+@pytest.fixture(scope="module")
+def provider_exporter():
+    pytest.importorskip("opentelemetry.sdk")
+    # The global tracer provider can only be set once per process
+    exporter = create_exporter("memory")
+    configure_tracing(lambda: exporter, batch=False)
+    return exporter
+
+
+@pytest.fixture
+def exporter(provider_exporter):
+    provider_exporter.clear()
+    yield provider_exporter
+    provider_exporter.clear()
+
+
+def spans_by_name(exporter):
+    return {span.name: span for span in exporter.get_finished_spans()}
+
+
+@pytest.mark.asyncio
+async def test_tool_call_is_traced(exporter):
+    """Test that SDK requests and serialization are children of the call span"""
+    from opentelemetry.trace import SpanKind
+
+    adapter = FakeAdapter()
+    session = FuturesSession(executor=ContextThreadPoolExecutor(max_workers=2))
+    session.mount("https://", adapter)
+    cache = TTLCache()
+
+    def fetch():
+        cache.get("catalog")
+        return session.request("POST", "https://api.futureagi.test/run").result()
+
+    async def handler():
+        response = await run_blocking("traced", fetch)
+        return {"status_code": response.status_code}
+
+    registry = ToolRegistry(
+        [
+            ToolSpec(
+                tool=types.Tool(name="traced", inputSchema={"type": "object"}),
+                handler=handler,
+            )
+        ]
+    )
+    await registry.call(registry.get("traced"), {})
+    session.executor.shutdown(wait=True)
+
+    spans = spans_by_name(exporter)
+    call = spans["tools/call traced"]
+    blocking = spans["run_blocking test_tool_call_is_traced.<locals>.fetch"]
+    (http_span,) = [
+        span for span in exporter.get_finished_spans() if span.kind == SpanKind.CLIENT
+    ]
+    assert call.parent is None
+    assert blocking.parent.span_id == call.context.span_id
+    assert http_span.parent.span_id == blocking.context.span_id
+    assert spans["cache.get"].parent.span_id == blocking.context.span_id
+    assert spans["cache.get"].attributes["outcome"] == "miss"
+    assert spans["serialize"].parent.span_id == call.context.span_id
+    assert {span.context.trace_id for span in exporter.get_finished_spans()} == {
+        call.context.trace_id
+    }
+
+    context = http_span.context
+    assert adapter.headers[0]["traceparent"] == (
+        f"00-{context.trace_id:032x}-{context.span_id:016x}-{context.trace_flags:02x}"
+    )
+
+
+@pytest.mark.asyncio
+async def test_failed_call_marks_span(exporter):
+    from opentelemetry.trace import StatusCode
+
+    async def failing():
+        return {"error": "backend unavailable"}
+
+    registry = ToolRegistry(
+        [
+            ToolSpec(
+                tool=types.Tool(name="failing", inputSchema={"type": "object"}),
+                handler=failing,
+            )
+        ]
+    )
+    await registry.call(registry.get("failing"), {})
+
+    call = spans_by_name(exporter)["tools/call failing"]
+    assert call.status.status_code == StatusCode.ERROR
+    assert call.status.description == "backend unavailable"
+
+
+def test_tracing_without_opentelemetry(monkeypatch):
+    """Test that spans are skipped when opentelemetry-api is not installed"""
+    monkeypatch.setattr(tracing, "trace", None)
+    disabled = Tracer()
+
+    assert not disabled.enabled
+    with disabled.span("ignored") as span:
+        assert span is None
+    tracing.record_error(span, "ignored")
+
+
+def test_setup_tracing_without_the_otel_extra(monkeypatch):
+    monkeypatch.setitem(sys.modules, "opentelemetry.sdk.trace", None)
+
+    assert setup_tracing("") is None
+    assert setup_tracing("otlp") is None
+
+
+def test_existing_tracer_provider_is_kept(provider_exporter):
+    from opentelemetry import trace
+
+    built = []
+    provider = trace.get_tracer_provider()
+
+    assert configure_tracing(lambda: built.append(1)) is provider
+    assert built == []
+
+
+def test_requests_are_only_instrumented_with_tracing():
+    """Test that pooled sessions leave requests alone while tracing is off"""
+    pytest.importorskip("opentelemetry.instrumentation.requests")
+    script = (
+        "from opentelemetry.instrumentation.requests import RequestsInstrumentor\n"
+        "from futureagi_mcp_server.clients import ClientRegistry\n"
+        "ClientRegistry().session()\n"
+        "print(RequestsInstrumentor().is_instrumented_by_opentelemetry)\n"
+    )
+    output = subprocess.run(
+        [sys.executable, "-c", script],
+        capture_output=True,
+        text=True,
+        check=True,
+        env={**os.environ, "FI_MCP_TRACE_EXPORTER": ""},
+    ).stdout
+
+    assert output.strip() == "False"
+
+
+def test_file_exporter(tmp_path, monkeypatch):
+    pytest.importorskip("opentelemetry.sdk")
+    from opentelemetry.sdk.trace import TracerProvider
+    from opentelemetry.sdk.trace.export import SimpleSpanProcessor
+
+    path = tmp_path / "traces" / "spans.jsonl"
+    monkeypatch.setattr(tracing, "TRACE_FILE", str(path))
+    file_exporter = create_exporter("file")
+    provider = TracerProvider()
+    provider.add_span_processor(SimpleSpanProcessor(file_exporter))
+    local_tracer = provider.get_tracer("test")
+
+    with local_tracer.start_as_current_span("parent"):
+        with pytest.raises(ValueError):
+            with local_tracer.start_as_current_span("child", attributes={"attempt": 1}):
+                raise ValueError("bad input")
+    provider.shutdown()
+
+    child, parent = [json.loads(line) for line in path.read_text().splitlines()]
+    assert child["parent_id"] == parent["context"]["span_id"]
+    assert child["status"]["status_code"] == "ERROR"
+    assert "bad input" in child["status"]["description"]
+    assert child["attributes"] == {"attempt": 1}
+
+
+def test_create_exporter():
+    assert create_exporter("") is None
+    pytest.importorskip("opentelemetry.sdk")
+    from opentelemetry.sdk.trace.export.in_memory_span_exporter import (
+        InMemorySpanExporter,
+    )
+
+    assert isinstance(create_exporter("memory"), InMemorySpanExporter)
+    assert isinstance(
+        create_exporter(
+            "opentelemetry.sdk.trace.export.in_memory_span_exporter:InMemorySpanExporter"
+        ),
+        InMemorySpanExporter,
+    )
+
+
+def test_process_tracer_uses_the_api():
+    assert tracer.enabled == (tracing.trace is not None)
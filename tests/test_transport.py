@@ -0,0 +1,168 @@
+import asyncio
+import time
+
+import httpx
+import mcp.types as types
+import pytest
+import pytest_asyncio
+import uvicorn
+from fi.evals.types import BatchRunResult, EvalResult
+from mcp.client.session import ClientSession
+from mcp.client.sse import sse_client
+from sse_starlette.sse import AppStatus
+
+from futureagi_mcp_server.clients import get_client_registry
+from futureagi_mcp_server.server import get_server, shutdown_server
+from futureagi_mcp_server.tools import evals
+from futureagi_mcp_server.transport import check_bind, create_sse_app, is_loopback
+
+CALL_DELAY = 0.3
+
+
+class SlowEvalClient:
+    def evaluate(self, eval_templates, inputs):
+        time.sleep(CALL_DELAY)
+        return BatchRunResult(
+            eval_results=[
+                EvalResult(data=[], failure=False, reason="", runtime=0, metrics=[])
+                for _ in inputs
+            ]
+        )
+
+
+class FakeRegistry:
+    client = SlowEvalClient()
+
+    def eval_client(self):
+        return self.client
+
+
+@pytest_asyncio.fixture
+async def sse_server(request, monkeypatch):
+    """Run the SSE app on a free local port and yield its base URL
+
+    Parametrize it indirectly with a token to require bearer authentication.
+    """
+    monkeypatch.setenv("FI_API_KEY", "test_api_key")
+    monkeypatch.setenv("FI_SECRET_KEY", "test_secret_key")
+    monkeypatch.setenv("FI_BASE_URL", "https://api.futureagi.test")
+    mcp_server = get_server(
+        api_key="test_api_key",
+        secret_key="test_secret_key",
+        base_url="https://api.futureagi.test",
+    )
+    monkeypatch.setattr(evals, "get_client_registry", FakeRegistry)
+    # sse-starlette keeps a process wide exit event bound to the first loop
+    AppStatus.should_exit_event = None
+    shutdowns = []
+    app = create_sse_app(
+        mcp_server,
+        on_shutdown=lambda: shutdowns.append(True),
+        auth_token=getattr(request, "param", None),
+    )
+    http_server = uvicorn.Server(
+        uvicorn.Config(app, host="127.0.0.1", port=0, log_config=None)
+    )
+    serve_task = asyncio.create_task(http_server.serve())
+    while not http_server.started:
+        await asyncio.sleep(0.01)
+    port = http_server.servers[0].sockets[0].getsockname()[1]
+
+    yield f"http://127.0.0.1:{port}"
+
+    http_server.should_exit = True
+    await serve_task
+    assert shutdowns == [True]
+    shutdown_server()
+
+
+async def call_evaluate(url: str) -> types.CallToolResult:
+    async with sse_client(f"{url}/sse") as (read_stream, write_stream):
+        async with ClientSession(read_stream, write_stream) as session:
+            await session.initialize()
+            return await session.call_tool(
+                "evaluate",
+                {
+                    "eval_templates": [{"eval_id": "1", "config": {}}],
+                    "inputs": [{"input": "hello"}],
+                },
+            )
+
+
+@pytest.mark.asyncio
+async def test_sessions_are_served_concurrently(sse_server):
+    """Test that one process serves several SSE clients at the same time"""
+    registry = get_client_registry()
+    start = time.perf_counter()
+    results = await asyncio.gather(*(call_evaluate(sse_server) for _ in range(3)))
+    elapsed = time.perf_counter() - start
+
+    assert all(not result.isError for result in results)
+    assert elapsed < 3 * CALL_DELAY
+    # Sessions share the process wide pooled clients
+    assert get_client_registry() is registry
+
+
+@pytest.mark.asyncio
+async def test_health_reports_active_sessions(sse_server):
+    """Test that /health counts the SSE sessions that are still open"""
+    async with sse_client(f"{sse_server}/sse") as (read_stream, write_stream):
+        async with ClientSession(read_stream, write_stream) as session:
+            await session.initialize()
+            async with httpx.AsyncClient() as http_client:
+                response = await http_client.get(f"{sse_server}/health")
+    assert response.json() == {"status": "ok", "active_sessions": 1}
+
+    # The session is closed once its client disconnects
+    await asyncio.sleep(0.1)
+    async with httpx.AsyncClient() as http_client:
+        response = await http_client.get(f"{sse_server}/health")
+    assert response.json() == {"status": "ok", "active_sessions": 0}
+
+
+@pytest.mark.asyncio
+async def test_metrics_endpoint(sse_server):
+    async with httpx.AsyncClient() as http_client:
+        response = await http_client.get(f"{sse_server}/metrics")
+
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/plain")
+    assert "# TYPE futureagi_mcp_tool_calls_total counter" in response.text
+
+
+def test_only_loopback_binds_run_without_a_token():
+    assert is_loopback("127.0.0.1") and is_loopback("::1")
+    assert is_loopback("localhost")
+    assert not is_loopback("0.0.0.0") and not is_loopback("example.com")
+
+    check_bind("127.0.0.1", None)
+    check_bind("0.0.0.0", "secret")
+    with pytest.raises(ValueError, match="FI_MCP_AUTH_TOKEN"):
+        check_bind("0.0.0.0", None)
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("sse_server", ["secret"], indirect=True)
+async def test_bearer_token_is_required(sse_server):
+    """Test that every endpoint but /health needs the bearer token"""
+    async with httpx.AsyncClient() as http_client:
+        health = await http_client.get(f"{sse_server}/health")
+        anonymous = await http_client.get(f"{sse_server}/metrics")
+        wrong = await http_client.post(
+            f"{sse_server}/messages/?session_id=0",
+            headers={"Authorization": "Bearer wrong"},
+        )
+        allowed = await http_client.get(
+            f"{sse_server}/metrics", headers={"Authorization": "Bearer secret"}
+        )
+    assert health.status_code == 200
+    assert (anonymous.status_code, wrong.status_code) == (401, 401)
+    assert anonymous.headers["www-authenticate"] == "Bearer"
+    assert allowed.status_code == 200
+
+    headers = {"Authorization": "Bearer secret"}
+    async with sse_client(f"{sse_server}/sse", headers=headers) as streams:
+        async with ClientSession(*streams) as session:
+            await session.initialize()
+            result = await session.list_tools()
+    assert result.tools
@@ -0,0 +1,117 @@
+import asyncio
+import time
+
+import pytest
+from mcp.shared.memory import create_connected_server_and_client_session
+
+from futureagi_mcp_server import catalog as catalog_module
+from futureagi_mcp_server.cache import catalog_cache
+from futureagi_mcp_server.server import get_server, shutdown_server
+from futureagi_mcp_server.tools import evals
+from futureagi_mcp_server.warmup import process_start_time, start_warmup, warm_up
+
+
+class FakeResponse:
+    status_code = 200
+
+    def json(self):
+        return {"status": True, "result": []}
+
+
+class SlowCatalogClient:
+    """API and eval client whose catalog requests take a while"""
+
+    def __init__(self, delay=0.0, fail=False):
+        self.delay = delay
+        self.fail = fail
+        self.calls = 0
+
+    def request(self, config):
+        time.sleep(self.delay)
+        self.calls += 1
+        return FakeResponse()
+
+    def _get_eval_info(self):
+        pass
+
+    _get_eval_info.cache_clear = lambda: None
+
+    def list_evaluations(self):
+        time.sleep(self.delay)
+        self.calls += 1
+        if self.fail:
+            raise RuntimeError("catalog unavailable")
+        return [{"eval_id": "1", "eval_tags": ["TEXT"]}]
+
+
+@pytest.fixture
+def server(monkeypatch):
+    monkeypatch.setenv("FI_API_KEY", "test_api_key")
+    monkeypatch.setenv("FI_SECRET_KEY", "test_secret_key")
+    monkeypatch.setenv("FI_BASE_URL", "https://api.futureagi.test")
+    catalog_cache.invalidate()
+    mcp_server = get_server(
+        api_key="test_api_key",
+        secret_key="test_secret_key",
+        base_url="https://api.futureagi.test",
+    )
+    yield mcp_server
+    shutdown_server()
+    catalog_cache.invalidate()
+
+
+def use_client(monkeypatch, client):
+    class FakeRegistry:
+        def api_client(self):
+            return client
+
+        def eval_client(self):
+            return client
+
+    monkeypatch.setattr(evals, "get_client_registry", FakeRegistry)
+    monkeypatch.setattr(catalog_module, "get_client_registry", FakeRegistry)
+
+
+@pytest.mark.asyncio
+async def test_warm_up_fills_catalog_cache(server, monkeypatch):
+    """Test that the first catalog requests after warm-up hit the cache"""
+    client = SlowCatalogClient()
+    use_client(monkeypatch, client)
+
+    summary = await warm_up()
+    assert summary["succeeded"] == 3
+    assert summary["failed"] == 0
+    assert client.calls == 3
+
+    await evals.all_evaluators()
+    await evals.get_evals_list_for_create_eval("preset")
+    assert client.calls == 3
+
+
+@pytest.mark.asyncio
+async def test_warm_up_reports_failures(server, monkeypatch):
+    use_client(monkeypatch, SlowCatalogClient(fail=True))
+
+    summary = await warm_up([("all_evaluators", {})])
+    assert summary == {"succeeded": 0, "failed": 1, "elapsed": summary["elapsed"]}
+
+
+@pytest.mark.asyncio
+async def test_warm_up_does_not_delay_initialize(server, monkeypatch):
+    """Test that a session initializes while the warm-up is still running"""
+    use_client(monkeypatch, SlowCatalogClient(delay=0.5))
+
+    task = start_warmup()
+    start = time.perf_counter()
+    async with create_connected_server_and_client_session(server) as client:
+        await client.list_tools()
+    elapsed = time.perf_counter() - start
+
+    assert not task.done()
+    assert elapsed < 0.5
+    await asyncio.wait_for(task, 5)
+
+
+def test_process_start_time():
+    started_at = process_start_time()
+    assert time.time() - 24 * 3600 < started_at <= time.time()
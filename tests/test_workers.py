@@ -0,0 +1,192 @@
+import asyncio
+import json
+import os
+import signal
+import socket
+import subprocess
+import sys
+
+import httpx
+import pytest
+import pytest_asyncio
+import uvicorn
+from mcp.client.session import ClientSession
+from mcp.client.sse import sse_client
+from sse_starlette.sse import AppStatus
+
+from futureagi_mcp_server.server import get_server, shutdown_server
+from futureagi_mcp_server.transport import create_sse_app
+from futureagi_mcp_server.workers import LoadReporter, read_worker_loads
+
+INITIALIZE_REQUEST = {
+    "jsonrpc": "2.0",
+    "id": 1,
+    "method": "initialize",
+    "params": {
+        "protocolVersion": "2024-11-05",
+        "capabilities": {},
+        "clientInfo": {"name": "test", "version": "0"},
+    },
+}
+
+
+@pytest_asyncio.fixture
+async def two_workers(monkeypatch, tmp_path):
+    """Run two workers sharing a state directory, each on its own port"""
+    monkeypatch.setenv("FI_API_KEY", "test_api_key")
+    monkeypatch.setenv("FI_SECRET_KEY", "test_secret_key")
+    monkeypatch.setenv("FI_BASE_URL", "https://api.futureagi.test")
+    AppStatus.should_exit_event = None
+    mcp_server = get_server(
+        api_key="test_api_key",
+        secret_key="test_secret_key",
+        base_url="https://api.futureagi.test",
+    )
+    http_servers = {}
+    tasks = []
+    for worker_id in ("a", "b"):
+        app = create_sse_app(mcp_server, worker_id=worker_id, state_dir=str(tmp_path))
+        http_server = uvicorn.Server(
+            uvicorn.Config(app, host="127.0.0.1", port=0, log_config=None)
+        )
+        tasks.append(asyncio.create_task(http_server.serve()))
+        http_servers[worker_id] = http_server
+    for http_server in http_servers.values():
+        while not http_server.started:
+            await asyncio.sleep(0.01)
+
+    yield {
+        worker_id: f"http://127.0.0.1:{http_server.servers[0].sockets[0].getsockname()[1]}"
+        for worker_id, http_server in http_servers.items()
+    }
+
+    for http_server in http_servers.values():
+        http_server.should_exit = True
+    await asyncio.gather(*tasks)
+    shutdown_server()
+
+
+async def next_event(lines):
+    """Read the next server sent event as (event, data)"""
+    event = data = None
+    async for line in lines:
+        if line.startswith("event:"):
+            event = line.split(":", 1)[1].strip()
+        elif line.startswith("data:"):
+            data = line.split(":", 1)[1].strip()
+        elif not line and event:
+            return event, data
+
+
+@pytest.mark.asyncio
+async def test_message_is_forwarded_to_owning_worker(two_workers):
+    """Test that a message accepted by another worker reaches the session"""
+    async with httpx.AsyncClient(timeout=5) as http_client:
+        async with http_client.stream("GET", f"{two_workers['a']}/sse") as stream:
+            lines = stream.aiter_lines()
+            event, endpoint = await next_event(lines)
+            assert event == "endpoint"
+            assert endpoint.startswith("/messages/a/?session_id=")
+
+            # Post to worker b, as the shared socket may do
+            response = await http_client.post(
+                f"{two_workers['b']}{endpoint}", json=INITIALIZE_REQUEST
+            )
+            assert response.status_code == 202
+
+            event, data = await next_event(lines)
+            assert event == "message"
+            assert json.loads(data)["id"] == 1
+
+        response = await http_client.post(
+            f"{two_workers['b']}/messages/missing/?session_id={'0' * 32}",
+            json=INITIALIZE_REQUEST,
+        )
+        assert response.status_code == 404
+
+
+@pytest.mark.asyncio
+async def test_workers_report_their_load(two_workers):
+    """Test that every worker can list the load of all workers"""
+    async with httpx.AsyncClient(timeout=5) as http_client:
+        response = await http_client.get(f"{two_workers['b']}/workers")
+
+    workers = response.json()["workers"]
+    assert [worker["worker_id"] for worker in workers] == ["a", "b"]
+    assert all(not worker["stale"] for worker in workers)
+    assert {"active_sessions", "in_flight_calls", "pid"} <= set(workers[0])
+
+
+def test_load_reports(tmp_path):
+    reporter = LoadReporter("w1", str(tmp_path), lambda: {"active_sessions": 3})
+    os.makedirs(os.path.dirname(reporter.path))
+    reporter.report()
+
+    (load,) = read_worker_loads(str(tmp_path))
+    assert load["worker_id"] == "w1"
+    assert load["active_sessions"] == 3
+    assert not load["stale"]
+    assert read_worker_loads(str(tmp_path), interval=-1)[0]["stale"]
+
+
+def free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+async def list_tools(url: str) -> int:
+    async with sse_client(f"{url}/sse") as (read_stream, write_stream):
+        async with ClientSession(read_stream, write_stream) as session:
+            await session.initialize()
+            for _ in range(3):
+                result = await session.list_tools()
+            return len(result.tools)
+
+
+@pytest.mark.asyncio
+async def test_multi_worker_server(tmp_path):
+    """Test sessions against several processes sharing one socket"""
+    port = free_port()
+    url = f"http://127.0.0.1:{port}"
+    env = {
+        **os.environ,
+        "FI_API_KEY": "test_api_key",
+        "FI_SECRET_KEY": "test_secret_key",
+        "FI_BASE_URL": "https://api.futureagi.test",
+        "FI_MCP_STATE_DIR": str(tmp_path),
+        "FI_MCP_LOAD_REPORT_INTERVAL": "0.2",
+    }
+    process = subprocess.Popen(
+        [
+            sys.executable,
+            "-c",
+            "from futureagi_mcp_server import main; main()",
+            "--transport=sse",
+            "--host=127.0.0.1",
+            f"--port={port}",
+            "--workers=2",
+        ],
+        env=env,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+    )
+    try:
+        async with httpx.AsyncClient(timeout=5) as http_client:
+            workers = []
+            for _ in range(200):
+                try:
+                    response = await http_client.get(f"{url}/workers")
+                    workers = response.json()["workers"]
+                except httpx.TransportError:
+                    pass
+                if len(workers) == 2:
+                    break
+                await asyncio.sleep(0.1)
+        assert len(workers) == 2
+
+        results = await asyncio.gather(*(list_tools(url) for _ in range(6)))
+        assert len(set(results)) == 1
+    finally:
+        process.send_signal(signal.SIGTERM)
+        assert process.wait(timeout=30) == 0